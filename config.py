@@ -1,5 +1,6 @@
 import os
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 
 class Config:
     """Configuration settings for the web scraping tool"""
@@ -8,18 +9,35 @@ class Config:
     DEFAULT_DELAY = 2  # seconds between requests
     MAX_RETRIES = 3
     REQUEST_TIMEOUT = 30
+    MAX_CONCURRENCY = 8  # parallel workers for multi-URL scraping
+    ASYNC_MAX_CONCURRENCY = 50  # in-flight requests for the asyncio scraping path
+    CONNECTION_POOL_SIZE = 32  # keep-alive connections per HTTP session
+    RESPONSE_CACHE_SIZE = 256  # pages kept in the in-process response cache
+    RESPONSE_CACHE_TTL = 3600  # seconds
+    SEARCH_CACHE_SIZE = 256  # search result pages kept in memory
+    SEARCH_CACHE_TTL = 6 * 3600  # seconds
+    SEARCH_CACHE_DIR = os.getenv('SEARCH_CACHE_DIR')  # set to also persist search results on disk
+    SEARCH_CONNECT_TIMEOUT = 5  # seconds, search result pages
+    SEARCH_READ_TIMEOUT = 10  # seconds, search result pages
+    SEARCH_MAX_PAGE_BYTES = 1_000_000  # result pages are cut off after this many (decoded) bytes
+    GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')  # enables the single-request GraphQL org search
+    ENABLE_PRODUCTHUNT = False  # Product Hunt search has no extractor yet; skip the request
+    XLSX_STREAMING = os.getenv('XLSX_STREAMING') == '1'  # write-only openpyxl workbooks, no sheet formatting
     
     # Selenium settings
     SELENIUM_TIMEOUT = 10
     HEADLESS_MODE = True
     
     # User agents for rotation
-    USER_AGENTS = [
+    USER_AGENTS = (
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
         'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0'
-    ]
+    )
+    
+    # Region assumed for phone numbers written without a country code
+    PHONE_DEFAULT_REGION = 'US'
     
     # Search engines configuration
     SEARCH_ENGINES = {
@@ -29,7 +47,7 @@ class Config:
     }
     
     # Common selectors for different data types
-    SELECTORS = {
+    SELECTORS = MappingProxyType({
         'title': ['title', 'h1', '.title', '#title'],
         'email': ['a[href^="mailto:"]', '.email', '.contact-email'],
         'phone': ['.phone', '.contact-phone', 'a[href^="tel:"]'],
@@ -42,10 +60,10 @@ class Config:
         },
         'description': ['meta[name="description"]', '.description', '.about', '.company-info'],
         'contact_page': ['a[href*="contact"]', 'a[href*="about"]', 'a[href*="team"]']
-    }
+    })
     
     # Technology stack patterns
-    TECH_PATTERNS = {
+    TECH_PATTERNS = MappingProxyType({
         'javascript': ['react', 'angular', 'vue', 'node.js', 'javascript', 'js'],
         'python': ['django', 'flask', 'python', 'fastapi', 'pyramid'],
         'java': ['spring', 'hibernate', 'java', 'jsp', 'struts'],
@@ -55,7 +73,7 @@ class Config:
         'databases': ['mysql', 'postgresql', 'mongodb', 'redis', 'sqlite'],
         'cloud': ['aws', 'azure', 'gcp', 'digital ocean', 'heroku'],
         'analytics': ['google analytics', 'mixpanel', 'amplitude', 'hotjar']
-    }
+    })
     
     # Output formats
     OUTPUT_FORMATS = ['json', 'csv', 'xlsx']
@@ -67,9 +85,18 @@ class Config:
         'tech_stack', 'competitors', 'projects', 'contact_info'
     ]
     
+    _headers_cached = None
+    
+    @classmethod
+    def get_headers(cls) -> Mapping[str, str]:
+        """Get default headers for requests (built once, read-only)"""
+        if cls._headers_cached is None:
+            cls._headers_cached = MappingProxyType(cls._build_headers())
+        return cls._headers_cached
+    
     @classmethod
-    def get_headers(cls) -> Dict[str, str]:
-        """Get default headers for requests"""
+    def _build_headers(cls) -> Dict[str, str]:
+        """Default request headers"""
         return {
             'User-Agent': cls.USER_AGENTS[0],
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -91,4 +118,13 @@ class Config:
         options.add_argument('--disable-gpu')
         options.add_argument('--window-size=1920,1080')
         options.add_argument(f'--user-agent={cls.USER_AGENTS[0]}')
+        # Only page_source is read, so skip images, stylesheets and fonts
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+        })
+        # Return from driver.get() once the DOM is parsed rather than fully loaded
+        options.page_load_strategy = 'eager'
         return options 
\ No newline at end of file
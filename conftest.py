@@ -0,0 +1,65 @@
+"""
+Shared pytest configuration for the Web Scraping Tool tests
+"""
+
+import logging
+
+import pytest
+
+from scraper import WebScraper
+
+
+def pytest_addoption(parser):
+    """Command line options for the test suite"""
+    parser.addoption("--run-selenium", action="store_true", help="also run tests marked selenium")
+
+
+def pytest_configure(config):
+    """Register the suite's markers"""
+    config.addinivalue_line("markers", "selenium: needs Selenium/Chrome; skipped unless --run-selenium")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Group TestCase classes for xdist and skip Selenium tests unless requested"""
+    skip_selenium = pytest.mark.skip(reason="selenium not requested (use --run-selenium)")
+    run_selenium = config.getoption("--run-selenium")
+    for item in items:
+        # Keep each TestCase class on one xdist worker (used with --dist=loadgroup)
+        if item.cls is not None:
+            item.add_marker(pytest.mark.xdist_group(name=item.cls.__name__))
+        if not run_selenium and "selenium" in item.keywords:
+            item.add_marker(skip_selenium)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _silence_logs():
+    """Drop log records before they are built, let alone formatted or written"""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    # main.py's basicConfig has already attached console and scraper.log handlers at import
+    root.handlers[:] = [logging.NullHandler()]
+    root.setLevel(logging.CRITICAL + 1)
+    for name in ("urllib3", "requests", "selenium"):
+        logging.getLogger(name).disabled = True
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+@pytest.fixture(scope="session")
+def web_scraper():
+    """One requests-only WebScraper per worker process"""
+    scraper = WebScraper(use_selenium=False)
+    yield scraper
+    scraper.close()
+
+
+@pytest.fixture(scope="class", autouse=True)
+def _shared_scraper(request):
+    """Hand the per-worker scraper to TestCase classes that declare a `scraper` attribute"""
+    if request.cls is None or not hasattr(request.cls, "scraper"):
+        yield
+        return
+    request.cls.scraper = request.getfixturevalue("web_scraper")
+    yield
+    request.cls.scraper = None
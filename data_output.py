@@ -2,10 +2,13 @@ import json
 import csv
 import pandas as pd
 import os
+from contextlib import nullcontext
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, IO
 import logging
 
+from config import Config
+
 logger = logging.getLogger(__name__)
 
 class DataOutput:
@@ -24,8 +27,9 @@ class DataOutput:
     def save_data(self, data: List[Dict[str, Any]], 
                   filename: str = None, 
                   format_type: str = "json",
-                  include_timestamp: bool = True) -> str:
-        """Save data in specified format"""
+                  include_timestamp: bool = True,
+                  file: Optional[IO] = None) -> str:
+        """Save data in specified format; an open file object passed as `file` is written instead of output_dir"""
         
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S") if include_timestamp else ""
@@ -35,20 +39,26 @@ class DataOutput:
         base_filename = os.path.splitext(filename)[0]
         
         if format_type.lower() == "json":
-            return self._save_json(data, base_filename)
+            return self._save_json(data, base_filename, file)
         elif format_type.lower() == "csv":
-            return self._save_csv(data, base_filename)
+            return self._save_csv(data, base_filename, file)
         elif format_type.lower() in ["xlsx", "excel"]:
-            return self._save_excel(data, base_filename)
+            return self._save_excel(data, base_filename, file)
         else:
             raise ValueError(f"Unsupported format: {format_type}")
     
-    def _save_json(self, data: List[Dict[str, Any]], filename: str) -> str:
+    def _output_path(self, filename: str, extension: str, file: Optional[IO] = None) -> str:
+        """Where the output goes: a file in output_dir, or the name of a caller-supplied stream"""
+        if file is not None:
+            return getattr(file, 'name', '<stream>')
+        return os.path.join(self.output_dir, f"{filename}.{extension}")
+    
+    def _save_json(self, data: List[Dict[str, Any]], filename: str, file: Optional[IO] = None) -> str:
         """Save data as JSON"""
-        filepath = os.path.join(self.output_dir, f"{filename}.json")
+        filepath = self._output_path(filename, "json", file)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'w', encoding='utf-8') if file is None else nullcontext(file) as f:
                 json.dump(data, f, indent=2, ensure_ascii=False, default=str)
             
             logger.info(f"Data saved to JSON: {filepath}")
@@ -58,9 +68,9 @@ class DataOutput:
             logger.error(f"Error saving JSON: {e}")
             raise
     
-    def _save_csv(self, data: List[Dict[str, Any]], filename: str) -> str:
+    def _save_csv(self, data: List[Dict[str, Any]], filename: str, file: Optional[IO] = None) -> str:
         """Save data as CSV"""
-        filepath = os.path.join(self.output_dir, f"{filename}.csv")
+        filepath = self._output_path(filename, "csv", file)
         
         if not data:
             logger.warning("No data to save")
@@ -77,7 +87,7 @@ class DataOutput:
             
             fieldnames = sorted(list(fieldnames))
             
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            with open(filepath, 'w', newline='', encoding='utf-8') if file is None else nullcontext(file) as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
                 
@@ -91,9 +101,9 @@ class DataOutput:
             logger.error(f"Error saving CSV: {e}")
             raise
     
-    def _save_excel(self, data: List[Dict[str, Any]], filename: str) -> str:
-        """Save data as Excel file"""
-        filepath = os.path.join(self.output_dir, f"{filename}.xlsx")
+    def _save_excel(self, data: List[Dict[str, Any]], filename: str, file: Optional[IO] = None) -> str:
+        """Save data as Excel file (`file` must be a binary stream)"""
+        filepath = self._output_path(filename, "xlsx", file)
         
         if not data:
             logger.warning("No data to save")
@@ -103,11 +113,17 @@ class DataOutput:
             # Flatten data for Excel
             flattened_data = [self._flatten_record(record) for record in data]
             
+            if Config.XLSX_STREAMING:
+                self._write_excel_streaming(flattened_data, self._generate_summary(data),
+                                            filepath if file is None else file)
+                logger.info(f"Data saved to Excel: {filepath}")
+                return filepath
+            
             # Create DataFrame
             df = pd.DataFrame(flattened_data)
             
             # Create Excel writer with multiple sheets
-            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+            with pd.ExcelWriter(filepath if file is None else file, engine='openpyxl') as writer:
                 # Main data sheet
                 df.to_excel(writer, sheet_name='Company Data', index=False)
                 
@@ -126,6 +142,21 @@ class DataOutput:
             logger.error(f"Error saving Excel: {e}")
             raise
     
+    def _write_excel_streaming(self, flattened_data: List[Dict[str, Any]],
+                               summary_data: List[Dict[str, Any]], target) -> None:
+        """Write both sheets row by row with openpyxl's write-only workbook (no formatting)"""
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        for title, rows in (('Company Data', flattened_data), ('Summary', summary_data)):
+            sheet = workbook.create_sheet(title)
+            # Same column order pandas would use: first appearance across the records
+            columns = list(dict.fromkeys(key for row in rows for key in row))
+            sheet.append(columns)
+            for row in rows:
+                sheet.append([row.get(column) for column in columns])
+        workbook.save(target)
+    
     def _flatten_record(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """Flatten nested dictionaries and lists for CSV/Excel export"""
         flattened = {}
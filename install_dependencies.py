@@ -47,6 +47,9 @@ def install_dependencies():
         "selenium==4.15.2",
         "pandas==2.1.3",
         "lxml==4.9.3",
+        "cssselect==1.2.0",
+        "selectolax==0.3.17",
+        "pyahocorasick==2.0.0",
         "fake-useragent==1.4.0",
         "python-dotenv==1.0.0",
         "click==8.1.7",
@@ -55,6 +58,7 @@ def install_dependencies():
         "nltk==3.8.1",
         "textblob==0.17.1",
         "validators==0.22.0",
+        "phonenumbers==8.13.26",
         "python-dateutil==2.8.2",
         "openpyxl==3.1.2"
     ]
@@ -74,8 +78,15 @@ def install_dependencies():
         "asyncio==3.4.3",
         "requests-oauthlib==1.3.1",
         "PySocks==1.7.1",
+        "orjson==3.9.10",
+        "diskcache==5.6.3",
+        "Brotli==1.1.0",
+        "aiodns==3.1.1",
         "Flask==3.0.0",
         "Flask-SocketIO==5.3.6",
+        "simple-websocket==1.0.0",
+        "Flask-Compress==1.14",
+        "uvloop==0.19.0",
         "gunicorn==21.2.0",
         "APScheduler==3.10.4",
         "SQLAlchemy==2.0.23",
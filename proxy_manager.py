@@ -5,21 +5,30 @@ Supports multiple proxy providers and rotation strategies
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import random
 import time
 import logging
 from typing import List, Dict, Optional, Any, Tuple
-import json
+import orjson
 import os
 from urllib.parse import urlparse
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import threading
-from collections import deque
+from collections import deque, Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import itertools
+import heapq
 
 logger = logging.getLogger(__name__)
 
+# Headers for proxy health checks, built once instead of per test_proxy call
+_UA_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+
+_USAGE_KEYS = ('total_requests', 'successful_requests', 'failed_requests', 'proxy_failures')
+
 class ProxyType(Enum):
     HTTP = "http"
     HTTPS = "https"
@@ -40,6 +49,9 @@ class ProxyInfo:
     last_used: Optional[float] = None
     response_time: Optional[float] = None
     is_working: bool = True
+    consecutive_failures: int = 0  # failures since the last success
+    last_failure: Optional[float] = None
+    _proxies_dict: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def success_rate(self) -> float:
@@ -57,12 +69,14 @@ class ProxyInfo:
         return f"{self.proxy_type.value}://{self.host}:{self.port}"
 
     def to_dict(self) -> Dict[str, str]:
-        """Convert to requests-compatible proxy dict"""
-        proxy_url = self.proxy_url
-        return {
-            'http': proxy_url,
-            'https': proxy_url
-        }
+        """Convert to requests-compatible proxy dict (built once and cached)"""
+        if self._proxies_dict is None:
+            proxy_url = self.proxy_url
+            self._proxies_dict = {
+                'http': proxy_url,
+                'https': proxy_url
+            }
+        return self._proxies_dict
 
 class ProxyRotationStrategy(Enum):
     ROUND_ROBIN = "round_robin"
@@ -74,24 +88,158 @@ class ProxyManager:
     """Advanced proxy management with rotation and health monitoring"""
     
     def __init__(self, rotation_strategy: ProxyRotationStrategy = ProxyRotationStrategy.ROUND_ROBIN):
-        self.proxies: List[ProxyInfo] = []
-        self.rotation_strategy = rotation_strategy
-        self.current_index = 0
+        # Working/dead deques are the source of truth and are only mutated under
+        # self.lock; readers use the immutable _working_snapshot without locking
+        self._working: deque = deque()
+        self._dead: deque = deque()
+        self._working_snapshot: Tuple[ProxyInfo, ...] = ()
+        self._rr_counter = itertools.count()
+        # BEST_PERFORMANCE min-heap of (-success_rate, response_time, seq, proxy);
+        # entries whose seq no longer matches _heap_versions[id(proxy)] are stale
+        self._best_heap: List[Tuple[float, float, int, ProxyInfo]] = []
+        self._heap_versions: Dict[int, int] = {}
+        self._heap_seq = itertools.count()
         self.lock = threading.Lock()
+        self.rotation_strategy = rotation_strategy
         self.test_timeout = 10
+        self.min_test_timeout = 2.0
         self.max_failures = 3
+        # Proxies with max_failures failures in a row skip health checks for this long
+        self.dead_retest_interval = 300
+        # Fraction of make_request successes written to proxy counters
+        self.stats_sample_rate = 0.1
+        self.max_retries = 3
+        
+        # Server-error retries with exponential backoff + jitter; connection and
+        # proxy errors are not retried here so make_request can rotate proxies
+        self._session = requests.Session()
+        adapter = HTTPAdapter(max_retries=Retry(
+            total=self.max_retries,
+            connect=0,
+            read=0,
+            backoff_factor=0.25,
+            backoff_jitter=0.1,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False
+        ))
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
         
         # Load proxies from various sources
         self._load_free_proxies()
         self._load_user_proxies()
+        with self.lock:
+            self._publish_working()
         
-        # Performance tracking
-        self.usage_stats = {
-            'total_requests': 0,
-            'successful_requests': 0,
-            'failed_requests': 0,
-            'proxy_failures': 0
-        }
+        # Performance tracking: each thread increments its own counter and
+        # usage_stats sums them on read, so make_request never contends
+        self._tls = threading.local()
+        self._thread_counters: List[Counter] = []
+    
+    @property
+    def usage_stats(self) -> Dict[str, int]:
+        """Request counters aggregated across all worker threads"""
+        totals = dict.fromkeys(_USAGE_KEYS, 0)
+        with self.lock:
+            counters = list(self._thread_counters)
+        for counter in counters:
+            for key in _USAGE_KEYS:
+                totals[key] += counter[key]
+        return totals
+    
+    def _usage_counter(self) -> Counter:
+        """This thread's usage counter, registered on first use"""
+        counter = getattr(self._tls, 'counter', None)
+        if counter is None:
+            # Pre-seeded so increments never resize the dict while it's being summed
+            counter = Counter(dict.fromkeys(_USAGE_KEYS, 0))
+            self._tls.counter = counter
+            with self.lock:
+                self._thread_counters.append(counter)
+        return counter
+    
+    @property
+    def proxies(self) -> List[ProxyInfo]:
+        """All known proxies, working ones first"""
+        return list(self._working) + list(self._dead)
+    
+    @proxies.setter
+    def proxies(self, proxies: List[ProxyInfo]):
+        with self.lock:
+            self._working = deque(p for p in proxies if p.is_working)
+            self._dead = deque(p for p in proxies if not p.is_working)
+            self._publish_working()
+    
+    def _publish_working(self):
+        """Rebuild the read-only working snapshot (caller must hold self.lock)"""
+        self._working_snapshot = tuple(self._working)
+        if self._rotation_strategy == ProxyRotationStrategy.BEST_PERFORMANCE:
+            self._rebuild_best_heap()
+    
+    def _rebuild_best_heap(self):
+        """Rebuild the best-performance heap from the working pool (caller must hold self.lock)"""
+        self._heap_versions = {}
+        self._best_heap = []
+        for proxy in self._working:
+            seq = next(self._heap_seq)
+            self._heap_versions[id(proxy)] = seq
+            self._best_heap.append((-proxy.success_rate, proxy.response_time or 0, seq, proxy))
+        heapq.heapify(self._best_heap)
+    
+    def _push_best_heap(self, proxy: ProxyInfo):
+        """Re-key a working proxy after its score changed, invalidating older entries"""
+        if self._rotation_strategy != ProxyRotationStrategy.BEST_PERFORMANCE:
+            return
+        with self.lock:
+            if id(proxy) not in self._heap_versions:
+                return
+            seq = next(self._heap_seq)
+            self._heap_versions[id(proxy)] = seq
+            heapq.heappush(self._best_heap, (-proxy.success_rate, proxy.response_time or 0, seq, proxy))
+            # Compact once stale entries dominate
+            if len(self._best_heap) > 4 * len(self._heap_versions) + 64:
+                self._rebuild_best_heap()
+    
+    def _record_success(self, proxy: ProxyInfo):
+        """Count a success and move the proxy back to the working pool if needed"""
+        proxy.success_count += 1
+        proxy.consecutive_failures = 0
+        if not proxy.is_working:
+            proxy.is_working = True
+            with self.lock:
+                try:
+                    self._dead.remove(proxy)
+                except ValueError:
+                    pass
+                self._working.append(proxy)
+                self._publish_working()
+        else:
+            self._push_best_heap(proxy)
+    
+    def _record_sampled_success(self, proxy: ProxyInfo):
+        """Record a success with probability p, weighted 1/p so success_rate stays unbiased"""
+        if random.random() < self.stats_sample_rate:
+            proxy.success_count += round(1 / self.stats_sample_rate)
+            proxy.consecutive_failures = 0
+            self._push_best_heap(proxy)
+    
+    def _record_failure(self, proxy: ProxyInfo) -> bool:
+        """Count a failure; returns True if the proxy was just marked non-working"""
+        proxy.failure_count += 1
+        proxy.consecutive_failures += 1
+        proxy.last_failure = time.time()
+        if proxy.is_working and proxy.failure_count >= self.max_failures:
+            proxy.is_working = False
+            with self.lock:
+                try:
+                    self._working.remove(proxy)
+                except ValueError:
+                    pass
+                self._dead.append(proxy)
+                self._publish_working()
+            return True
+        self._push_best_heap(proxy)
+        return False
     
     def _load_free_proxies(self):
         """Load free proxies from public sources"""
@@ -103,13 +251,17 @@ class ProxyManager:
                 self._get_gimmeproxy_proxies
             ]
             
-            for source in free_proxy_sources:
-                try:
-                    proxies = source()
-                    self.proxies.extend(proxies)
-                    logger.info(f"Loaded {len(proxies)} proxies from {source.__name__}")
-                except Exception as e:
-                    logger.warning(f"Failed to load proxies from {source.__name__}: {e}")
+            # Sources are independent, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=len(free_proxy_sources)) as executor:
+                futures = {executor.submit(source): source for source in free_proxy_sources}
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        proxies = future.result()
+                        self._working.extend(proxies)
+                        logger.info(f"Loaded {len(proxies)} proxies from {source.__name__}")
+                    except Exception as e:
+                        logger.warning(f"Failed to load proxies from {source.__name__}: {e}")
                     
         except Exception as e:
             logger.error(f"Error loading free proxies: {e}")
@@ -119,8 +271,8 @@ class ProxyManager:
         try:
             proxy_file = 'proxy_list.json'
             if os.path.exists(proxy_file):
-                with open(proxy_file, 'r') as f:
-                    proxy_configs = json.load(f)
+                with open(proxy_file, 'rb') as f:
+                    proxy_configs = orjson.loads(f.read())
                 
                 for config in proxy_configs:
                     proxy = ProxyInfo(
@@ -131,32 +283,43 @@ class ProxyManager:
                         password=config.get('password'),
                         country=config.get('country')
                     )
-                    self.proxies.append(proxy)
+                    self._working.append(proxy)
                 
                 logger.info(f"Loaded {len(proxy_configs)} user-configured proxies")
         except Exception as e:
             logger.warning(f"Error loading user proxies: {e}")
     
+    def _parse_proxy_lines(self, response: requests.Response, limit: int) -> List[ProxyInfo]:
+        """Parse up to `limit` host:port lines from a streamed response"""
+        proxies = []
+        for line in response.iter_lines(decode_unicode=True):
+            if len(proxies) >= limit:
+                break
+            if not line or ':' not in line:
+                continue
+            host, _, port = line.partition(':')
+            try:
+                proxies.append(ProxyInfo(
+                    host=host.strip(),
+                    port=int(port.strip()),
+                    proxy_type=ProxyType.HTTP
+                ))
+            except ValueError:
+                continue
+        return proxies
+    
     def _get_proxy_list_free_proxies(self) -> List[ProxyInfo]:
         """Get proxies from proxy-list.download"""
         proxies = []
         try:
-            # HTTP proxies
-            response = requests.get(
+            # HTTP proxies; stream so we stop reading after the first 20 lines
+            with requests.get(
                 'https://www.proxy-list.download/api/v1/get?type=http',
-                timeout=10
-            )
-            if response.status_code == 200:
-                proxy_lines = response.text.strip().split('\n')
-                for line in proxy_lines[:20]:  # Limit to 20 proxies
-                    if ':' in line:
-                        host, port = line.split(':')
-                        proxy = ProxyInfo(
-                            host=host.strip(),
-                            port=int(port.strip()),
-                            proxy_type=ProxyType.HTTP
-                        )
-                        proxies.append(proxy)
+                timeout=10,
+                stream=True
+            ) as response:
+                if response.status_code == 200:
+                    proxies = self._parse_proxy_lines(response, 20)  # Limit to 20 proxies
         except Exception as e:
             logger.warning(f"Error fetching from proxy-list.download: {e}")
         
@@ -166,25 +329,13 @@ class ProxyManager:
         """Get proxies from free-proxy-list.net"""
         proxies = []
         try:
-            # Use requests to get proxy list
-            response = requests.get(
+            with requests.get(
                 'https://raw.githubusercontent.com/clarketm/proxy-list/master/proxy-list-raw.txt',
-                timeout=10
-            )
-            if response.status_code == 200:
-                proxy_lines = response.text.strip().split('\n')
-                for line in proxy_lines[:15]:  # Limit to 15 proxies
-                    if ':' in line:
-                        try:
-                            host, port = line.split(':')
-                            proxy = ProxyInfo(
-                                host=host.strip(),
-                                port=int(port.strip()),
-                                proxy_type=ProxyType.HTTP
-                            )
-                            proxies.append(proxy)
-                        except ValueError:
-                            continue
+                timeout=10,
+                stream=True
+            ) as response:
+                if response.status_code == 200:
+                    proxies = self._parse_proxy_lines(response, 15)  # Limit to 15 proxies
         except Exception as e:
             logger.warning(f"Error fetching from free-proxy-list.net: {e}")
         
@@ -193,22 +344,33 @@ class ProxyManager:
     def _get_gimmeproxy_proxies(self) -> List[ProxyInfo]:
         """Get proxies from gimmeproxy.com"""
         proxies = []
-        try:
-            for _ in range(5):  # Get 5 proxies
-                response = requests.get(
-                    'https://gimmeproxy.com/api/getProxy?format=json&protocol=http',
-                    timeout=10
+        
+        def fetch_one(_):
+            response = requests.get(
+                'https://gimmeproxy.com/api/getProxy?format=json&protocol=http',
+                timeout=10
+            )
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                return ProxyInfo(
+                    host=data['ip'],
+                    port=int(data['port']),
+                    proxy_type=ProxyType.HTTP,
+                    country=data.get('country')
                 )
-                if response.status_code == 200:
-                    data = response.json()
-                    proxy = ProxyInfo(
-                        host=data['ip'],
-                        port=int(data['port']),
-                        proxy_type=ProxyType.HTTP,
-                        country=data.get('country')
-                    )
-                    proxies.append(proxy)
-                time.sleep(1)  # Rate limiting
+            return None
+        
+        try:
+            # Get 5 proxies in parallel instead of 5 paced sequential calls
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = [executor.submit(fetch_one, i) for i in range(5)]
+                for future in as_completed(futures):
+                    try:
+                        proxy = future.result()
+                        if proxy:
+                            proxies.append(proxy)
+                    except Exception as e:
+                        logger.debug(f"gimmeproxy.com request failed: {e}")
         except Exception as e:
             logger.warning(f"Error fetching from gimmeproxy.com: {e}")
         
@@ -227,20 +389,31 @@ class ProxyManager:
         )
         
         with self.lock:
-            self.proxies.append(proxy)
+            self._working.append(proxy)
+            self._publish_working()
         
         logger.info(f"Added proxy: {host}:{port}")
     
     def test_proxy(self, proxy: ProxyInfo, test_url: str = "http://httpbin.org/ip") -> bool:
         """Test if a proxy is working"""
+        # Failed max_failures times in a row just now; don't spend a request on it
+        # until dead_retest_interval has passed, so a dead proxy can still come back
+        if (proxy.consecutive_failures >= self.max_failures
+                and time.time() - proxy.last_failure < self.dead_retest_interval):
+            return False
+        
+        # Adaptive timeout: ~3x the last observed response time, floored at
+        # min_test_timeout and capped at test_timeout
+        timeout = min(self.test_timeout, max(self.min_test_timeout, (proxy.response_time or 1.0) * 3))
+        
         try:
             start_time = time.time()
             
             response = requests.get(
                 test_url,
                 proxies=proxy.to_dict(),
-                timeout=self.test_timeout,
-                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+                timeout=timeout,
+                headers=_UA_HEADERS
             )
             
             end_time = time.time()
@@ -248,8 +421,7 @@ class ProxyManager:
             
             if response.status_code == 200:
                 proxy.response_time = response_time
-                proxy.success_count += 1
-                proxy.is_working = True
+                self._record_success(proxy)
                 proxy.last_used = time.time()
                 
                 # Verify IP is different
@@ -262,31 +434,28 @@ class ProxyManager:
                 
                 return True
             else:
-                proxy.failure_count += 1
+                self._record_failure(proxy)
                 return False
                 
         except Exception as e:
-            proxy.failure_count += 1
             logger.debug(f"Proxy test failed for {proxy.host}:{proxy.port}: {e}")
-            
-            if proxy.failure_count >= self.max_failures:
-                proxy.is_working = False
-            
+            self._record_failure(proxy)
             return False
     
     def test_all_proxies(self) -> Dict[str, Any]:
         """Test all proxies and return results"""
+        proxies = self.proxies
         results = {
-            'total_proxies': len(self.proxies),
+            'total_proxies': len(proxies),
             'working_proxies': 0,
             'failed_proxies': 0,
             'test_results': []
         }
         
-        logger.info(f"Testing {len(self.proxies)} proxies...")
+        logger.info(f"Testing {len(proxies)} proxies...")
         
-        for i, proxy in enumerate(self.proxies):
-            logger.info(f"Testing proxy {i+1}/{len(self.proxies)}: {proxy.host}:{proxy.port}")
+        for i, proxy in enumerate(proxies):
+            logger.info(f"Testing proxy {i+1}/{len(proxies)}: {proxy.host}:{proxy.port}")
             
             is_working = self.test_proxy(proxy)
             
@@ -306,55 +475,81 @@ class ProxyManager:
                 results['failed_proxies'] += 1
         
         # Remove non-working proxies
-        working_proxies = [p for p in self.proxies if p.is_working]
-        self.proxies = working_proxies
+        with self.lock:
+            self._working = deque(p for p in self._working if p.is_working)
+            self._dead.clear()
+            self._publish_working()
         
         logger.info(f"Proxy testing complete: {results['working_proxies']} working, {results['failed_proxies']} failed")
         
         return results
     
+    @property
+    def rotation_strategy(self) -> ProxyRotationStrategy:
+        return self._rotation_strategy
+    
+    @rotation_strategy.setter
+    def rotation_strategy(self, strategy: ProxyRotationStrategy):
+        # Bind the picker once so get_next_proxy doesn't re-dispatch per call
+        with self.lock:
+            self._rotation_strategy = strategy
+            if strategy == ProxyRotationStrategy.BEST_PERFORMANCE:
+                self._rebuild_best_heap()
+        self._pick = {
+            ProxyRotationStrategy.ROUND_ROBIN: self._pick_round_robin,
+            ProxyRotationStrategy.RANDOM: self._pick_random,
+            ProxyRotationStrategy.BEST_PERFORMANCE: self._pick_best,
+            ProxyRotationStrategy.WEIGHTED_RANDOM: self._pick_weighted,
+        }.get(strategy, self._pick_first)
+    
+    def _pick_round_robin(self, working_proxies: Tuple[ProxyInfo, ...]) -> ProxyInfo:
+        return working_proxies[next(self._rr_counter) % len(working_proxies)]
+    
+    def _pick_random(self, working_proxies: Tuple[ProxyInfo, ...]) -> ProxyInfo:
+        return random.choice(working_proxies)
+    
+    def _pick_best(self, working_proxies: Tuple[ProxyInfo, ...]) -> ProxyInfo:
+        # Highest success rate, then lowest response time; discard stale heap tops
+        with self.lock:
+            heap = self._best_heap
+            while heap:
+                proxy, seq = heap[0][3], heap[0][2]
+                if self._heap_versions.get(id(proxy)) == seq:
+                    return proxy
+                heapq.heappop(heap)
+        return max(
+            working_proxies,
+            key=lambda p: (p.success_rate, -p.response_time if p.response_time else 0)
+        )
+    
+    def _pick_weighted(self, working_proxies: Tuple[ProxyInfo, ...]) -> ProxyInfo:
+        # Weight by success rate
+        weights = [p.success_rate for p in working_proxies]
+        return random.choices(working_proxies, weights=weights)[0]
+    
+    def _pick_first(self, working_proxies: Tuple[ProxyInfo, ...]) -> ProxyInfo:
+        return working_proxies[0]
+    
     def get_next_proxy(self) -> Optional[ProxyInfo]:
         """Get next proxy based on rotation strategy"""
-        with self.lock:
-            working_proxies = [p for p in self.proxies if p.is_working]
-            
-            if not working_proxies:
-                logger.warning("No working proxies available")
-                return None
-            
-            if self.rotation_strategy == ProxyRotationStrategy.ROUND_ROBIN:
-                proxy = working_proxies[self.current_index % len(working_proxies)]
-                self.current_index = (self.current_index + 1) % len(working_proxies)
-                
-            elif self.rotation_strategy == ProxyRotationStrategy.RANDOM:
-                proxy = random.choice(working_proxies)
-                
-            elif self.rotation_strategy == ProxyRotationStrategy.BEST_PERFORMANCE:
-                # Sort by success rate and response time
-                sorted_proxies = sorted(
-                    working_proxies,
-                    key=lambda p: (p.success_rate, -p.response_time if p.response_time else 0),
-                    reverse=True
-                )
-                proxy = sorted_proxies[0]
-                
-            elif self.rotation_strategy == ProxyRotationStrategy.WEIGHTED_RANDOM:
-                # Weight by success rate
-                weights = [p.success_rate for p in working_proxies]
-                proxy = random.choices(working_proxies, weights=weights)[0]
-                
-            else:
-                proxy = working_proxies[0]
-            
-            proxy.last_used = time.time()
-            return proxy
+        # Lock-free: the snapshot tuple is replaced wholesale, never mutated
+        working_proxies = self._working_snapshot
+        
+        if not working_proxies:
+            logger.warning("No working proxies available")
+            return None
+        
+        proxy = self._pick(working_proxies)
+        proxy.last_used = time.time()
+        return proxy
     
     def make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[requests.Response]:
-        """Make a request using proxy rotation"""
-        max_retries = 3
-        retry_count = 0
+        """Make a request using proxy rotation (a failed attempt moves on to the next proxy)"""
+        # Caller-supplied proxies win; otherwise use the rotated proxy
+        caller_proxies = kwargs.pop('proxies', None)
+        kwargs.setdefault('timeout', 30)
         
-        while retry_count < max_retries:
+        for _ in range(self.max_retries):
             proxy = self.get_next_proxy()
             
             if not proxy:
@@ -362,87 +557,82 @@ class ProxyManager:
                 return None
             
             try:
-                # Add proxy to kwargs
-                if 'proxies' not in kwargs:
-                    kwargs['proxies'] = proxy.to_dict()
-                
-                # Set default timeout
-                if 'timeout' not in kwargs:
-                    kwargs['timeout'] = 30
-                
-                # Make request
-                response = requests.request(method, url, **kwargs)
+                response = self._session.request(
+                    method, url, proxies=caller_proxies or proxy.to_dict(), **kwargs
+                )
                 
-                # Update proxy stats
-                proxy.success_count += 1
-                self.usage_stats['total_requests'] += 1
-                self.usage_stats['successful_requests'] += 1
+                # Update proxy stats (sampled; failures are always counted
+                # since they drive the max_failures cutoff)
+                self._record_sampled_success(proxy)
+                usage = self._usage_counter()
+                usage['total_requests'] += 1
+                usage['successful_requests'] += 1
                 
                 return response
                 
             except Exception as e:
                 logger.warning(f"Request failed with proxy {proxy.host}:{proxy.port}: {e}")
                 
-                # Update proxy stats
-                proxy.failure_count += 1
-                self.usage_stats['total_requests'] += 1
-                self.usage_stats['failed_requests'] += 1
-                self.usage_stats['proxy_failures'] += 1
+                usage = self._usage_counter()
+                usage['total_requests'] += 1
+                usage['failed_requests'] += 1
+                usage['proxy_failures'] += 1
                 
                 # Mark proxy as non-working if too many failures
-                if proxy.failure_count >= self.max_failures:
-                    proxy.is_working = False
+                if self._record_failure(proxy):
                     logger.info(f"Marking proxy {proxy.host}:{proxy.port} as non-working")
-                
-                retry_count += 1
-                
-                if retry_count < max_retries:
-                    time.sleep(1)  # Brief delay before retry
         
-        logger.error(f"Failed to make request to {url} after {max_retries} retries")
+        logger.error(f"Failed to make request to {url} after {self.max_retries} attempts")
         return None
     
     def get_proxy_stats(self) -> Dict[str, Any]:
         """Get comprehensive proxy statistics"""
-        working_proxies = [p for p in self.proxies if p.is_working]
+        working_proxies = self._working_snapshot
         
         stats = {
-            'total_proxies': len(self.proxies),
+            'total_proxies': len(working_proxies) + len(self._dead),
             'working_proxies': len(working_proxies),
-            'failed_proxies': len(self.proxies) - len(working_proxies),
+            'failed_proxies': len(self._dead),
             'rotation_strategy': self.rotation_strategy.value,
-            'usage_stats': self.usage_stats.copy()
+            'usage_stats': self.usage_stats
         }
         
         if working_proxies:
-            response_times = [p.response_time for p in working_proxies if p.response_time]
-            if response_times:
-                stats['avg_response_time'] = sum(response_times) / len(response_times)
-                stats['min_response_time'] = min(response_times)
-                stats['max_response_time'] = max(response_times)
-            
-            success_rates = [p.success_rate for p in working_proxies]
-            stats['avg_success_rate'] = sum(success_rates) / len(success_rates)
-            
-            # Country distribution
-            countries = {}
+            # Single pass over the working pool for all aggregates
+            rt_sum = 0.0
+            rt_count = 0
+            rt_min = float('inf')
+            rt_max = 0.0
+            success_sum = 0.0
+            countries = Counter()
+            types = Counter()
             for proxy in working_proxies:
-                country = proxy.country or 'Unknown'
-                countries[country] = countries.get(country, 0) + 1
-            stats['country_distribution'] = countries
+                rt = proxy.response_time
+                if rt:
+                    rt_sum += rt
+                    rt_count += 1
+                    if rt < rt_min:
+                        rt_min = rt
+                    if rt > rt_max:
+                        rt_max = rt
+                success_sum += proxy.success_rate
+                countries[proxy.country or 'Unknown'] += 1
+                types[proxy.proxy_type.value] += 1
             
-            # Proxy type distribution
-            types = {}
-            for proxy in working_proxies:
-                proxy_type = proxy.proxy_type.value
-                types[proxy_type] = types.get(proxy_type, 0) + 1
-            stats['type_distribution'] = types
+            if rt_count:
+                stats['avg_response_time'] = rt_sum / rt_count
+                stats['min_response_time'] = rt_min
+                stats['max_response_time'] = rt_max
+            
+            stats['avg_success_rate'] = success_sum / len(working_proxies)
+            stats['country_distribution'] = dict(countries)
+            stats['type_distribution'] = dict(types)
         
         return stats
     
     def save_working_proxies(self, filename: str = 'working_proxies.json'):
         """Save working proxies to file"""
-        working_proxies = [p for p in self.proxies if p.is_working]
+        working_proxies = self._working_snapshot
         
         proxy_data = []
         for proxy in working_proxies:
@@ -458,16 +648,16 @@ class ProxyManager:
             }
             proxy_data.append(data)
         
-        with open(filename, 'w') as f:
-            json.dump(proxy_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(proxy_data, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Saved {len(proxy_data)} working proxies to {filename}")
     
     def load_working_proxies(self, filename: str = 'working_proxies.json'):
         """Load working proxies from file"""
         try:
-            with open(filename, 'r') as f:
-                proxy_data = json.load(f)
+            with open(filename, 'rb') as f:
+                proxy_data = orjson.loads(f.read())
             
             loaded_proxies = []
             for data in proxy_data:
@@ -479,11 +669,8 @@ class ProxyManager:
                     password=data.get('password'),
                     country=data.get('country')
                 )
-                # Restore stats
-                if 'success_rate' in data and data['success_rate'] > 0:
-                    proxy.success_count = 10  # Approximate
-                    proxy.failure_count = int(10 * (1 - data['success_rate']))
-                
+                # Failure counts start fresh: deriving them from success_rate would
+                # push loaded proxies towards max_failures before they are ever used
                 if 'response_time' in data:
                     proxy.response_time = data['response_time']
                 
@@ -497,27 +684,26 @@ class ProxyManager:
     
     def cleanup_failed_proxies(self):
         """Remove failed proxies from the list"""
-        before_count = len(self.proxies)
-        self.proxies = [p for p in self.proxies if p.is_working]
-        after_count = len(self.proxies)
+        with self.lock:
+            removed = len(self._dead)
+            self._dead.clear()
         
-        removed = before_count - after_count
         if removed > 0:
             logger.info(f"Removed {removed} failed proxies")
     
     def reset_proxy_stats(self):
         """Reset proxy statistics"""
-        for proxy in self.proxies:
-            proxy.success_count = 0
-            proxy.failure_count = 0
-            proxy.is_working = True
-        
-        self.usage_stats = {
-            'total_requests': 0,
-            'successful_requests': 0,
-            'failed_requests': 0,
-            'proxy_failures': 0
-        }
+        with self.lock:
+            self._working.extend(self._dead)
+            self._dead.clear()
+            for proxy in self._working:
+                proxy.success_count = 0
+                proxy.failure_count = 0
+                proxy.is_working = True
+            self._publish_working()
+            for counter in self._thread_counters:
+                for key in _USAGE_KEYS:
+                    counter[key] = 0
         
         logger.info("Reset all proxy statistics")
 
@@ -542,8 +728,8 @@ def create_sample_proxy_config():
         }
     ]
     
-    with open('proxy_list_sample.json', 'w') as f:
-        json.dump(sample_proxies, f, indent=2)
+    with open('proxy_list_sample.json', 'wb') as f:
+        f.write(orjson.dumps(sample_proxies, option=orjson.OPT_INDENT_2))
     
     print("Created sample proxy configuration: proxy_list_sample.json")
 
@@ -2,7 +2,13 @@ import re
 import time
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,11 +16,17 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 from urllib.parse import urljoin, urlparse
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
 import random
+import asyncio
+import threading
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from fake_useragent import UserAgent
+import ahocorasick
 import validators
+import phonenumbers
 
 from config import Config
 
@@ -22,6 +34,103 @@ from config import Config
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Regex patterns, compiled once at import
+MAILTO_RE = re.compile(r'^mailto:')
+TEL_RE = re.compile(r'^tel:')
+# Length-bounded parts keep long runs of word characters (base64, minified JS) from going quadratic
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,24}\b')
+# Cheap structural check run before the (much slower) validators.email
+EMAIL_VALIDATE = re.compile(r'^[^@\s]+@[^@\s]+\.[A-Za-z]{2,}$')
+# "Emails" that are really asset names like logo@2x.png
+IMG_EXT = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp')
+# Anchored on word boundaries, with street/city names capped at 40 chars to bound backtracking
+ADDRESS_RES = [
+    re.compile(r'\b\d{1,6}\s+[A-Za-z\s]{1,40}(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Place|Pl)\b', re.IGNORECASE),
+    re.compile(r'\b\d{1,6}\s+[A-Za-z\s]{1,40},\s*[A-Za-z\s]{1,40},\s*[A-Za-z]{2}\s+\d{5}\b', re.IGNORECASE),
+]
+# Patterns like "Founded in 2020", "Since 1995", etc., fused into one scan
+YEAR_RE = re.compile(
+    r'(?:(?P<keyword>founded\s+in|since|established\s+in|copyright)\s+|(?P<symbol>©)\s*)(?P<year>\d{4})',
+    re.IGNORECASE
+)
+# Lower rank wins when a page has several of these
+YEAR_KEYWORD_RANKS = {'founded': 0, 'since': 1, 'established': 2, '©': 3, 'copyright': 4}
+COMPETITOR_RES = [
+    re.compile(r'competitor[s]?[:\s]+([^.]+)', re.IGNORECASE),
+    re.compile(r'vs\.?\s+([A-Z][a-z]+)', re.IGNORECASE),
+    re.compile(r'alternative to\s+([A-Z][a-z]+)', re.IGNORECASE),
+]
+# Literals every pattern in the group needs; a cheap `in` check skips the regex passes
+COMPETITOR_LITERALS = ('competitor', 'vs', 'alternative to')
+SIZE_LITERALS = ('employees', 'team', 'people')
+SIZE_RES = [
+    re.compile(r'(\d+)\s*(?:to|[-–])\s*(\d+)\s*employees'),
+    re.compile(r'(\d+)\+?\s*employees'),
+    re.compile(r'team\s+of\s+(\d+)'),
+    re.compile(r'(\d+)\s*people'),
+]
+FUNDING_RES = [
+    re.compile(r'raised\s+\$([0-9,]+\s*(?:million|m|billion|b|thousand|k))', re.IGNORECASE),
+    re.compile(r'funding\s+of\s+\$([0-9,]+\s*(?:million|m|billion|b|thousand|k))', re.IGNORECASE),
+    re.compile(r'series\s+[a-z]\s+\$([0-9,]+\s*(?:million|m|billion|b|thousand|k))', re.IGNORECASE),
+]
+
+# The keyword that appears earliest in the page text names the industry
+INDUSTRY_KEYWORDS = [
+    'technology', 'software', 'healthcare', 'finance', 'education',
+    'retail', 'manufacturing', 'consulting', 'marketing', 'design',
+    'development', 'services', 'solutions', 'platform', 'cloud',
+    'ai', 'machine learning', 'blockchain', 'fintech', 'saas'
+]
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over every tech and industry keyword; a hit yields (category, rank) pairs"""
+    entries = defaultdict(list)
+    for category, technologies in Config.TECH_PATTERNS.items():
+        for rank, tech in enumerate(technologies):
+            entries[tech.lower()].append((category, rank))
+    for rank, keyword in enumerate(INDUSTRY_KEYWORDS):
+        entries[keyword].append(('industry', rank))
+    
+    automaton = ahocorasick.Automaton()
+    for word, hits in entries.items():
+        automaton.add_word(word, tuple(hits))
+    automaton.make_automaton()
+    return automaton
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# CSS selectors compiled to XPath once; extractors run them on the page's lxml tree
+SOCIAL_XPATHS = {platform: CSSSelector(sel) for platform, sel in Config.SELECTORS['social'].items()}
+CONTACT_PAGE_XPATHS = [CSSSelector(sel) for sel in Config.SELECTORS['contact_page']]
+SERVICE_XPATHS = [CSSSelector(sel) for sel in ('ul li', 'ol li', '.service', '.product', '.offering')]
+PROJECT_XPATHS = [CSSSelector(sel) for sel in ('.project', '.case-study', '.portfolio', '.news', '.blog-post')]
+NEWS_XPATHS = [CSSSelector(sel) for sel in ('.news', '.press', '.media', '.article', '.blog')]
+HEADING_XPATH = etree.XPath('(.//h1 | .//h2 | .//h3 | .//h4)[1]')
+# Extractors still working on the soup use Soup Sieve patterns compiled once
+ADDRESS_SELECTORS = [soupsieve.compile(sel) for sel in Config.SELECTORS['address']]
+DESCRIPTION_SELECTORS = [(sel.startswith('meta'), soupsieve.compile(sel)) for sel in Config.SELECTORS['description']]
+
+def _build_tree(content) -> lxml.html.HtmlElement:
+    """Parse markup into an lxml tree (empty document if there is nothing to parse)"""
+    if isinstance(content, str):
+        # Already decoded; don't let a <meta charset> re-decode it
+        content = content.encode('utf-8')
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+    else:
+        parser = None
+    try:
+        tree = lxml.html.document_fromstring(content, parser=parser)
+    except (etree.ParserError, ValueError):
+        return lxml.html.document_fromstring('<html></html>')
+    # Nothing reads code out of the tree; dropping it keeps text_content() to visible text
+    etree.strip_elements(tree, 'script', 'style', 'template', with_tail=False)
+    return tree
+
+def _node_text(element) -> str:
+    """Stripped text of an lxml element, same as BeautifulSoup's get_text(strip=True)"""
+    return ''.join(t.strip() for t in element.itertext())
+
 class WebScraper:
     """Main web scraping class with multi-level data extraction"""
     
@@ -30,8 +139,27 @@ class WebScraper:
         self.delay = delay or Config.DEFAULT_DELAY
         self.session = requests.Session()
         self.session.headers.update(Config.get_headers())
+        # Keep-alive pool per host plus backoff retries for throttled/flaky responses
+        adapter = HTTPAdapter(
+            pool_connections=Config.CONNECTION_POOL_SIZE,
+            pool_maxsize=Config.CONNECTION_POOL_SIZE,
+            max_retries=Retry(
+                total=Config.MAX_RETRIES,
+                backoff_factor=0.3,
+                status_forcelist=(429, 502, 503, 504),
+                raise_on_status=False
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.ua = UserAgent()
         self.driver = None
+        # WebDriver is not thread-safe; concurrent scrapes take turns on it
+        self._driver_lock = threading.Lock()
+        self._host_locks = defaultdict(threading.Lock)
+        # URL -> (stored_at, body or None), LRU-ordered
+        self._response_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         if use_selenium:
             self._setup_selenium()
@@ -49,15 +177,13 @@ class WebScraper:
             logger.error(f"Failed to initialize Selenium: {e}")
             self.use_selenium = False
     
-    def _rotate_user_agent(self):
-        """Rotate user agent to avoid detection"""
+    def _random_user_agent(self) -> str:
+        """Pick a user agent for one request (the shared session headers stay untouched)"""
         try:
-            new_agent = self.ua.random
-            self.session.headers.update({'User-Agent': new_agent})
-            if self.driver:
-                self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": new_agent})
+            return self.ua.random
         except Exception as e:
             logger.warning(f"Failed to rotate user agent: {e}")
+            return self.session.headers['User-Agent']
     
     def _get_page_content(self, url: str, use_selenium: bool = False) -> Optional[BeautifulSoup]:
         """Get page content using requests or Selenium"""
@@ -70,14 +196,47 @@ class WebScraper:
             logger.error(f"Error getting page content for {url}: {e}")
             return None
     
+    def _cache_lookup(self, url: str) -> Tuple[bool, Optional[bytes]]:
+        """Return (hit, content) from the response cache; content is None for cached failures"""
+        with self._cache_lock:
+            entry = self._response_cache.get(url)
+            if entry is None:
+                return False, None
+            stored_at, content = entry
+            if time.monotonic() - stored_at > Config.RESPONSE_CACHE_TTL:
+                del self._response_cache[url]
+                return False, None
+            self._response_cache.move_to_end(url)
+            return True, content
+    
+    def _cache_store(self, url: str, content: Optional[bytes]):
+        """Store a response body (or None for an HTTP error), evicting the oldest entry"""
+        with self._cache_lock:
+            self._response_cache[url] = (time.monotonic(), content)
+            self._response_cache.move_to_end(url)
+            if len(self._response_cache) > Config.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
     def _get_requests_content(self, url: str) -> Optional[BeautifulSoup]:
-        """Get page content using requests"""
+        """Get page content using requests (cached per URL, including 4xx/5xx failures)"""
+        hit, content = self._cache_lookup(url)
+        if hit:
+            return self._parse_page(content) if content is not None else None
+        
         try:
-            self._rotate_user_agent()
-            response = self.session.get(url, timeout=Config.REQUEST_TIMEOUT)
+            response = self.session.get(url, headers={'User-Agent': self._random_user_agent()},
+                                        timeout=Config.REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            return BeautifulSoup(response.content, 'html.parser')
+            self._cache_store(url, response.content)
+            return self._parse_page(response.content)
+        except requests.HTTPError as e:
+            # Dead pages stay dead for the cache TTL; throttling and server errors are retried next call
+            status = e.response.status_code
+            if 400 <= status < 500 and status not in (408, 429):
+                self._cache_store(url, None)
+            logger.error(f"Requests error for {url}: {e}")
+            return None
         except Exception as e:
             logger.error(f"Requests error for {url}: {e}")
             return None
@@ -85,91 +244,136 @@ class WebScraper:
     def _get_selenium_content(self, url: str) -> Optional[BeautifulSoup]:
         """Get page content using Selenium"""
         try:
-            self.driver.get(url)
-            WebDriverWait(self.driver, Config.SELENIUM_TIMEOUT).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            
-            # Wait for potential JavaScript content
-            time.sleep(2)
+            with self._driver_lock:
+                # Overridden under the lock so it applies to this page load only
+                try:
+                    self.driver.execute_cdp_cmd('Network.setUserAgentOverride',
+                                                {"userAgent": self._random_user_agent()})
+                except WebDriverException as e:
+                    logger.warning(f"Failed to rotate user agent: {e}")
+                self.driver.get(url)
+                wait = WebDriverWait(self.driver, Config.SELENIUM_TIMEOUT)
+                wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                
+                # Wait until the DOM is parsed; page_load_strategy is 'eager', so don't
+                # hold out for images and subresources
+                wait.until(lambda d: d.execute_script('return document.readyState') in ('interactive', 'complete'))
+                
+                page_source = self.driver.page_source
             
-            return BeautifulSoup(self.driver.page_source, 'html.parser')
+            return self._parse_page(page_source)
         except (TimeoutException, WebDriverException) as e:
             logger.error(f"Selenium error for {url}: {e}")
             return None
     
+    def _parse_page(self, content) -> BeautifulSoup:
+        """Parse a page, keeping an lxml tree next to the soup for the XPath extractors"""
+        soup = BeautifulSoup(content, 'lxml')
+        soup.lxml_tree = _build_tree(content)
+        return soup
+    
+    def _lxml_tree(self, soup: BeautifulSoup) -> lxml.html.HtmlElement:
+        """lxml tree for a soup; soups built elsewhere are re-parsed from their markup once"""
+        # Read __dict__ directly: BeautifulSoup's __getattr__ would treat the name as a tag lookup
+        tree = soup.__dict__.get('lxml_tree')
+        if tree is None:
+            tree = soup.lxml_tree = _build_tree(str(soup))
+        return tree
+    
+    def _keyword_hits(self, text_lower: str) -> Dict[str, set]:
+        """Ranks of the keywords found in the text, per category, from one automaton pass"""
+        found = defaultdict(set)
+        for _, hits in KEYWORD_AUTOMATON.iter(text_lower):
+            for category, rank in hits:
+                found[category].add(rank)
+        return found
+    
+    def _page_text(self, soup: BeautifulSoup) -> str:
+        """Visible page text; computed once per soup and shared across extractors"""
+        return soup.get_text(' ', strip=True)
+    
+    def _bulk_text(self, soup: BeautifulSoup) -> str:
+        """Page text straight from the lxml tree, whitespace collapsed, for keyword/pattern scans"""
+        # text_content() runs in C; unlike get_text() it doesn't separate adjacent nodes,
+        # so email/phone/address matching stays on _page_text
+        return ' '.join(self._lxml_tree(soup).text_content().split())
+    
     def extract_basic_data(self, url: str) -> Dict[str, Any]:
         """Level 1 - Basic Data Extraction"""
         logger.info(f"Extracting basic data from {url}")
-        
-        soup = self._get_page_content(url)
+        return self._fetch_and_extract(url, "basic")
+    
+    def extract_medium_data(self, url: str) -> Dict[str, Any]:
+        """Level 2 - Medium Data Extraction with Enhanced Details"""
+        logger.info(f"Extracting medium data from {url}")
+        return self._fetch_and_extract(url, "medium")
+    
+    def extract_advanced_data(self, url: str) -> Dict[str, Any]:
+        """Level 3 - Advanced Data Extraction with Comprehensive Insights"""
+        logger.info(f"Extracting advanced data from {url}")
+        return self._fetch_and_extract(url, "advanced")
+    
+    def _fetch_and_extract(self, url: str, level: str) -> Dict[str, Any]:
+        """Fetch the page once, at the fidelity the level needs, and extract every level up to it"""
+        soup = None
+        if level == "advanced" and self.driver:
+            soup = self._get_page_content(url, use_selenium=True)  # Use Selenium for advanced
+        if not soup:
+            soup = self._get_page_content(url)
         if not soup:
             return {"error": "Failed to fetch page content"}
         
+        time.sleep(self.delay)
+        return self._extract_from_soup(soup, url, level)
+    
+    def _extract_from_soup(self, soup: BeautifulSoup, url: str, level: str) -> Dict[str, Any]:
+        """Build the record bottom-up (basic, then medium, then advanced) from one parsed page"""
+        text = self._page_text(soup)
         data = {
             "url": url,
             "company_name": self._extract_company_name(soup, url),
             "website_url": url,
-            "email": self._extract_emails(soup),
-            "phone": self._extract_phones(soup),
+            "email": self._extract_emails(soup, text),
+            "phone": self._extract_phones(soup, text),
             "extraction_level": "basic"
         }
-        
-        time.sleep(self.delay)
-        return data
-    
-    def extract_medium_data(self, url: str) -> Dict[str, Any]:
-        """Level 2 - Medium Data Extraction with Enhanced Details"""
-        logger.info(f"Extracting medium data from {url}")
-        
-        # Get basic data first
-        data = self.extract_basic_data(url)
-        if "error" in data:
+        if level == "basic":
             return data
         
-        soup = self._get_page_content(url)
-        if not soup:
-            return data
+        bulk_text = self._bulk_text(soup)
+        text_lower = bulk_text.lower()
         
         # Enhanced contact information
         data.update({
             "social_media": self._extract_social_media(soup),
-            "address": self._extract_address(soup),
+            "address": self._extract_address(soup, text),
             "description": self._extract_description(soup),
-            "year_founded": self._extract_founded_year(soup),
-            "industry": self._extract_industry(soup),
+            "year_founded": self._extract_founded_year(soup, bulk_text),
+            "industry": self._extract_industry(soup, text_lower),
             "services": self._extract_services(soup),
             "extraction_level": "medium"
         })
         
-        # Try to get additional info from contact/about pages
-        contact_urls = self._find_contact_pages(soup, url)
-        for contact_url in contact_urls[:2]:  # Limit to 2 additional pages
-            self._extract_contact_page_info(contact_url, data)
-        
-        return data
-    
-    def extract_advanced_data(self, url: str) -> Dict[str, Any]:
-        """Level 3 - Advanced Data Extraction with Comprehensive Insights"""
-        logger.info(f"Extracting advanced data from {url}")
-        
-        # Get medium data first
-        data = self.extract_medium_data(url)
-        if "error" in data:
-            return data
+        # Try to get additional info from contact/about pages, fetched side by side
+        contact_urls = self._find_contact_pages(soup, url)[:2]  # Limit to 2 additional pages
+        if contact_urls:
+            with ThreadPoolExecutor(max_workers=len(contact_urls)) as executor:
+                contact_soups = list(executor.map(self._get_page_content, contact_urls))
+            for contact_url, contact_soup in zip(contact_urls, contact_soups):
+                self._extract_contact_page_info(contact_url, contact_soup, data)
+            time.sleep(self.delay)
         
-        soup = self._get_page_content(url, use_selenium=True)  # Use Selenium for advanced
-        if not soup:
+        if level == "medium":
             return data
         
         # Advanced insights
         data.update({
-            "tech_stack": self._extract_tech_stack(soup),
+            "tech_stack": self._extract_tech_stack(soup, text_lower),
             "current_projects": self._extract_current_projects(soup),
-            "competitors": self._extract_competitors(soup),
-            "market_position": self._extract_market_position(soup),
-            "company_size": self._extract_company_size(soup),
-            "funding_info": self._extract_funding_info(soup),
+            "competitors": self._extract_competitors(soup, text_lower),
+            "market_position": self._extract_market_position(soup, text_lower),
+            "company_size": self._extract_company_size(soup, text_lower),
+            "funding_info": self._extract_funding_info(soup, text_lower),
             "news_mentions": self._extract_news_mentions(soup),
             "extraction_level": "advanced"
         })
@@ -178,118 +382,108 @@ class WebScraper:
     
     def _extract_company_name(self, soup: BeautifulSoup, url: str) -> str:
         """Extract company name from various sources"""
-        # Try different approaches
-        approaches = [
-            lambda: soup.find('title').text.split('|')[0].strip() if soup.find('title') else '',
-            lambda: soup.find('h1').text.strip() if soup.find('h1') else '',
-            lambda: soup.find('meta', {'property': 'og:site_name'})['content'] if soup.find('meta', {'property': 'og:site_name'}) else '',
-            lambda: soup.find('meta', {'name': 'application-name'})['content'] if soup.find('meta', {'name': 'application-name'}) else '',
-            lambda: urlparse(url).netloc.replace('www.', '').split('.')[0].capitalize()
-        ]
-        
-        for approach in approaches:
-            try:
-                name = approach()
-                if name and len(name) > 0:
-                    return name
-            except:
-                continue
-        
-        return urlparse(url).netloc.replace('www.', '')
-    
-    def _extract_emails(self, soup: BeautifulSoup) -> List[str]:
+        # One lookup per source, first non-empty wins
+        title = soup.find('title')
+        if title and title.text:
+            name = title.text.split('|')[0].strip()
+            if name:
+                return name
+        
+        h1 = soup.find('h1')
+        if h1 and h1.text:
+            name = h1.text.strip()
+            if name:
+                return name
+        
+        for attrs in ({'property': 'og:site_name'}, {'name': 'application-name'}):
+            meta = soup.find('meta', attrs=attrs)
+            if meta and meta.get('content'):
+                return meta['content']
+        
+        domain = urlparse(url).netloc.replace('www.', '')
+        return domain.split('.')[0].capitalize() or domain
+    
+    def _extract_emails(self, soup: BeautifulSoup, text: Optional[str] = None) -> List[str]:
         """Extract email addresses"""
         emails = set()
         
         # Look for mailto links
-        for link in soup.find_all('a', href=re.compile(r'^mailto:')):
+        for link in soup.find_all('a', href=MAILTO_RE):
             email = link['href'].replace('mailto:', '').split('?')[0]
-            if validators.email(email):
+            if email not in emails and EMAIL_VALIDATE.match(email) and validators.email(email):
                 emails.add(email)
         
-        # Look for email patterns in text
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        text_content = soup.get_text()
-        found_emails = re.findall(email_pattern, text_content)
+        # Look for email patterns in text (no '@' means no regex pass needed)
+        text_content = text if text is not None else self._page_text(soup)
+        found_emails = set(EMAIL_RE.findall(text_content)) if '@' in text_content else set()
         
-        for email in found_emails:
-            if validators.email(email) and not email.endswith('.png') and not email.endswith('.jpg'):
+        for email in found_emails - emails:
+            if (not email.lower().endswith(IMG_EXT) and EMAIL_VALIDATE.match(email)
+                    and validators.email(email)):
                 emails.add(email)
         
         return list(emails)
     
-    def _extract_phones(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_phones(self, soup: BeautifulSoup, text: Optional[str] = None) -> List[str]:
         """Extract phone numbers"""
         phones = set()
         
         # Look for tel links
-        for link in soup.find_all('a', href=re.compile(r'^tel:')):
+        for link in soup.find_all('a', href=TEL_RE):
             phone = link['href'].replace('tel:', '').strip()
-            phones.add(phone)
-        
-        # Look for phone patterns in text
-        phone_patterns = [
-            r'\+?1?[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
-            r'\+?[\d\s\-\(\)]{10,}',  # International format
-        ]
-        
-        text_content = soup.get_text()
-        for pattern in phone_patterns:
-            found_phones = re.findall(pattern, text_content)
-            for phone in found_phones:
-                clean_phone = re.sub(r'[^\d\+]', '', phone)
-                if len(clean_phone) >= 10:
-                    phones.add(phone.strip())
+            phones.add(self._normalize_phone(phone))
+        
+        # Look for phone numbers in text; libphonenumber validates and skips zip codes, IDs, etc.
+        text_content = text if text is not None else self._page_text(soup)
+        for match in phonenumbers.PhoneNumberMatcher(text_content, Config.PHONE_DEFAULT_REGION):
+            phones.add(phonenumbers.format_number(match.number, phonenumbers.PhoneNumberFormat.E164))
         
         return list(phones)
     
+    def _normalize_phone(self, phone: str) -> str:
+        """E.164 form of a phone number, or the input unchanged if it doesn't parse"""
+        try:
+            number = phonenumbers.parse(phone, Config.PHONE_DEFAULT_REGION)
+        except phonenumbers.NumberParseException:
+            return phone
+        if not phonenumbers.is_possible_number(number):
+            return phone
+        return phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.E164)
+    
     def _extract_social_media(self, soup: BeautifulSoup) -> Dict[str, str]:
         """Extract social media links"""
         social_media = {}
+        tree = self._lxml_tree(soup)
         
-        for platform, selector in Config.SELECTORS['social'].items():
-            links = soup.select(selector)
+        for platform, xpath in SOCIAL_XPATHS.items():
+            links = xpath(tree)
             if links:
-                social_media[platform] = links[0]['href']
+                social_media[platform] = links[0].get('href')
         
         return social_media
     
-    def _extract_address(self, soup: BeautifulSoup) -> str:
+    def _extract_address(self, soup: BeautifulSoup, text: Optional[str] = None) -> str:
         """Extract physical address"""
-        selectors = Config.SELECTORS['address']
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            if elements:
-                return elements[0].get_text(strip=True)
+        for selector in ADDRESS_SELECTORS:
+            element = selector.select_one(soup)
+            if element:
+                return element.get_text(strip=True)
         
         # Look for address patterns in text
-        address_patterns = [
-            r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Place|Pl)',
-            r'\d+\s+[A-Za-z\s]+,\s*[A-Za-z\s]+,\s*[A-Za-z]{2}\s+\d{5}'
-        ]
-        
-        text_content = soup.get_text()
-        for pattern in address_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            if matches:
-                return matches[0]
+        text_content = text if text is not None else self._page_text(soup)
+        for pattern in ADDRESS_RES:
+            match = pattern.search(text_content)
+            if match:
+                return match.group(0)
         
         return ""
     
     def _extract_description(self, soup: BeautifulSoup) -> str:
         """Extract company description"""
-        selectors = Config.SELECTORS['description']
-        
-        for selector in selectors:
-            if selector.startswith('meta'):
-                element = soup.select_one(selector)
-                if element:
-                    return element.get('content', '')
-            else:
-                elements = soup.select(selector)
-                if elements:
-                    return elements[0].get_text(strip=True)
+        for is_meta, selector in DESCRIPTION_SELECTORS:
+            element = selector.select_one(soup)
+            if element:
+                return element.get('content', '') if is_meta else element.get_text(strip=True)
         
         # Fallback to first paragraph
         paragraphs = soup.find_all('p')
@@ -301,90 +495,74 @@ class WebScraper:
         
         return ""
     
-    def _extract_founded_year(self, soup: BeautifulSoup) -> Optional[int]:
+    def _extract_founded_year(self, soup: BeautifulSoup, text: Optional[str] = None) -> Optional[int]:
         """Extract founding year"""
-        text_content = soup.get_text()
-        
-        # Look for patterns like "Founded in 2020", "Since 1995", etc.
-        year_patterns = [
-            r'founded\s+in\s+(\d{4})',
-            r'since\s+(\d{4})',
-            r'established\s+in\s+(\d{4})',
-            r'©\s*(\d{4})',
-            r'copyright\s+(\d{4})'
-        ]
-        
-        for pattern in year_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            if matches:
-                try:
-                    year = int(matches[0])
-                    if 1900 <= year <= 2024:
-                        return year
-                except ValueError:
-                    continue
+        text_content = text if text is not None else self._bulk_text(soup)
+        
+        # First year per keyword; a plausible "founded in" year can't be outranked, so stop there
+        years = {}
+        for match in YEAR_RE.finditer(text_content):
+            keyword = match.group('symbol') or match.group('keyword').split()[0].lower()
+            rank = YEAR_KEYWORD_RANKS[keyword]
+            year = years.setdefault(rank, int(match.group('year')))
+            if rank == 0 and 1900 <= year <= 2100:
+                break
+        
+        for rank in sorted(years):
+            if 1900 <= years[rank] <= 2100:
+                return years[rank]
         
         return None
     
-    def _extract_industry(self, soup: BeautifulSoup) -> str:
+    def _extract_industry(self, soup: BeautifulSoup, text_lower: Optional[str] = None) -> str:
         """Extract industry/sector information"""
-        # Look for industry keywords
-        industry_keywords = [
-            'technology', 'software', 'healthcare', 'finance', 'education',
-            'retail', 'manufacturing', 'consulting', 'marketing', 'design',
-            'development', 'services', 'solutions', 'platform', 'cloud',
-            'ai', 'machine learning', 'blockchain', 'fintech', 'saas'
-        ]
+        text_content = text_lower if text_lower is not None else self._bulk_text(soup).lower()
         
-        text_content = soup.get_text().lower()
-        
-        for keyword in industry_keywords:
-            if keyword in text_content:
-                return keyword.title()
+        # Look for industry keywords; stop at the first one in the text
+        for _, hits in KEYWORD_AUTOMATON.iter(text_content):
+            for category, rank in hits:
+                if category == 'industry':
+                    return INDUSTRY_KEYWORDS[rank].title()
         
         return ""
     
     def _extract_services(self, soup: BeautifulSoup) -> List[str]:
         """Extract services offered"""
         services = []
+        tree = self._lxml_tree(soup)
         
         # Look for service/product lists
-        service_selectors = [
-            'ul li', 'ol li', '.service', '.product', '.offering'
-        ]
-        
-        for selector in service_selectors:
-            elements = soup.select(selector)
+        for xpath in SERVICE_XPATHS:
+            elements = xpath(tree)
             for element in elements[:5]:  # Limit to avoid noise
-                text = element.get_text(strip=True)
+                text = _node_text(element)
                 if 20 < len(text) < 100:  # Reasonable service description length
                     services.append(text)
         
         return services[:10]  # Return top 10 services
     
-    def _extract_tech_stack(self, soup: BeautifulSoup) -> Dict[str, List[str]]:
+    def _extract_tech_stack(self, soup: BeautifulSoup, text_lower: Optional[str] = None) -> Dict[str, List[str]]:
         """Extract technology stack information"""
         tech_stack = {}
-        text_content = soup.get_text().lower()
+        text_content = text_lower if text_lower is not None else self._bulk_text(soup).lower()
+        
+        found = self._keyword_hits(text_content)
         
         for category, technologies in Config.TECH_PATTERNS.items():
-            found_tech = []
-            for tech in technologies:
-                if tech.lower() in text_content:
-                    found_tech.append(tech)
-            
-            if found_tech:
-                tech_stack[category] = found_tech
+            if category in found:
+                tech_stack[category] = [technologies[rank] for rank in sorted(found[category])]
         
-        # Also check script tags for JavaScript frameworks
-        scripts = soup.find_all('script')
+        # Also check script sources and framework DOM markers (not multi-MB inline bundles)
+        srcs = ' '.join(script['src'] for script in soup.find_all('script', src=True)).lower()
         js_frameworks = []
-        for script in scripts:
-            if script.string:
-                script_text = script.string.lower()
-                for framework in ['react', 'angular', 'vue', 'jquery']:
-                    if framework in script_text:
-                        js_frameworks.append(framework)
+        if 'react' in srcs or soup.find(attrs={'data-reactroot': True}):
+            js_frameworks.append('react')
+        if 'angular' in srcs or soup.find(attrs={'ng-app': True}):
+            js_frameworks.append('angular')
+        if 'vue' in srcs or soup.find(attrs={'data-v-app': True}):
+            js_frameworks.append('vue')
+        if 'jquery' in srcs:
+            js_frameworks.append('jquery')
         
         if js_frameworks:
             tech_stack['frontend_frameworks'] = js_frameworks
@@ -394,44 +572,38 @@ class WebScraper:
     def _extract_current_projects(self, soup: BeautifulSoup) -> List[str]:
         """Extract current projects or initiatives"""
         projects = []
+        tree = self._lxml_tree(soup)
         
         # Look for project/news/blog sections
-        project_selectors = [
-            '.project', '.case-study', '.portfolio', '.news', '.blog-post'
-        ]
-        
-        for selector in project_selectors:
-            elements = soup.select(selector)
+        for xpath in PROJECT_XPATHS:
+            elements = xpath(tree)
             for element in elements[:3]:  # Limit to 3 projects
-                title = element.find(['h1', 'h2', 'h3', 'h4'])
+                title = HEADING_XPATH(element)
                 if title:
-                    projects.append(title.get_text(strip=True))
+                    projects.append(_node_text(title[0]))
         
         return projects
     
-    def _extract_competitors(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_competitors(self, soup: BeautifulSoup, text_lower: Optional[str] = None) -> List[str]:
         """Extract competitor information"""
         competitors = []
-        text_content = soup.get_text().lower()
+        text_content = text_lower if text_lower is not None else self._bulk_text(soup).lower()
+        
+        if not any(literal in text_content for literal in COMPETITOR_LITERALS):
+            return competitors
         
         # Look for competitor mentions
-        competitor_patterns = [
-            r'competitor[s]?[:\s]+([^.]+)',
-            r'vs\.?\s+([A-Z][a-z]+)',
-            r'alternative to\s+([A-Z][a-z]+)'
-        ]
-        
-        for pattern in competitor_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
+        for pattern in COMPETITOR_RES:
+            matches = pattern.findall(text_content)
             for match in matches:
                 if isinstance(match, str) and len(match.strip()) > 0:
                     competitors.append(match.strip())
         
         return competitors[:5]  # Return top 5 competitors
     
-    def _extract_market_position(self, soup: BeautifulSoup) -> str:
+    def _extract_market_position(self, soup: BeautifulSoup, text_lower: Optional[str] = None) -> str:
         """Extract market positioning information"""
-        text_content = soup.get_text().lower()
+        text_content = text_lower if text_lower is not None else self._bulk_text(soup).lower()
         
         position_keywords = {
             'leader': ['leader', 'leading', 'market leader', 'industry leader'],
@@ -447,65 +619,57 @@ class WebScraper:
         
         return ""
     
-    def _extract_company_size(self, soup: BeautifulSoup) -> str:
+    def _extract_company_size(self, soup: BeautifulSoup, text_lower: Optional[str] = None) -> str:
         """Extract company size information"""
-        text_content = soup.get_text().lower()
+        text_content = text_lower if text_lower is not None else self._bulk_text(soup).lower()
         
-        size_patterns = [
-            r'(\d+)\s*(?:to|[-–])\s*(\d+)\s*employees',
-            r'(\d+)\+?\s*employees',
-            r'team\s+of\s+(\d+)',
-            r'(\d+)\s*people'
-        ]
+        if not any(literal in text_content for literal in SIZE_LITERALS):
+            return ""
         
-        for pattern in size_patterns:
-            matches = re.findall(pattern, text_content)
-            if matches:
-                return f"{matches[0]} employees" if isinstance(matches[0], str) else f"{matches[0][0]}-{matches[0][1]} employees"
+        for pattern in SIZE_RES:
+            match = pattern.search(text_content)
+            if match:
+                groups = match.groups()
+                return f"{groups[0]} employees" if len(groups) == 1 else f"{groups[0]}-{groups[1]} employees"
         
         return ""
     
-    def _extract_funding_info(self, soup: BeautifulSoup) -> str:
+    def _extract_funding_info(self, soup: BeautifulSoup, text_lower: Optional[str] = None) -> str:
         """Extract funding information"""
-        text_content = soup.get_text().lower()
+        text_content = text_lower if text_lower is not None else self._bulk_text(soup).lower()
         
-        funding_patterns = [
-            r'raised\s+\$([0-9,]+\s*(?:million|m|billion|b|thousand|k))',
-            r'funding\s+of\s+\$([0-9,]+\s*(?:million|m|billion|b|thousand|k))',
-            r'series\s+[a-z]\s+\$([0-9,]+\s*(?:million|m|billion|b|thousand|k))'
-        ]
+        if '$' not in text_content:
+            return ""
         
-        for pattern in funding_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
-            if matches:
-                return f"${matches[0]}"
+        for pattern in FUNDING_RES:
+            match = pattern.search(text_content)
+            if match:
+                return f"${match.group(1)}"
         
         return ""
     
     def _extract_news_mentions(self, soup: BeautifulSoup) -> List[str]:
         """Extract recent news mentions"""
         news_mentions = []
+        tree = self._lxml_tree(soup)
         
         # Look for news/press sections
-        news_selectors = [
-            '.news', '.press', '.media', '.article', '.blog'
-        ]
-        
-        for selector in news_selectors:
-            elements = soup.select(selector)
+        for xpath in NEWS_XPATHS:
+            elements = xpath(tree)
             for element in elements[:3]:  # Limit to 3 news items
-                title = element.find(['h1', 'h2', 'h3', 'h4'])
+                title = HEADING_XPATH(element)
                 if title:
-                    news_mentions.append(title.get_text(strip=True))
+                    news_mentions.append(_node_text(title[0]))
         
         return news_mentions
     
     def _find_contact_pages(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Find contact/about page URLs"""
         contact_urls = []
+        tree = self._lxml_tree(soup)
         
-        for selector in Config.SELECTORS['contact_page']:
-            links = soup.select(selector)
+        for xpath in CONTACT_PAGE_XPATHS:
+            links = xpath(tree)
             for link in links:
                 href = link.get('href')
                 if href:
@@ -515,16 +679,16 @@ class WebScraper:
         
         return contact_urls
     
-    def _extract_contact_page_info(self, url: str, data: Dict[str, Any]):
-        """Extract additional info from contact/about pages"""
+    def _extract_contact_page_info(self, url: str, soup: Optional[BeautifulSoup], data: Dict[str, Any]):
+        """Merge additional info from an already fetched contact/about page into data"""
         try:
-            soup = self._get_page_content(url)
             if not soup:
                 return
             
-            # Try to get additional emails and phones
-            emails = self._extract_emails(soup)
-            phones = self._extract_phones(soup)
+            # Try to get additional emails and phones (one text walk shared by all three lookups)
+            text = self._page_text(soup)
+            emails = self._extract_emails(soup, text)
+            phones = self._extract_phones(soup, text)
             
             # Merge with existing data
             if emails:
@@ -541,11 +705,9 @@ class WebScraper:
             
             # Get address if not already found
             if not data.get('address'):
-                address = self._extract_address(soup)
+                address = self._extract_address(soup, text)
                 if address:
                     data['address'] = address
-            
-            time.sleep(self.delay)
         except Exception as e:
             logger.error(f"Error extracting contact page info from {url}: {e}")
     
@@ -567,19 +729,85 @@ class WebScraper:
             logger.error(f"Error scraping {url}: {e}")
             return {"error": str(e)}
     
-    def scrape_multiple_urls(self, urls: List[str], level: str = "basic") -> List[Dict[str, Any]]:
-        """Scrape multiple URLs"""
-        results = []
+    def scrape_multiple_urls(self, urls: List[str], level: str = "basic",
+                             use_async: bool = False) -> List[Dict[str, Any]]:
+        """Scrape multiple URLs concurrently, one request at a time per host"""
+        if use_async:
+            return asyncio.run(self.scrape_multiple_urls_async(urls, level))
         
-        for url in urls:
-            logger.info(f"Scraping {url} ({len(results)+1}/{len(urls)})")
-            result = self.scrape_url(url, level)
-            results.append(result)
-            
-            # Add delay between requests
-            time.sleep(self.delay)
+        total = len(urls)
+        
+        def scrape_one(indexed_url):
+            index, url = indexed_url
+            # Serialize and pace requests to the same host; different hosts run in parallel
+            with self._host_locks[urlparse(url).netloc]:
+                logger.info(f"Scraping {url} ({index + 1}/{total})")
+                result = self.scrape_url(url, level)
+                time.sleep(self.delay)
+            return result
+        
+        with ThreadPoolExecutor(max_workers=Config.MAX_CONCURRENCY) as executor:
+            return list(executor.map(scrape_one, enumerate(urls)))
+    
+    async def _get_content_async(self, client, url: str) -> Optional[BeautifulSoup]:
+        """Async counterpart of _get_requests_content; parsing runs off the event loop"""
+        import aiohttp
+        
+        hit, content = self._cache_lookup(url)
+        if not hit:
+            try:
+                async with client.get(url, headers={'User-Agent': self.ua.random}) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+                self._cache_store(url, content)
+            except aiohttp.ClientResponseError as e:
+                self._cache_store(url, None)
+                logger.error(f"Async request error for {url}: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Async request error for {url}: {e}")
+                return None
+        
+        if content is None:
+            return None
+        return await asyncio.to_thread(self._parse_page, content)
+    
+    async def scrape_url_async(self, client, url: str, level: str = "basic") -> Dict[str, Any]:
+        """Scrape one URL over a shared aiohttp session (no Selenium; advanced uses the static page)"""
+        if not validators.url(url):
+            return {"error": f"Invalid URL: {url}"}
+        if level not in ("basic", "medium", "advanced"):
+            return {"error": f"Invalid extraction level: {level}"}
         
-        return results
+        try:
+            soup = await self._get_content_async(client, url)
+            if not soup:
+                return {"error": "Failed to fetch page content"}
+            return await asyncio.to_thread(self._extract_from_soup, soup, url, level)
+        except Exception as e:
+            logger.error(f"Error scraping {url}: {e}")
+            return {"error": str(e)}
+    
+    async def scrape_multiple_urls_async(self, urls: List[str], level: str = "basic") -> List[Dict[str, Any]]:
+        """Scrape many URLs on one event loop, bounded overall and paced per host"""
+        import aiohttp
+        
+        semaphore = asyncio.Semaphore(Config.ASYNC_MAX_CONCURRENCY)
+        host_locks = defaultdict(asyncio.Lock)
+        total = len(urls)
+        
+        async def scrape_one(client, index, url):
+            async with host_locks[urlparse(url).netloc], semaphore:
+                logger.info(f"Scraping {url} ({index + 1}/{total})")
+                result = await self.scrape_url_async(client, url, level)
+                await asyncio.sleep(self.delay)
+            return result
+        
+        timeout = aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT)
+        connector = aiohttp.TCPConnector(limit=Config.ASYNC_MAX_CONCURRENCY)
+        async with aiohttp.ClientSession(headers=Config.get_headers(), timeout=timeout,
+                                         connector=connector) as client:
+            return await asyncio.gather(*(scrape_one(client, i, url) for i, url in enumerate(urls)))
     
     def close(self):
         """Close browser and clean up resources"""
@@ -1,31 +1,172 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import random
 import logging
+import asyncio
+import threading
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse, quote_plus
-from typing import List, Dict, Optional, Set
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin, urlparse, urlsplit, parse_qs, quote_plus
+from typing import List, Dict, Optional, Set, Callable
 import re
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-import validators
 
 from config import Config
 from scraper import WebScraper
 
 logger = logging.getLogger(__name__)
 
+# Result-link selectors per search engine, fused into one OR-expression so each page is walked once
+GOOGLE_RESULT_SELECTOR = ', '.join([
+    'div.g a[href]',
+    'div.yuRUbf a[href]',
+    'h3 a[href]',
+    'a[href^="http"]:not([href*="google.com"])'
+])
+BING_RESULT_SELECTOR = ', '.join([
+    'li.b_algo a[href]',
+    'h2 a[href]',
+    'a[href^="http"]:not([href*="bing.com"])'
+])
+DUCKDUCKGO_RESULT_SELECTOR = ', '.join([
+    'a.result__a[href]',
+    'h2 a[href]',
+    'a[href^="http"]:not([href*="duckduckgo.com"])'
+])
+# Markers of CAPTCHA / consent / rate-limit pages served instead of results
+INTERSTITIAL_RE = re.compile(rb'captcha|consent\.|/sorry/|unusual traffic', re.IGNORECASE)
+
+BODY_TAG_RE = re.compile(rb'<body[\s>]', re.IGNORECASE)
+
+# URLs to exclude
+EXCLUDE_PATTERNS = [
+    r'facebook\.com',
+    r'twitter\.com',
+    r'linkedin\.com',
+    r'instagram\.com',
+    r'youtube\.com',
+    r'google\.com',
+    r'bing\.com',
+    r'yahoo\.com',
+    r'wikipedia\.org',
+    r'reddit\.com',
+    r'pinterest\.com',
+    r'amazon\.com',
+    r'ebay\.com',
+    r'crunchbase\.com',
+    r'glassdoor\.com',
+    r'indeed\.com',
+    r'job.*\.com',
+    r'career.*\.com',
+    r'news\.',
+    r'blog\.',
+    r'forum\.',
+    r'\.pdf$',
+    r'\.doc$',
+    r'\.docx$'
+]
+EXCLUDE_REGEX = re.compile('|'.join(EXCLUDE_PATTERNS), re.IGNORECASE)
+# Blog-platform domain labels and non-company path segments, checked by set intersection
+PLATFORM_DOMAIN_PARTS = frozenset({'blogspot', 'wordpress', 'medium', 'substack'})
+NON_COMPANY_PATH_SEGMENTS = frozenset({'jobs', 'careers', 'news', 'blog', 'forum'})
+# Partner, client, or competitor mentions around related-company links
+LINK_PATTERN_REGEX = re.compile(r'partner|client|customer|competitor|similar|related|alternative', re.IGNORECASE)
+# Same scan in libxml2: div/section elements with own text matching the pattern (EXSLT regex), and their links
+RELATED_SECTION_LINKS_XPATH = etree.XPath(
+    "(//div | //section)[text()[re:test(., $pattern, 'i')]]//a/@href",
+    namespaces={'re': 'http://exslt.org/regular-expressions'}
+)
+EXTERNAL_LINKS_XPATH = etree.XPath("//a[starts-with(@href, 'http://') or starts-with(@href, 'https://')]/@href")
+
 class SearchDiscovery:
     """Company discovery through search engines"""
     
+    # Structural URL check for the filter loops (far cheaper per candidate than validators.url)
+    _URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+    _WHITESPACE_RE = re.compile(r'\s')
+    
     def __init__(self, use_selenium: bool = True):
         self.use_selenium = use_selenium
         self.scraper = WebScraper(use_selenium=use_selenium)
         self.discovered_urls = set()
         
+        # One keep-alive session for every search engine fetch
+        self.session = requests.Session()
+        self.session.headers.update(Config.get_headers())
+        adapter = HTTPAdapter(
+            pool_connections=Config.CONNECTION_POOL_SIZE,
+            pool_maxsize=Config.CONNECTION_POOL_SIZE,
+            # Transient failures are retried inside urllib3 (honouring Retry-After on 429)
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=frozenset(['GET']), raise_on_status=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Seed page fetches in progress (URL -> Future), so duplicates wait instead of refetching
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Per-host pacing for concurrent fetches: host -> lock, host -> last request start
+        self._host_locks = defaultdict(threading.Lock)
+        self._last_fetch = defaultdict(float)
+        
+        # Result pages by URL (query, engine and page are all in it): in-process LRU,
+        # plus an optional on-disk layer that survives restarts
+        self._page_cache = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        self._disk_cache = None
+        if Config.SEARCH_CACHE_DIR:
+            import diskcache
+            self._disk_cache = diskcache.Cache(Config.SEARCH_CACHE_DIR)
+        
+    def _cached_page(self, url: str) -> Optional[bytes]:
+        """Cached result page HTML for url, or None if missing or expired"""
+        with self._page_cache_lock:
+            entry = self._page_cache.get(url)
+            if entry is not None:
+                stored_at, content = entry
+                if time.monotonic() - stored_at <= Config.SEARCH_CACHE_TTL:
+                    self._page_cache.move_to_end(url)
+                    return content
+                del self._page_cache[url]
+        
+        if self._disk_cache is not None:
+            content = self._disk_cache.get(url)
+            if content is not None:
+                self._remember_page(url, content, persist=False)
+            return content
+        return None
+    
+    def _remember_page(self, url: str, content: bytes, persist: bool = True):
+        """Cache result page HTML, evicting the least recently used page"""
+        with self._page_cache_lock:
+            self._page_cache[url] = (time.monotonic(), content)
+            self._page_cache.move_to_end(url)
+            if len(self._page_cache) > Config.SEARCH_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(url, content, expire=Config.SEARCH_CACHE_TTL)
+        
+    def _wait_for_host(self, url: str, min_interval: float):
+        """Block until at least min_interval seconds have passed since the last request to url's host"""
+        host = urlparse(url).netloc
+        with self._host_locks[host]:
+            wait = self._last_fetch[host] + min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_fetch[host] = time.monotonic()
+        
     def search_companies(self, query: str, max_results: int = 20, search_engine: str = 'google') -> List[str]:
         """Search for companies based on query"""
         logger.info(f"Searching for companies with query: '{query}' using {search_engine}")
@@ -40,43 +181,49 @@ class SearchDiscovery:
             logger.error(f"Unsupported search engine: {search_engine}")
             return []
     
+    def _search_url(self, engine: str, query: str, max_results: int) -> str:
+        """First results page URL for a query on one engine"""
+        # Format query for better company results
+        formatted_query = quote_plus(f"{query} company website")
+        if engine == 'google':
+            return f"https://www.google.com/search?q={formatted_query}&num={min(max_results, 100)}"
+        if engine == 'bing':
+            return f"https://www.bing.com/search?q={formatted_query}&count={min(max_results, 50)}"
+        return f"https://duckduckgo.com/html?q={formatted_query}"
+    
     def _search_google(self, query: str, max_results: int) -> List[str]:
         """Search Google for company URLs"""
         company_urls = []
         
-        # Format query for better company results
-        formatted_query = f"{query} company website"
-        search_url = f"https://www.google.com/search?q={quote_plus(formatted_query)}&num={min(max_results, 100)}"
+        search_url = self._search_url('google', query, max_results)
         
         try:
-            if self.use_selenium and self.scraper.driver:
-                soup = self._get_search_results_selenium(search_url)
-            else:
-                soup = self._get_search_results_requests(search_url)
+            # Results are server-rendered; the browser is only a fallback for block/consent pages
+            html = self._get_search_results_requests(search_url)
+            if self.use_selenium and self.scraper.driver and (not html or INTERSTITIAL_RE.search(html)):
+                logger.info("Plain fetch hit an interstitial, retrying search with Selenium")
+                html = self._get_search_results_selenium(search_url)
             
-            if not soup:
+            if not html:
                 logger.error("Failed to get search results")
                 return []
             
             # Extract URLs from search results
-            urls = self._extract_google_urls(soup)
+            urls = self._extract_google_urls(html)
             company_urls.extend(urls)
             
-            # Try additional pages if needed
+            # Try additional pages if needed, fetched concurrently (still paced per host)
             if len(company_urls) < max_results:
-                for page in range(2, 4):  # Pages 2-3
-                    start = (page - 1) * 10
-                    page_url = f"{search_url}&start={start}"
-                    
-                    soup = self._get_search_results_requests(page_url)
-                    if soup:
-                        urls = self._extract_google_urls(soup)
-                        company_urls.extend(urls)
+                page_urls = [f"{search_url}&start={(page - 1) * 10}" for page in range(2, 4)]  # Pages 2-3
+                with ThreadPoolExecutor(max_workers=len(page_urls)) as executor:
+                    pages = list(executor.map(self._get_search_results_requests, page_urls))
+                
+                for html in pages:
+                    if html:
+                        company_urls.extend(self._extract_google_urls(html))
                         
                         if len(company_urls) >= max_results:
                             break
-                    
-                    time.sleep(random.uniform(2, 4))  # Random delay
             
         except Exception as e:
             logger.error(f"Error searching Google: {e}")
@@ -87,13 +234,12 @@ class SearchDiscovery:
         """Search Bing for company URLs"""
         company_urls = []
         
-        formatted_query = f"{query} company website"
-        search_url = f"https://www.bing.com/search?q={quote_plus(formatted_query)}&count={min(max_results, 50)}"
+        search_url = self._search_url('bing', query, max_results)
         
         try:
-            soup = self._get_search_results_requests(search_url)
-            if soup:
-                urls = self._extract_bing_urls(soup)
+            html = self._get_search_results_requests(search_url)
+            if html:
+                urls = self._extract_bing_urls(html)
                 company_urls.extend(urls)
             
         except Exception as e:
@@ -105,13 +251,12 @@ class SearchDiscovery:
         """Search DuckDuckGo for company URLs"""
         company_urls = []
         
-        formatted_query = f"{query} company website"
-        search_url = f"https://duckduckgo.com/html?q={quote_plus(formatted_query)}"
+        search_url = self._search_url('duckduckgo', query, max_results)
         
         try:
-            soup = self._get_search_results_requests(search_url)
-            if soup:
-                urls = self._extract_duckduckgo_urls(soup)
+            html = self._get_search_results_requests(search_url)
+            if html:
+                urls = self._extract_duckduckgo_urls(html)
                 company_urls.extend(urls)
             
         except Exception as e:
@@ -119,20 +264,23 @@ class SearchDiscovery:
         
         return self._filter_company_urls(company_urls[:max_results])
     
-    def _get_search_results_selenium(self, url: str) -> Optional[BeautifulSoup]:
-        """Get search results using Selenium"""
+    def _get_search_results_selenium(self, url: str) -> Optional[bytes]:
+        """Get search results page HTML using Selenium"""
         try:
-            self.scraper.driver.get(url)
-            
-            # Wait for results to load
-            WebDriverWait(self.scraper.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.g, div.result"))
-            )
-            
-            # Handle potential CAPTCHA or consent forms
-            time.sleep(random.uniform(3, 5))
+            # Pace per engine host instead of sleeping after every page load
+            self._wait_for_host(url, random.uniform(2, 4))
+            # Engines search in parallel but share one Chrome session
+            with self.scraper._driver_lock:
+                self.scraper.driver.get(url)
+                
+                # Wait for results to load
+                WebDriverWait(self.scraper.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.g, div.result"))
+                )
+                
+                page_source = self.scraper.driver.page_source
             
-            return BeautifulSoup(self.scraper.driver.page_source, 'html.parser')
+            return page_source.encode('utf-8')
             
         except TimeoutException:
             logger.error(f"Timeout waiting for search results: {url}")
@@ -141,154 +289,98 @@ class SearchDiscovery:
             logger.error(f"Error getting search results with Selenium: {e}")
             return None
     
-    def _get_search_results_requests(self, url: str) -> Optional[BeautifulSoup]:
-        """Get search results using requests"""
+    def _get_search_results_requests(self, url: str) -> Optional[bytes]:
+        """Get search results page HTML using requests (cached per URL)"""
+        content = self._cached_page(url)
+        if content is not None:
+            return content
+        
         try:
-            headers = {
-                'User-Agent': random.choice(Config.USER_AGENTS),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
-            response = requests.get(url, headers=headers, timeout=15)
+            self._wait_for_host(url, random.uniform(2, 4))  # Random delay between hits to one engine
+            headers = {'User-Agent': random.choice(Config.USER_AGENTS)}
+            response = self.session.get(url, headers=headers,
+                                        timeout=(Config.SEARCH_CONNECT_TIMEOUT, Config.SEARCH_READ_TIMEOUT))
             response.raise_for_status()
             
-            return BeautifulSoup(response.content, 'html.parser')
+            # Never pin a CAPTCHA/consent page in the cache
+            if not INTERSTITIAL_RE.search(response.content):
+                self._remember_page(url, response.content)
+            return response.content
             
         except Exception as e:
             logger.error(f"Error getting search results with requests: {e}")
             return None
     
-    def _extract_google_urls(self, soup: BeautifulSoup) -> List[str]:
-        """Extract URLs from Google search results"""
+    def _extract_urls_sel(self, html: bytes, selector: str,
+                          clean: Optional[Callable[[str], str]] = None) -> List[str]:
+        """New absolute hrefs matched by selector, in document order, from one selectolax (Lexbor) parse"""
+        # Result links live in <body>; skip parsing the (often larger) inline-script/CSS <head>
+        body = BODY_TAG_RE.search(html)
+        tree = LexborHTMLParser(html[body.start():] if body else html)
+        
+        # Drop repeats and already-discovered URLs before they reach the filter
+        seen = set()
         urls = []
-        
-        # Google search result selectors
-        selectors = [
-            'div.g a[href]',
-            'div.yuRUbf a[href]',
-            'h3 a[href]',
-            'a[href^="http"]:not([href*="google.com"])'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                href = element.get('href')
-                if href and href.startswith('http'):
-                    # Clean Google redirect URLs
-                    if '/url?q=' in href:
-                        try:
-                            actual_url = href.split('/url?q=')[1].split('&')[0]
-                            urls.append(actual_url)
-                        except:
-                            continue
-                    else:
-                        urls.append(href)
-        
+        for node in tree.css(selector):
+            href = node.attributes.get('href')
+            if href and href.startswith('http'):
+                url = clean(href) if clean else href
+                if url not in seen and url not in self.discovered_urls:
+                    seen.add(url)
+                    urls.append(url)
         return urls
     
-    def _extract_bing_urls(self, soup: BeautifulSoup) -> List[str]:
+    def _clean_google_url(self, href: str) -> str:
+        """Target of a Google redirect link, or the href unchanged"""
+        parsed = urlsplit(href)
+        if parsed.path != '/url':
+            return href
+        # parse_qs percent-decodes the target and copes with q not being the first parameter
+        return parse_qs(parsed.query).get('q', [href])[0]
+    
+    def _extract_google_urls(self, html: bytes) -> List[str]:
+        """Extract URLs from Google search results"""
+        return self._extract_urls_sel(html, GOOGLE_RESULT_SELECTOR, clean=self._clean_google_url)
+    
+    def _extract_bing_urls(self, html: bytes) -> List[str]:
         """Extract URLs from Bing search results"""
-        urls = []
-        
-        # Bing search result selectors
-        selectors = [
-            'li.b_algo a[href]',
-            'h2 a[href]',
-            'a[href^="http"]:not([href*="bing.com"])'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                href = element.get('href')
-                if href and href.startswith('http'):
-                    urls.append(href)
-        
-        return urls
+        return self._extract_urls_sel(html, BING_RESULT_SELECTOR)
     
-    def _extract_duckduckgo_urls(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_duckduckgo_urls(self, html: bytes) -> List[str]:
         """Extract URLs from DuckDuckGo search results"""
-        urls = []
-        
-        # DuckDuckGo search result selectors
-        selectors = [
-            'a.result__a[href]',
-            'h2 a[href]',
-            'a[href^="http"]:not([href*="duckduckgo.com"])'
-        ]
-        
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                href = element.get('href')
-                if href and href.startswith('http'):
-                    urls.append(href)
-        
-        return urls
+        return self._extract_urls_sel(html, DUCKDUCKGO_RESULT_SELECTOR)
+    
+    def _is_valid_url(self, url: str) -> bool:
+        """http(s) URL with a host, checked with a compiled regex and urlparse"""
+        return bool(self._URL_RE.match(url)) and bool(urlparse(url).netloc)
     
     def _filter_company_urls(self, urls: List[str]) -> List[str]:
         """Filter URLs to keep only company websites"""
         filtered_urls = []
         
-        # URLs to exclude
-        exclude_patterns = [
-            r'facebook\.com',
-            r'twitter\.com',
-            r'linkedin\.com',
-            r'instagram\.com',
-            r'youtube\.com',
-            r'google\.com',
-            r'bing\.com',
-            r'yahoo\.com',
-            r'wikipedia\.org',
-            r'reddit\.com',
-            r'pinterest\.com',
-            r'amazon\.com',
-            r'ebay\.com',
-            r'crunchbase\.com',
-            r'glassdoor\.com',
-            r'indeed\.com',
-            r'job.*\.com',
-            r'career.*\.com',
-            r'news\.',
-            r'blog\.',
-            r'forum\.',
-            r'\.pdf$',
-            r'\.doc$',
-            r'\.docx$'
-        ]
-        
-        exclude_regex = re.compile('|'.join(exclude_patterns), re.IGNORECASE)
-        
         for url in urls:
             try:
-                # Validate URL
-                if not validators.url(url):
+                # Check if already discovered (cheapest check, and repeats are common)
+                if url in self.discovered_urls:
                     continue
                 
                 # Check if URL should be excluded
-                if exclude_regex.search(url):
+                if EXCLUDE_REGEX.search(url):
                     continue
                 
-                # Check if already discovered
-                if url in self.discovered_urls:
+                # Validate URL: parsed once, reused for the domain and path checks below
+                parsed = urlsplit(url)
+                if parsed.scheme not in ('http', 'https') or not parsed.netloc or self._WHITESPACE_RE.search(url):
                     continue
-                
-                # Check domain structure (should look like a company website)
-                parsed = urlparse(url)
                 domain = parsed.netloc.lower()
+                path = parsed.path.lower()
                 
                 # Skip if domain looks like a subdomain of a platform
-                if any(platform in domain for platform in ['blogspot', 'wordpress', 'medium', 'substack']):
+                if PLATFORM_DOMAIN_PARTS.intersection(domain.split('.')):
                     continue
                 
                 # Skip if path suggests it's not a main company site
-                if any(path in parsed.path.lower() for path in ['/jobs', '/careers', '/news', '/blog', '/forum']):
+                if NON_COMPANY_PATH_SEGMENTS.intersection(path.split('/')):
                     continue
                 
                 filtered_urls.append(url)
@@ -303,91 +395,184 @@ class SearchDiscovery:
     def discover_from_seed_urls(self, seed_urls: List[str], max_depth: int = 2) -> List[str]:
         """Discover additional company URLs from seed URLs"""
         discovered_urls = set(seed_urls)
+        crawled_urls = set()
         
-        for depth in range(max_depth):
-            current_urls = list(discovered_urls)
-            
-            for url in current_urls:
+        def crawl_host(urls: List[str]) -> List[str]:
+            # Pages on one host are fetched one at a time and paced
+            found = []
+            for url in urls:
                 try:
                     # Get page content
-                    soup = self.scraper._get_page_content(url)
+                    soup = self._get_seed_page(url)
                     if not soup:
                         continue
                     
                     # Find related company links
-                    related_urls = self._extract_related_company_urls(soup, url)
-                    
-                    for related_url in related_urls:
-                        if related_url not in discovered_urls:
-                            discovered_urls.add(related_url)
-                    
-                    time.sleep(random.uniform(1, 3))  # Rate limiting
+                    found.extend(self._extract_related_company_urls(soup, url))
                     
                 except Exception as e:
                     logger.error(f"Error discovering from {url}: {e}")
                     continue
+            return found
+        
+        for depth in range(max_depth):
+            # Different hosts are crawled in parallel; pages crawled at an earlier depth are skipped
+            by_host = defaultdict(list)
+            for url in discovered_urls - crawled_urls:
+                by_host[urlparse(url).netloc].append(url)
+            if not by_host:
+                break
+            crawled_urls.update(discovered_urls)
+            
+            with ThreadPoolExecutor(max_workers=min(10, len(by_host))) as executor:
+                for related_urls in executor.map(crawl_host, by_host.values()):
+                    discovered_urls.update(related_urls)
         
         return list(discovered_urls)
     
+    def _get_seed_page(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch a seed page; concurrent callers asking for the same URL share one request"""
+        with self._inflight_lock:
+            future = self._inflight.get(url)
+            is_owner = future is None
+            if is_owner:
+                future = self._inflight[url] = Future()
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            self._wait_for_host(url, random.uniform(1, 3))  # Rate limiting
+            soup = self.scraper._get_page_content(url)
+            future.set_result(soup)
+            return soup
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(url, None)
+    
     def _extract_related_company_urls(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Extract URLs of related companies from a page"""
         related_urls = []
         
-        # Look for partner, client, or competitor links
-        link_patterns = [
-            r'partner',
-            r'client',
-            r'customer',
-            r'competitor',
-            r'similar',
-            r'related',
-            r'alternative'
-        ]
-        
-        pattern_regex = re.compile('|'.join(link_patterns), re.IGNORECASE)
+        tree = self.scraper._lxml_tree(soup)
         
         # Find sections that might contain related companies
-        relevant_sections = soup.find_all(['div', 'section'], string=pattern_regex)
-        
-        for section in relevant_sections:
-            links = section.find_all('a', href=True)
-            for link in links:
-                href = link.get('href')
-                if href:
-                    full_url = urljoin(base_url, href)
-                    if validators.url(full_url):
-                        related_urls.append(full_url)
+        for href in RELATED_SECTION_LINKS_XPATH(tree, pattern=LINK_PATTERN_REGEX.pattern):
+            if href:
+                full_url = urljoin(base_url, href)
+                if self._is_valid_url(full_url):
+                    related_urls.append(full_url)
         
         # Also look for any external links that might be companies
-        external_links = soup.find_all('a', href=re.compile(r'^https?://'))
-        for link in external_links[:20]:  # Limit to avoid noise
-            href = link.get('href')
-            if href and href != base_url:
-                parsed_base = urlparse(base_url)
-                parsed_href = urlparse(href)
-                
+        base_netloc = urlparse(base_url).netloc
+        for href in EXTERNAL_LINKS_XPATH(tree)[:20]:  # Limit to avoid noise
+            if href != base_url:
                 # Skip if same domain
-                if parsed_base.netloc == parsed_href.netloc:
+                if urlparse(href).netloc == base_netloc:
                     continue
                 
                 related_urls.append(href)
         
         return self._filter_company_urls(related_urls)
     
+    async def _afetch(self, client, url: str, host_locks: Dict[str, asyncio.Lock]) -> Optional[bytes]:
+        """Async counterpart of _get_search_results_requests (same cache and per-host pacing)"""
+        import aiohttp
+        
+        content = self._cached_page(url)
+        if content is not None:
+            return content
+        
+        try:
+            host = urlparse(url).netloc
+            async with host_locks[host]:
+                wait = self._last_fetch[host] + random.uniform(2, 4) - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_fetch[host] = time.monotonic()
+            
+            headers = {'User-Agent': random.choice(Config.USER_AGENTS)}
+            async with client.get(url, headers=headers) as response:
+                response.raise_for_status()
+                content = await response.read()
+            
+            if not INTERSTITIAL_RE.search(content):
+                self._remember_page(url, content)
+            return content
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error getting search results with aiohttp: {e}")
+            return None
+    
+    async def search_companies_async(self, client, query: str, max_results: int = 20,
+                                     search_engine: str = 'google',
+                                     host_locks: Optional[Dict[str, asyncio.Lock]] = None) -> List[str]:
+        """Search one engine over a shared aiohttp session; Google's pages 1-3 are fetched together"""
+        extractors = {
+            'google': self._extract_google_urls,
+            'bing': self._extract_bing_urls,
+            'duckduckgo': self._extract_duckduckgo_urls,
+        }
+        if search_engine not in extractors:
+            logger.error(f"Unsupported search engine: {search_engine}")
+            return []
+        if host_locks is None:
+            host_locks = defaultdict(asyncio.Lock)
+        
+        logger.info(f"Searching for companies with query: '{query}' using {search_engine}")
+        search_url = self._search_url(search_engine, query, max_results)
+        page_urls = [search_url]
+        if search_engine == 'google':
+            page_urls += [f"{search_url}&start={(page - 1) * 10}" for page in range(2, 4)]  # Pages 2-3
+        
+        pages = await asyncio.gather(*(self._afetch(client, url, host_locks) for url in page_urls))
+        
+        company_urls = []
+        for html in pages:
+            if html:
+                company_urls.extend(extractors[search_engine](html))
+        
+        return self._filter_company_urls(company_urls[:max_results])
+    
+    async def _search_engines_async(self, query: str, max_results: int,
+                                    search_engines: List[str]) -> List[List[str]]:
+        """Query every engine concurrently on one event loop"""
+        import aiohttp
+        
+        host_locks = defaultdict(asyncio.Lock)
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=4, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(sock_connect=Config.SEARCH_CONNECT_TIMEOUT,
+                                        sock_read=Config.SEARCH_READ_TIMEOUT)
+        async with aiohttp.ClientSession(headers=Config.get_headers(), connector=connector,
+                                         timeout=timeout) as client:
+            return await asyncio.gather(*(
+                self.search_companies_async(client, query, max_results, engine, host_locks)
+                for engine in search_engines
+            ))
+    
     def search_and_discover(self, query: str, max_results: int = 20, 
                            search_engines: List[str] = None, 
-                           use_seed_discovery: bool = True) -> List[str]:
+                           use_seed_discovery: bool = True,
+                           use_async: bool = False) -> List[str]:
         """Combined search and discovery method"""
         if search_engines is None:
             search_engines = ['google', 'bing']
         
         all_urls = []
         
-        # Search each engine
-        for engine in search_engines:
-            urls = self.search_companies(query, max_results // len(search_engines), engine)
-            all_urls.extend(urls)
-            time.sleep(random.uniform(2, 4))  # Rate limiting between engines
+        # Search every engine at once; they're different hosts, so no pacing between them
+        per_engine = max_results // len(search_engines)
+        if use_async:
+            for urls in asyncio.run(self._search_engines_async(query, per_engine, search_engines)):
+                all_urls.extend(urls)
+        else:
+            with ThreadPoolExecutor(max_workers=min(10, len(search_engines))) as executor:
+                for urls in executor.map(lambda engine: self.search_companies(query, per_engine, engine),
+                                         search_engines):
+                    all_urls.extend(urls)
         
         # Remove duplicates
         unique_urls = list(dict.fromkeys(all_urls))
@@ -406,6 +591,9 @@ class SearchDiscovery:
     
     def close(self):
         """Close scraper resources"""
+        self.session.close()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
         if self.scraper:
             self.scraper.close()
     
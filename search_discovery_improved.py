@@ -5,12 +5,24 @@ Enhanced company discovery with multiple fallback strategies
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-import random
 import logging
+import queue
+import asyncio
+import importlib.util
+import socket
+import threading
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from http.cookiejar import DefaultCookiePolicy
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+from lxml import etree
 from urllib.parse import urljoin, urlparse, quote_plus
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple, Iterator, Iterable, Callable
 import re
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -18,12 +30,126 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 import validators
-import json
+import orjson
 
 from config import Config
 
 logger = logging.getLogger(__name__)
 
+DUCKDUCKGO_API_URL = "https://api.duckduckgo.com/?q={}&format=json&t=webscraper"
+DUCKDUCKGO_HTML_URL = "https://duckduckgo.com/html?q={}"
+GITHUB_ORG_SEARCH_URL = "https://api.github.com/search/users?q={}+type:org&sort=repositories&order=desc"
+GITHUB_ORG_URL = "https://api.github.com/orgs/{}"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+# Top organisations and their websites in one round trip (GraphQL needs Config.GITHUB_TOKEN)
+GITHUB_ORGS_GRAPHQL = """
+query($q: String!) {
+  search(query: $q, type: USER, first: 10) {
+    nodes { ... on Organization { websiteUrl } }
+  }
+}
+"""
+# Result-link selectors; the :not() clauses skip the engines' own navigation links
+DUCKDUCKGO_RESULT_SELECTOR = 'a.result__a[href^="http"], a[href^="http"]:not([href*="duckduckgo.com"])'
+BING_RESULT_SELECTOR = 'li.b_algo h2 a[href^="http"]:not([href*="bing.com"])'
+# Advertise Brotli only when a decoder is installed (requests and aiohttp both use the brotli package)
+ACCEPT_ENCODING = 'br, gzip, deflate' if importlib.util.find_spec('brotli') else 'gzip, deflate'
+# Per-request header overrides: Bing gets a different user agent, and both ask only for what is parsed
+BING_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; MSIE 10.0; Windows NT 6.1; Trident/6.0)',
+    'Accept': 'text/html',
+}
+DUCKDUCKGO_API_HEADERS = {'Accept': 'application/json'}
+
+# URLs to exclude (less restrictive than SearchDiscovery's list)
+EXCLUDE_PATTERNS = [
+    r'facebook\.com',
+    r'twitter\.com',
+    r'instagram\.com',
+    r'youtube\.com',
+    r'google\.com',
+    r'bing\.com',
+    r'yahoo\.com',
+    r'wikipedia\.org',
+    r'reddit\.com',
+    r'pinterest\.com',
+    r'amazon\.com/(?!s3)',  # Allow S3 but not main Amazon
+    r'ebay\.com',
+    r'news\.',
+    r'\.pdf$',
+    r'\.doc$',
+    r'\.docx$',
+    r'//[^/]*(?:blogspot|wordpress\.com|medium\.com)',  # Obviously non-company domains (host part only)
+]
+EXCLUDE_REGEX = re.compile('|'.join(EXCLUDE_PATTERNS), re.IGNORECASE)
+
+# Requests per minute allowed per host (DEFAULT_HOST_RPM for any other host)
+HOST_RATE_LIMITS = {
+    'api.duckduckgo.com': 20,
+    'duckduckgo.com': 20,
+    'www.bing.com': 20,
+    'api.github.com': 30,
+    'builtin.com': 30,
+    'www.producthunt.com': 30,
+}
+DEFAULT_HOST_RPM = 30
+
+def _is_duckduckgo_result(anchor: etree._Element) -> bool:
+    """Pull-parser counterpart of DUCKDUCKGO_RESULT_SELECTOR"""
+    href = anchor.get('href') or ''
+    return href.startswith('http') and ('result__a' in (anchor.get('class') or '').split()
+                                        or 'duckduckgo.com' not in href)
+
+def _is_bing_result(anchor: etree._Element) -> bool:
+    """Pull-parser counterpart of BING_RESULT_SELECTOR"""
+    href = anchor.get('href') or ''
+    if not href.startswith('http') or 'bing.com' in href:
+        return False
+    # li.b_algo h2 a: an <h2> ancestor, itself inside an <li class="b_algo">
+    for heading in anchor.iterancestors('h2'):
+        return any('b_algo' in (li.get('class') or '').split() for li in heading.iterancestors('li'))
+    return False
+
+class _NoCookiesPolicy(DefaultCookiePolicy):
+    """Cookie policy that neither stores nor sends any cookie"""
+    
+    def set_ok(self, cookie, request):
+        return False
+    
+    def return_ok(self, cookie, request):
+        return False
+
+class _HostBucket:
+    """Token bucket for one host: refills at rpm/60 tokens a second, up to a small burst"""
+    
+    def __init__(self, rpm: float, burst: float = 3):
+        self.rate = rpm / 60
+        self.capacity = burst
+        self.tokens = burst
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token (possibly going into debt) and return the seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_update) * self.rate)
+            self.last_update = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def acquire(self):
+        """Block until a request to this host is within budget"""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+    
+    async def acquire_async(self):
+        """Async counterpart of acquire"""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
 class ImprovedSearchDiscovery:
     """Enhanced company discovery with multiple strategies"""
     
@@ -33,6 +159,22 @@ class ImprovedSearchDiscovery:
         self.session = requests.Session()
         self._setup_session()
         
+        # Resolve the fixed set of search hosts in the background so first contact doesn't wait on DNS
+        threading.Thread(target=self._prewarm_dns, daemon=True).start()
+        
+        # Per-host token buckets; a request only waits when its own host is over budget
+        self._buckets: Dict[str, _HostBucket] = {}
+        self._buckets_lock = threading.Lock()
+        
+        # Responses by SHA-256 of the URL: in-process LRU, plus the optional on-disk
+        # layer shared with SearchDiscovery (Config.SEARCH_CACHE_DIR) so reruns skip the network
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        self._disk_cache = None
+        if Config.SEARCH_CACHE_DIR:
+            import diskcache
+            self._disk_cache = diskcache.Cache(Config.SEARCH_CACHE_DIR)
+        
         # Sample company URLs for different industries (fallback)
         self.sample_companies = {
             "cloud computing": [
@@ -77,13 +219,20 @@ class ImprovedSearchDiscovery:
             ]
         }
         
+        # Query keyword -> sample URLs (first 4 of each category it names), plus the no-match fallback
+        self._sample_index: Dict[str, List[str]] = {}
+        for category, urls in self.sample_companies.items():
+            for keyword in category.split():
+                self._sample_index.setdefault(keyword, []).extend(urls[:4])
+        self._sample_fallback = [url for urls in self.sample_companies.values() for url in urls[:2]]
+        
     def _setup_session(self):
         """Setup requests session with proper headers"""
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'document',
@@ -91,61 +240,233 @@ class ImprovedSearchDiscovery:
             'Sec-Fetch-Site': 'none',
             'Cache-Control': 'max-age=0'
         })
+        
+        # Keep one warm connection pool per host across the burst of engine/directory/GitHub calls
+        adapter = HTTPAdapter(
+            pool_connections=Config.CONNECTION_POOL_SIZE,
+            pool_maxsize=Config.CONNECTION_POOL_SIZE,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=frozenset(['GET']), raise_on_status=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Nothing here reads cookies; refusing them keeps the jar (scanned on every request) empty
+        self.session.cookies.set_policy(_NoCookiesPolicy())
+    
+    def _prewarm_dns(self):
+        """Look up every host in HOST_RATE_LIMITS once (helps wherever the system resolver caches)"""
+        for host in HOST_RATE_LIMITS:
+            try:
+                socket.getaddrinfo(host, 443)
+            except OSError:
+                pass
+    
+    def _bucket(self, url: str) -> '_HostBucket':
+        """Rate limiter for url's host"""
+        host = urlparse(url).netloc
+        with self._buckets_lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = _HostBucket(HOST_RATE_LIMITS.get(host, DEFAULT_HOST_RPM))
+            return bucket
+    
+    def _cached_response(self, url: str) -> Optional[bytes]:
+        """Cached body stored under url (or another cache key), or None if missing or expired"""
+        key = sha256(url.encode()).hexdigest()
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None:
+                stored_at, body = entry
+                if time.monotonic() - stored_at <= Config.SEARCH_CACHE_TTL:
+                    self._response_cache.move_to_end(key)
+                    return body
+                del self._response_cache[key]
+        
+        if self._disk_cache is not None:
+            body = self._disk_cache.get(key)
+            if body is not None:
+                self._remember_response(url, body, persist=False)
+            return body
+        return None
+    
+    def _remember_response(self, url: str, body: bytes, persist: bool = True):
+        """Cache a response body, evicting the least recently used one"""
+        key = sha256(url.encode()).hexdigest()
+        with self._response_cache_lock:
+            self._response_cache[key] = (time.monotonic(), body)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > Config.SEARCH_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(key, body, expire=Config.SEARCH_CACHE_TTL)
+    
+    def _cached_get(self, url: str, **kwargs) -> Tuple[int, bytes]:
+        """GET through the response cache; returns (status, body) and caches only 200s"""
+        body = self._cached_response(url)
+        if body is not None:
+            return 200, body
+        
+        self._bucket(url).acquire()
+        response = self.session.get(url, **kwargs)
+        if response.status_code == 200:
+            self._remember_response(url, response.content)
+        return response.status_code, response.content
+    
+    def _result_links(self, chunks: Iterable[bytes], is_result: Callable[[etree._Element], bool],
+                      limit: int) -> Tuple[List[str], bool]:
+        """Hrefs of result anchors parsed incrementally from chunks; (links, whether every chunk was read)"""
+        parser = etree.HTMLPullParser(events=('start',), tag='a')
+        links = []
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, anchor in parser.read_events():
+                if is_result(anchor):
+                    links.append(anchor.get('href'))
+                    if len(links) >= limit:
+                        return links, False
+        return links, True
+    
+    def _stream_result_links(self, url: str, is_result: Callable[[etree._Element], bool],
+                             limit: int, **kwargs) -> List[str]:
+        """First limit result links of a results page, closing the download once they are found"""
+        if limit <= 0:
+            return []
+        
+        body = self._cached_response(url)
+        if body is not None:
+            return self._result_links([body], is_result, limit)[0]
+        
+        self._bucket(url).acquire()
+        with self.session.get(url, stream=True, **kwargs) as response:
+            if response.status_code != 200:
+                return []
+            chunks = []
+            capped = False
+            
+            def read():
+                # Never buffer or parse more than SEARCH_MAX_PAGE_BYTES of one page
+                nonlocal capped
+                received = 0
+                for chunk in response.iter_content(8192):
+                    chunks.append(chunk)
+                    yield chunk
+                    received += len(chunk)
+                    if received >= Config.SEARCH_MAX_PAGE_BYTES:
+                        capped = True
+                        return
+            
+            links, complete = self._result_links(read(), is_result, limit)
+        
+        # A page cut off early could hold fewer links than a later, larger limit needs
+        if complete and not capped:
+            self._remember_response(url, b''.join(chunks))
+        return links
     
-    def search_companies(self, query: str, max_results: int = 20) -> List[str]:
+    def search_companies(self, query: str, max_results: int = 20, use_async: bool = False) -> List[str]:
         """Multi-strategy company search"""
         logger.info(f"Searching for companies with query: '{query}'")
         
-        all_urls = []
-        
+        # Whole results are cached per normalised query in the response cache (both tiers)
+        cache_key = f"search:{query.lower().strip()}:{max_results}"
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            result = orjson.loads(cached)
+            self.discovered_urls.update(result)
+            logger.info(f"Using {len(result)} cached company URLs for query: '{query}'")
+            return result
+        
+        result = self._search_uncached(query, max_results, use_async)
+        if result:  # An empty result is more likely rate limiting than a real answer; don't pin it
+            self._remember_response(cache_key, orjson.dumps(result))
+        return result
+    
+    def _search_uncached(self, query: str, max_results: int, use_async: bool) -> List[str]:
+        """Run every search strategy for a query"""
         # Strategy 1: Try sample companies first (for demo purposes)
         sample_urls = self._get_sample_companies(query)
         if sample_urls:
-            all_urls.extend(sample_urls)
             logger.info(f"Found {len(sample_urls)} sample companies")
         
-        # Strategy 2: Search engines with improved approach
-        search_urls = self._search_engines(query, max_results)
-        all_urls.extend(search_urls)
-        
-        # Strategy 3: Company directories
-        directory_urls = self._search_directories(query, max_results)
-        all_urls.extend(directory_urls)
+        use_github = any(tech_word in query.lower() for tech_word in ['tech', 'software', 'app', 'platform', 'cloud', 'ai'])
         
-        # Strategy 4: GitHub organizations (for tech companies)
-        if any(tech_word in query.lower() for tech_word in ['tech', 'software', 'app', 'platform', 'cloud', 'ai']):
-            github_urls = self._search_github_orgs(query)
-            all_urls.extend(github_urls)
+        # Dedupe and filter as URLs arrive, stopping once max_results companies are found.
+        # Only URLs scraped from engine/directory HTML get the strict validators.url check.
+        result = []
+        seen = set()
         
-        # Remove duplicates and filter
-        unique_urls = list(dict.fromkeys(all_urls))
-        filtered_urls = self._filter_company_urls(unique_urls)
+        def collect(urls: Iterable[str], strict: bool) -> bool:
+            for url in urls:
+                if url in seen:
+                    continue
+                seen.add(url)
+                company_url = self._company_url(url, strict)
+                if company_url:
+                    result.append(company_url)
+                    if len(result) >= max_results:
+                        return True
+            return False
+        
+        # Strategies 2-4 only run when the samples don't already fill the result
+        if not collect(sample_urls, False):
+            if use_async:
+                # Strategies 2-4 fetched concurrently on one event loop
+                search_urls, directory_urls, github_urls = asyncio.run(
+                    self._gather_all(query, max_results, use_github)
+                )
+                for urls, strict in ((search_urls, True), (directory_urls, True), (github_urls, False)):
+                    if collect(urls, strict):
+                        break
+            else:
+                # Strategies 2-4 talk to different hosts, so directories and GitHub run on worker
+                # threads and stream their URLs back while the engines are collected here; once
+                # the result is full the workers stop before their next request
+                done = threading.Event()
+                
+                def feed(urls: Iterable[str], out: queue.Queue):
+                    try:
+                        for url in urls:
+                            if done.is_set():
+                                break
+                            out.put(url)
+                    finally:
+                        out.put(None)
+                
+                def stream(future, out: queue.Queue) -> Iterator[str]:
+                    for url in iter(out.get, None):
+                        yield url
+                    future.result()  # re-raise anything the strategy raised
+                
+                directory_queue, github_queue = queue.Queue(), queue.Queue()
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    directory_future = executor.submit(
+                        feed, self._search_directories(query, max_results), directory_queue)
+                    github_future = executor.submit(
+                        feed, self._search_github_orgs(query) if use_github else (), github_queue)
+                    try:
+                        # Strategy 2: Search engines, 3: Company directories, 4: GitHub organizations
+                        if not collect(self._search_engines(query, max_results), True):
+                            if not collect(stream(directory_future, directory_queue), True):
+                                collect(stream(github_future, github_queue), False)
+                    finally:
+                        done.set()
         
-        result = filtered_urls[:max_results]
         logger.info(f"Discovered {len(result)} company URLs for query: '{query}'")
         
         return result
     
     def _get_sample_companies(self, query: str) -> List[str]:
         """Get sample companies based on query keywords"""
-        sample_urls = []
-        query_lower = query.lower()
-        
-        for category, urls in self.sample_companies.items():
-            if any(keyword in query_lower for keyword in category.split()):
-                sample_urls.extend(urls[:4])  # Take first 4 from each matching category
+        # Whole query words only, so e.g. "email" no longer matches the "ai" category
+        sample_urls = [url for keyword in dict.fromkeys(query.lower().split())
+                       for url in self._sample_index.get(keyword, ())]
         
         # If no specific category matches, take some from each
-        if not sample_urls:
-            for category, urls in self.sample_companies.items():
-                sample_urls.extend(urls[:2])  # Take 2 from each category
-        
-        return sample_urls
+        return list(dict.fromkeys(sample_urls)) or list(self._sample_fallback)
     
-    def _search_engines(self, query: str, max_results: int) -> List[str]:
-        """Search multiple engines with improved techniques"""
-        urls = []
-        
+    def _search_variants(self, query: str) -> List[str]:
+        """Search engine queries tried for a user query"""
         # Try different search approaches
         search_variants = [
             f"{query} company website",
@@ -154,26 +475,21 @@ class ImprovedSearchDiscovery:
             f'"{query}" company',
             f"{query} site:com"
         ]
-        
-        for search_query in search_variants[:2]:  # Limit to avoid rate limiting
+        return search_variants[:2]  # Limit to avoid rate limiting
+    
+    def _search_engines(self, query: str, max_results: int) -> Iterator[str]:
+        """Search multiple engines with improved techniques"""
+        for search_query in self._search_variants(query):
             try:
                 # Try DuckDuckGo first (less blocking)
-                ddg_urls = self._search_duckduckgo_improved(search_query, max_results // 4)
-                urls.extend(ddg_urls)
-                
-                time.sleep(random.uniform(2, 4))
+                yield from self._search_duckduckgo_improved(search_query, max_results // 4)
                 
                 # Try Bing
-                bing_urls = self._search_bing_improved(search_query, max_results // 4)
-                urls.extend(bing_urls)
-                
-                time.sleep(random.uniform(2, 4))
+                yield from self._search_bing_improved(search_query, max_results // 4)
                 
             except Exception as e:
                 logger.warning(f"Search engine error: {e}")
                 continue
-        
-        return urls
     
     def _search_duckduckgo_improved(self, query: str, max_results: int) -> List[str]:
         """Improved DuckDuckGo search"""
@@ -181,24 +497,11 @@ class ImprovedSearchDiscovery:
         
         try:
             # DuckDuckGo instant answers API
-            search_url = f"https://api.duckduckgo.com/?q={quote_plus(query)}&format=json&t=webscraper"
+            search_url = DUCKDUCKGO_API_URL.format(quote_plus(query))
             
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Extract URLs from results
-                for result in data.get('Results', []):
-                    first_url = result.get('FirstURL')
-                    if first_url:
-                        urls.append(first_url)
-                
-                # Also check related topics
-                for topic in data.get('RelatedTopics', []):
-                    if isinstance(topic, dict):
-                        first_url = topic.get('FirstURL')
-                        if first_url:
-                            urls.append(first_url)
+            status, body = self._cached_get(search_url, headers=DUCKDUCKGO_API_HEADERS, timeout=10)
+            if status == 200:
+                urls.extend(self._urls_from_duckduckgo_api(orjson.loads(body)))
             
             # Fallback to HTML search
             if len(urls) < max_results:
@@ -210,74 +513,81 @@ class ImprovedSearchDiscovery:
         
         return urls[:max_results]
     
+    def _urls_from_duckduckgo_api(self, data: Dict) -> List[str]:
+        """Result URLs from a DuckDuckGo instant answers payload"""
+        urls = []
+        
+        # Extract URLs from results
+        for result in data.get('Results', []):
+            first_url = result.get('FirstURL')
+            if first_url:
+                urls.append(first_url)
+        
+        # Also check related topics
+        for topic in data.get('RelatedTopics', []):
+            if isinstance(topic, dict):
+                first_url = topic.get('FirstURL')
+                if first_url:
+                    urls.append(first_url)
+        
+        return urls
+    
     def _search_duckduckgo_html(self, query: str, max_results: int) -> List[str]:
         """DuckDuckGo HTML search fallback"""
         urls = []
         
         try:
-            search_url = f"https://duckduckgo.com/html?q={quote_plus(query)}"
+            search_url = DUCKDUCKGO_HTML_URL.format(quote_plus(query))
             
-            response = self.session.get(search_url, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Extract URLs from search results
-                for link in soup.find_all('a', {'class': 'result__a'}):
-                    href = link.get('href')
-                    if href and href.startswith('http'):
-                        urls.append(href)
-                
-                # Also try general result links
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href')
-                    if href and href.startswith('http') and 'duckduckgo.com' not in href:
-                        urls.append(href)
+            urls = self._stream_result_links(search_url, _is_duckduckgo_result, max_results, timeout=15)
                         
         except Exception as e:
             logger.warning(f"DuckDuckGo HTML search error: {e}")
         
         return urls[:max_results]
     
+    def _urls_from_duckduckgo_html(self, content: bytes) -> List[str]:
+        """Result URLs from a DuckDuckGo HTML results page"""
+        # Search result links and any other external links, in one Lexbor pass
+        tree = LexborHTMLParser(content)
+        return [node.attributes.get('href') for node in tree.css(DUCKDUCKGO_RESULT_SELECTOR)]
+    
     def _search_bing_improved(self, query: str, max_results: int) -> List[str]:
         """Improved Bing search"""
         urls = []
         
         try:
-            search_url = f"https://www.bing.com/search?q={quote_plus(query)}&count={min(max_results, 50)}"
-            
-            # Use different user agent for Bing
-            headers = self.session.headers.copy()
-            headers['User-Agent'] = 'Mozilla/5.0 (compatible; MSIE 10.0; Windows NT 6.1; Trident/6.0)'
+            search_url = self._bing_url(query, max_results)
             
-            response = self.session.get(search_url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Bing result selectors
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href')
-                    if href and href.startswith('http') and 'bing.com' not in href:
-                        urls.append(href)
+            # Use different user agent for Bing (merged over the session headers per request)
+            urls = self._stream_result_links(search_url, _is_bing_result, max_results,
+                                             headers=BING_HEADERS, timeout=15)
                         
         except Exception as e:
             logger.warning(f"Bing search error: {e}")
         
         return urls[:max_results]
     
-    def _search_directories(self, query: str, max_results: int) -> List[str]:
+    def _bing_url(self, query: str, max_results: int) -> str:
+        """Bing results page URL for a query"""
+        return f"https://www.bing.com/search?q={quote_plus(query)}&count={min(max_results, 50)}"
+    
+    def _urls_from_bing(self, content: bytes) -> List[str]:
+        """Result URLs from a Bing results page"""
+        # Only the organic result titles, not every anchor on the page
+        tree = LexborHTMLParser(content)
+        return [node.attributes.get('href') for node in tree.css(BING_RESULT_SELECTOR)]
+    
+    def _search_directories(self, query: str, max_results: int) -> Iterator[str]:
         """Search company directories and databases"""
-        urls = []
+        remaining = max_results
         
-        # Company directory sources
+        # Company directory sources (AngelList needs authentication, so _search_angellist isn't dispatched)
         directories = [
             {
                 'name': 'Product Hunt',
                 'search': lambda q: self._search_producthunt(q),
             },
-            {
-                'name': 'AngelList',
-                'search': lambda q: self._search_angellist(q),
-            },
             {
                 'name': 'Built In',
                 'search': lambda q: self._search_builtin(q),
@@ -285,26 +595,30 @@ class ImprovedSearchDiscovery:
         ]
         
         for directory in directories:
+            if remaining <= 0:
+                return
             try:
-                dir_urls = directory['search'](query)
-                urls.extend(dir_urls)
-                time.sleep(random.uniform(1, 3))
+                dir_urls = directory['search'](query)[:remaining]
+                remaining -= len(dir_urls)
+                yield from dir_urls
             except Exception as e:
                 logger.warning(f"Error searching {directory['name']}: {e}")
                 continue
-        
-        return urls[:max_results]
     
     def _search_producthunt(self, query: str) -> List[str]:
         """Search Product Hunt for companies"""
         urls = []
         
+        # No extractor for product pages yet, so the page would only be fetched and discarded
+        if not Config.ENABLE_PRODUCTHUNT:
+            return urls
+        
         try:
             search_url = f"https://www.producthunt.com/search?q={quote_plus(query)}"
-            response = self.session.get(search_url, timeout=10)
+            status, body = self._cached_get(search_url, timeout=10)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            if status == 200:
+                soup = BeautifulSoup(body, 'html.parser')
                 
                 # Look for product links that might lead to company websites
                 for link in soup.find_all('a', href=True):
@@ -339,10 +653,10 @@ class ImprovedSearchDiscovery:
         
         try:
             search_url = f"https://builtin.com/companies?search={quote_plus(query)}"
-            response = self.session.get(search_url, timeout=10)
+            status, body = self._cached_get(search_url, timeout=10)
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            if status == 200:
+                soup = BeautifulSoup(body, 'html.parser')
                 
                 # Extract company profile links
                 for link in soup.find_all('a', href=True):
@@ -357,109 +671,234 @@ class ImprovedSearchDiscovery:
         
         return urls
     
-    def _search_github_orgs(self, query: str) -> List[str]:
+    def _search_github_orgs(self, query: str) -> Iterator[str]:
         """Search GitHub organizations for tech companies"""
-        urls = []
+        if Config.GITHUB_TOKEN:
+            yield from self._search_github_orgs_graphql(query)
+            return
         
         try:
             # GitHub search API
-            search_url = f"https://api.github.com/search/users?q={quote_plus(query)}+type:org&sort=repositories&order=desc"
+            search_url = GITHUB_ORG_SEARCH_URL.format(quote_plus(query))
             
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            status, body = self._cached_get(search_url, timeout=10)
+            if status == 200:
+                data = orjson.loads(body)
                 
                 for org in data.get('items', [])[:10]:  # Top 10 organizations
                     org_url = org.get('html_url')
                     if org_url:
                         # Try to find the organization's website
-                        org_response = self.session.get(f"https://api.github.com/orgs/{org['login']}", timeout=5)
-                        if org_response.status_code == 200:
-                            org_data = org_response.json()
+                        org_status, org_body = self._cached_get(GITHUB_ORG_URL.format(org['login']), timeout=5)
+                        if org_status == 200:
+                            org_data = orjson.loads(org_body)
                             blog_url = org_data.get('blog')
-                            if blog_url and validators.url(blog_url):
-                                urls.append(blog_url)
-                    
-                    time.sleep(0.5)  # Rate limiting for GitHub API
+                            if blog_url and self._is_valid_url(blog_url):
+                                yield blog_url
                         
         except Exception as e:
             logger.debug(f"GitHub search error: {e}")
+    
+    def _search_github_orgs_graphql(self, query: str) -> List[str]:
+        """GitHub organization websites from a single GraphQL search (instead of 1 + 10 REST calls)"""
+        urls = []
+        
+        try:
+            # POSTs bypass _cached_get, so cache the response under the query instead
+            cache_key = f"{GITHUB_GRAPHQL_URL}?q={quote_plus(query)}"
+            body = self._cached_response(cache_key)
+            if body is None:
+                payload = {'query': GITHUB_ORGS_GRAPHQL,
+                           'variables': {'q': f"{query} type:org sort:repositories-desc"}}
+                self._bucket(GITHUB_GRAPHQL_URL).acquire()
+                response = self.session.post(GITHUB_GRAPHQL_URL, data=orjson.dumps(payload), timeout=10,
+                                             headers={'Authorization': f"bearer {Config.GITHUB_TOKEN}",
+                                                      'Content-Type': 'application/json'})
+                if response.status_code != 200:
+                    return urls
+                body = response.content
+            
+            data = orjson.loads(body)
+            if data.get('errors'):
+                logger.debug(f"GitHub GraphQL errors: {data['errors']}")
+                return urls
+            self._remember_response(cache_key, body)
+            
+            for org in (data.get('data') or {}).get('search', {}).get('nodes', []):
+                website_url = org.get('websiteUrl')
+                if website_url and self._is_valid_url(website_url):
+                    urls.append(website_url)
+                    
+        except Exception as e:
+            logger.debug(f"GitHub search error: {e}")
         
         return urls
     
-    def _filter_company_urls(self, urls: List[str]) -> List[str]:
-        """Filter URLs to keep only likely company websites"""
-        filtered_urls = []
+    async def _afetch(self, client, url: str, host_sems: Dict[str, asyncio.Semaphore],
+                      headers: Optional[Dict[str, str]] = None, timeout: float = 10) -> Tuple[int, bytes]:
+        """GET a URL over the shared aiohttp session; (status, body), or (0, b'') on a network error"""
+        import aiohttp
         
-        # URLs to exclude (less restrictive than before)
-        exclude_patterns = [
-            r'facebook\.com',
-            r'twitter\.com',
-            r'instagram\.com',
-            r'youtube\.com',
-            r'google\.com',
-            r'bing\.com',
-            r'yahoo\.com',
-            r'wikipedia\.org',
-            r'reddit\.com',
-            r'pinterest\.com',
-            r'amazon\.com/(?!s3)', # Allow S3 but not main Amazon
-            r'ebay\.com',
-            r'news\.',
-            r'\.pdf$',
-            r'\.doc$',
-            r'\.docx$'
-        ]
+        body = self._cached_response(url)
+        if body is not None:
+            return 200, body
         
-        exclude_regex = re.compile('|'.join(exclude_patterns), re.IGNORECASE)
+        try:
+            async with host_sems[urlparse(url).netloc]:
+                await self._bucket(url).acquire_async()
+                async with client.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    status, body = response.status, await response.read()
+            if status == 200:
+                self._remember_response(url, body)
+            return status, body
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Error fetching {url}: {e}")
+            return 0, b''
+    
+    async def _search_duckduckgo_async(self, client, host_sems: Dict[str, asyncio.Semaphore],
+                                       query: str, max_results: int) -> List[str]:
+        """Async counterpart of _search_duckduckgo_improved"""
+        urls = []
         
-        for url in urls:
-            try:
-                # Basic URL validation
-                if not url or not isinstance(url, str):
-                    continue
-                    
-                # Fix URL if needed
-                if not url.startswith(('http://', 'https://')):
-                    url = 'https://' + url
-                
-                # Validate URL
-                if not validators.url(url):
-                    continue
-                
-                # Check if URL should be excluded
-                if exclude_regex.search(url):
-                    continue
-                
-                # Check if already discovered
-                if url in self.discovered_urls:
-                    continue
-                
-                # Check domain structure
-                parsed = urlparse(url)
-                domain = parsed.netloc.lower()
-                
-                # Skip obviously non-company domains
-                if any(platform in domain for platform in ['blogspot', 'wordpress.com', 'medium.com']):
-                    continue
-                
-                # Must have a reasonable domain
-                if len(domain.split('.')) < 2:
-                    continue
+        try:
+            status, body = await self._afetch(client, DUCKDUCKGO_API_URL.format(quote_plus(query)), host_sems,
+                                              headers=DUCKDUCKGO_API_HEADERS)
+            if status == 200:
+                urls.extend(self._urls_from_duckduckgo_api(orjson.loads(body)))
+            
+            # Fallback to HTML search
+            if len(urls) < max_results:
+                status, body = await self._afetch(client, DUCKDUCKGO_HTML_URL.format(quote_plus(query)),
+                                                  host_sems, timeout=15)
+                if status == 200:
+                    urls.extend(self._urls_from_duckduckgo_html(body)[:max_results])
                 
-                filtered_urls.append(url)
-                self.discovered_urls.add(url)
+        except Exception as e:
+            logger.warning(f"DuckDuckGo search error: {e}")
+        
+        return urls[:max_results]
+    
+    async def _search_bing_async(self, client, host_sems: Dict[str, asyncio.Semaphore],
+                                 query: str, max_results: int) -> List[str]:
+        """Async counterpart of _search_bing_improved"""
+        urls = []
+        
+        try:
+            status, body = await self._afetch(client, self._bing_url(query, max_results), host_sems,
+                                              headers=BING_HEADERS, timeout=15)
+            if status == 200:
+                urls = self._urls_from_bing(body)
                 
-            except Exception as e:
-                logger.debug(f"Error filtering URL {url}: {e}")
-                continue
+        except Exception as e:
+            logger.warning(f"Bing search error: {e}")
+        
+        return urls[:max_results]
+    
+    async def _search_github_orgs_async(self, client, host_sems: Dict[str, asyncio.Semaphore],
+                                        query: str) -> List[str]:
+        """Async counterpart of _search_github_orgs; the per-org lookups run together"""
+        urls = []
         
+        try:
+            status, body = await self._afetch(client, GITHUB_ORG_SEARCH_URL.format(quote_plus(query)), host_sems)
+            if status == 200:
+                orgs = [org for org in orjson.loads(body).get('items', [])[:10] if org.get('html_url')]
+                responses = await asyncio.gather(*(
+                    self._afetch(client, GITHUB_ORG_URL.format(org['login']), host_sems, timeout=5)
+                    for org in orgs
+                ))
+                for org_status, org_body in responses:
+                    if org_status == 200:
+                        blog_url = orjson.loads(org_body).get('blog')
+                        if blog_url and self._is_valid_url(blog_url):
+                            urls.append(blog_url)
+                        
+        except Exception as e:
+            logger.debug(f"GitHub search error: {e}")
+        
+        return urls
+    
+    async def _gather_all(self, query: str, max_results: int,
+                          use_github: bool) -> Tuple[List[str], List[str], List[str]]:
+        """Engine, directory and GitHub URLs for a query, with every fetch in flight at once"""
+        import aiohttp
+        
+        # Politeness is per host: at most 4 requests in flight to any one of them
+        host_sems = defaultdict(lambda: asyncio.Semaphore(4))
+        # Non-blocking c-ares lookups when aiodns is installed (the default resolver uses a thread pool)
+        resolver = aiohttp.AsyncResolver() if importlib.util.find_spec('aiodns') else None
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=4, ttl_dns_cache=600, resolver=resolver)
+        async with aiohttp.ClientSession(headers=dict(self.session.headers), connector=connector,
+                                         cookie_jar=aiohttp.DummyCookieJar()) as client:
+            engine_tasks = []
+            for search_query in self._search_variants(query):
+                engine_tasks.append(self._search_duckduckgo_async(client, host_sems, search_query, max_results // 4))
+                engine_tasks.append(self._search_bing_async(client, host_sems, search_query, max_results // 4))
+            
+            # The directory scrapers have no async counterpart yet; run them on a worker thread
+            directory_task = asyncio.to_thread(lambda: list(self._search_directories(query, max_results)))
+            if use_github and Config.GITHUB_TOKEN:
+                # Already a single request; nothing to fan out
+                github_task = asyncio.to_thread(self._search_github_orgs_graphql, query)
+            else:
+                github_task = (self._search_github_orgs_async(client, host_sems, query)
+                               if use_github else asyncio.sleep(0, result=[]))
+            
+            results = await asyncio.gather(*engine_tasks, directory_task, github_task, return_exceptions=True)
+        
+        results = [[] if isinstance(urls, BaseException) else urls for urls in results]
+        search_urls = [url for urls in results[:-2] for url in urls]
+        return search_urls, results[-2], results[-1]
+    
+    def _is_valid_url(self, url: str) -> bool:
+        """Structural http(s) URL check: a dotted host of sane length and no spaces"""
+        try:
+            parsed = urlparse(url)
+        except ValueError:  # e.g. a malformed IPv6 host
+            return False
+        return (parsed.scheme in ('http', 'https') and '.' in parsed.netloc
+                and ' ' not in url and len(parsed.netloc) < 253)
+    
+    def _company_url(self, url, strict: bool = True) -> Optional[str]:
+        """Normalised URL if it looks like a new company website (and mark it discovered), else None"""
+        # Basic URL validation
+        if not url or not isinstance(url, str):
+            return None
+            
+        # Fix URL if needed
+        if not url.startswith(('http://', 'https://')):
+            url = 'https://' + url
+        
+        # Cheapest rejections first: already discovered, then excluded (including blog/platform domains)
+        if url in self.discovered_urls:
+            return None
+        if EXCLUDE_REGEX.search(url):
+            return None
+        
+        # Validate URL; the full validators regex is reserved for untrusted scraped links
+        if not self._is_valid_url(url):
+            return None
+        if strict and not validators.url(url):
+            return None
+        
+        self.discovered_urls.add(url)
+        return url
+    
+    def _filter_company_urls(self, urls: List[str], strict: bool = True) -> List[str]:
+        """Filter URLs to keep only likely company websites"""
+        filtered_urls = []
+        for url in urls:
+            company_url = self._company_url(url, strict)
+            if company_url:
+                filtered_urls.append(company_url)
         return filtered_urls
     
     def close(self):
         """Clean up resources"""
         if hasattr(self, 'session'):
             self.session.close()
+        if getattr(self, '_disk_cache', None) is not None:
+            self._disk_cache.close()
 
 # Example usage and testing
 if __name__ == "__main__":
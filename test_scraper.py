@@ -7,31 +7,95 @@ import unittest
 import tempfile
 import json
 import os
-from unittest.mock import Mock, patch, MagicMock
+import importlib.util
+import io
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
+from pyfakefs.fake_filesystem_unittest import TestCase as FakeFSTestCase
 import sys
 import logging
+import pytest
+import requests_mock
+from hypothesis import given, strategies as st
 
 # Import our modules
 from scraper import WebScraper
 from search_discovery import SearchDiscovery
-from data_output import DataOutput
 from config import Config
-from main import WebScrapingTool
+# data_output and main pull in pandas/openpyxl; the classes that need them import them in setUpClass
 
-# Disable logging during tests
-logging.disable(logging.CRITICAL)
+# Read-only stand-ins for parsed pages, built once and shared by the extraction tests
+_LINK_EMAIL = {"href": "mailto:test@example.com"}
+_LINK_PHONE = {"href": "tel:+1234567890"}
+
+def _make_soup(text="", links=(), title=None):
+    """Page stand-in: find() returns the title node, find_all() the links, get_text() the text"""
+    node = SimpleNamespace(text=title) if title is not None else None
+    return SimpleNamespace(
+        find=lambda *a, **k: node,
+        find_all=lambda *a, **k: list(links),
+        select=lambda *a, **k: [],
+        get_text=lambda *a, **k: text,
+    )
+
+_SOUP_BASIC = _make_soup("Test content", title="Test Company")
+_SOUP_EMAIL = _make_soup("Contact us at contact@example.com", links=[_LINK_EMAIL])
+_SOUP_PHONE = _make_soup("Call us at +1 (234) 567-8900", links=[_LINK_PHONE])
+_SOUP_TITLE = _make_soup(title="Test Company - Homepage")
+
+# Sample company records, built once and read-only
+_SAMPLE_DATA = tuple(MappingProxyType(record) for record in [
+    {
+        "company_name": "Test Company 1",
+        "website_url": "https://test1.com",
+        "email": ["test@test1.com"],
+        "phone": ["+1234567890"],
+        "extraction_level": "basic"
+    },
+    {
+        "company_name": "Test Company 2",
+        "website_url": "https://test2.com",
+        "email": ["info@test2.com"],
+        "phone": [],
+        "extraction_level": "medium",
+        "social_media": {"linkedin": "https://linkedin.com/company/test2"}
+    }
+])
+
+# Arbitrary scraped records: JSON-like values nested a few levels deep
+_RECORD_VALUES = st.recursive(
+    st.one_of(st.none(), st.integers(), st.text()),
+    lambda children: st.lists(children) | st.dictionaries(st.text(min_size=1), children),
+    max_leaves=10,
+)
+_RECORDS = st.dictionaries(st.text(min_size=1), _RECORD_VALUES)
+
+def setUpModule():
+    """Warm up the extractors so lazy loading isn't charged to the first extraction test"""
+    # validators and phonenumbers load their data on first use (phonenumbers per region)
+    scraper = WebScraper(use_selenium=False)
+    scraper._extract_emails(_SOUP_EMAIL)
+    scraper._extract_phones(_SOUP_PHONE)
+    scraper.close()
 
 class TestWebScraper(unittest.TestCase):
     """Test cases for WebScraper class"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.scraper = WebScraper(use_selenium=False)
+    scraper = None  # set to the per-worker scraper by conftest.py under pytest
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the class"""
+        cls.owns_scraper = cls.scraper is None
+        if cls.owns_scraper:
+            cls.scraper = WebScraper(use_selenium=False)
         
-    def tearDown(self):
-        """Clean up after tests"""
-        if self.scraper:
-            self.scraper.close()
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after the class"""
+        if cls.owns_scraper:
+            cls.scraper.close()
+            cls.scraper = None
     
     def test_init_without_selenium(self):
         """Test scraper initialization without Selenium"""
@@ -48,15 +112,7 @@ class TestWebScraper(unittest.TestCase):
     
     def test_basic_data_extraction_structure(self):
         """Test that basic data extraction returns correct structure"""
-        # Mock the page content
-        mock_soup = Mock()
-        mock_soup.find.return_value = Mock()
-        mock_soup.find.return_value.text = "Test Company"
-        mock_soup.find_all.return_value = []
-        mock_soup.select.return_value = []
-        mock_soup.get_text.return_value = "Test content"
-        
-        with patch.object(self.scraper, '_get_page_content', return_value=mock_soup):
+        with patch.object(type(self).scraper, '_get_page_content', return_value=_SOUP_BASIC):
             result = self.scraper.extract_basic_data("https://example.com")
             
             # Check required fields
@@ -66,53 +122,54 @@ class TestWebScraper(unittest.TestCase):
             
             self.assertEqual(result["extraction_level"], "basic")
     
+    def test_server_error_not_cached(self):
+        """A 503 is fetched again on the next call instead of being cached as a failure"""
+        url = "https://unavailable.example.com/"
+        with requests_mock.Mocker() as mocker:
+            mocker.get(url, [{'status_code': 503}, {'content': b'<html><title>Back</title></html>'}])
+            self.assertIsNone(self.scraper._get_requests_content(url))
+            self.assertIsNotNone(self.scraper._get_requests_content(url))
+            self.assertEqual(mocker.call_count, 2)
+    
     def test_email_extraction(self):
         """Test email extraction functionality"""
-        # Mock BeautifulSoup with email content
-        mock_soup = Mock()
-        mock_link = Mock()
-        mock_link.get.return_value = "mailto:test@example.com"
-        mock_link.__getitem__ = Mock(return_value="mailto:test@example.com")
-        mock_soup.find_all.return_value = [mock_link]
-        mock_soup.get_text.return_value = "Contact us at contact@example.com"
-        
-        emails = self.scraper._extract_emails(mock_soup)
+        emails = self.scraper._extract_emails(_SOUP_EMAIL)
         self.assertIsInstance(emails, list)
     
     def test_phone_extraction(self):
         """Test phone number extraction"""
-        mock_soup = Mock()
-        mock_link = Mock()
-        mock_link.get.return_value = "tel:+1234567890"
-        mock_link.__getitem__ = Mock(return_value="tel:+1234567890")
-        mock_soup.find_all.return_value = [mock_link]
-        mock_soup.get_text.return_value = "Call us at +1 (234) 567-8900"
-        
-        phones = self.scraper._extract_phones(mock_soup)
+        phones = self.scraper._extract_phones(_SOUP_PHONE)
         self.assertIsInstance(phones, list)
     
     def test_company_name_extraction(self):
         """Test company name extraction"""
-        mock_soup = Mock()
-        mock_title = Mock()
-        mock_title.text = "Test Company - Homepage"
-        mock_soup.find.return_value = mock_title
-        
-        name = self.scraper._extract_company_name(mock_soup, "https://example.com")
+        name = self.scraper._extract_company_name(_SOUP_TITLE, "https://example.com")
         self.assertIsInstance(name, str)
         self.assertGreater(len(name), 0)
 
 class TestSearchDiscovery(unittest.TestCase):
     """Test cases for SearchDiscovery class"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the class"""
+        cls.search_discovery = SearchDiscovery(use_selenium=False)
+        
+        # One transport-level mock answers every request made by the class
+        cls.mocker = requests_mock.Mocker()
+        cls.mocker.start()
+        cls.mocker.get(requests_mock.ANY, content=b'<html><body><div class="g"><a href="https://example.com">Test Company</a></div></body></html>')
+        
     def setUp(self):
-        """Set up test fixtures"""
-        self.search_discovery = SearchDiscovery(use_selenium=False)
+        """Forget URLs an earlier test discovered"""
+        self.search_discovery.discovered_urls.clear()
         
-    def tearDown(self):
-        """Clean up after tests"""
-        if self.search_discovery:
-            self.search_discovery.close()
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after the class"""
+        cls.mocker.stop()
+        if cls.search_discovery:
+            cls.search_discovery.close()
     
     def test_init(self):
         """Test SearchDiscovery initialization"""
@@ -140,106 +197,79 @@ class TestSearchDiscovery(unittest.TestCase):
         self.assertIn("https://example.com", filtered)
         self.assertIn("https://validcompany.com", filtered)
     
-    @patch('requests.get')
-    def test_search_companies_mock(self, mock_get):
+    def test_search_companies_mock(self):
         """Test company search with mocked response"""
-        # Mock response
-        mock_response = Mock()
-        mock_response.content = b'<html><body><div class="g"><a href="https://example.com">Test Company</a></div></body></html>'
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-        
         urls = self.search_discovery.search_companies("test query", max_results=5)
         self.assertIsInstance(urls, list)
 
-class TestDataOutput(unittest.TestCase):
+class TestDataOutput(FakeFSTestCase):
     """Test cases for DataOutput class"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Load pandas and the Excel writer before the fake filesystem is patched in"""
+        super().setUpClass()
+        import openpyxl  # noqa: F401
+        from data_output import DataOutput
+        cls.data_output_cls = DataOutput
+    
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.data_output = DataOutput(output_dir=self.temp_dir)
+        # Output files are written to an in-memory filesystem
+        self.setUpPyfakefs()
+        self.temp_dir = "/fake/out"
+        self.fs.create_dir(self.temp_dir)
+        self.data_output = self.data_output_cls(output_dir=self.temp_dir)
         
         # Sample test data
-        self.sample_data = [
-            {
-                "company_name": "Test Company 1",
-                "website_url": "https://test1.com",
-                "email": ["test@test1.com"],
-                "phone": ["+1234567890"],
-                "extraction_level": "basic"
-            },
-            {
-                "company_name": "Test Company 2",
-                "website_url": "https://test2.com",
-                "email": ["info@test2.com"],
-                "phone": [],
-                "extraction_level": "medium",
-                "social_media": {"linkedin": "https://linkedin.com/company/test2"}
-            }
-        ]
-    
-    def tearDown(self):
-        """Clean up after tests"""
-        # Clean up temp directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_save_json(self):
-        """Test JSON output functionality"""
-        filepath = self.data_output.save_data(
-            data=self.sample_data,
-            filename="test_json",
-            format_type="json"
-        )
-        
-        self.assertTrue(os.path.exists(filepath))
-        self.assertTrue(filepath.endswith('.json'))
-        
-        # Verify content
-        with open(filepath, 'r') as f:
-            loaded_data = json.load(f)
+        self.sample_data = _SAMPLE_DATA
+    
+    @patch.object(Config, 'XLSX_STREAMING', True)
+    def test_save_formats(self):
+        """Test JSON, CSV and (write-only) Excel output functionality"""
+        for format_type in ("json", "csv", "xlsx"):
+            with self.subTest(format_type=format_type):
+                # The writers need real dicts (json.dump can't serialize a mappingproxy)
+                filepath = self.data_output.save_data(
+                    data=[dict(record) for record in self.sample_data],
+                    filename=f"test_{format_type}",
+                    format_type=format_type
+                )
+                
+                self.assertTrue(os.path.exists(filepath))
+                self.assertGreater(os.path.getsize(filepath), 0)
+                self.assertTrue(filepath.endswith(f'.{format_type}'))
+    
+    def test_save_to_stream(self):
+        """Test writing each format to an in-memory stream"""
+        data = [dict(record) for record in self.sample_data]
         
+        buf = io.StringIO()
+        self.data_output.save_data(data=data, format_type="json", file=buf)
+        buf.seek(0)
+        loaded_data = json.load(buf)
         self.assertEqual(len(loaded_data), 2)
         self.assertEqual(loaded_data[0]["company_name"], "Test Company 1")
-    
-    def test_save_csv(self):
-        """Test CSV output functionality"""
-        filepath = self.data_output.save_data(
-            data=self.sample_data,
-            filename="test_csv",
-            format_type="csv"
-        )
-        
-        self.assertTrue(os.path.exists(filepath))
-        self.assertTrue(filepath.endswith('.csv'))
-        
-        # Verify content
-        with open(filepath, 'r') as f:
-            content = f.read()
         
+        buf = io.StringIO()
+        self.data_output.save_data(data=data, format_type="csv", file=buf)
+        content = buf.getvalue()
         self.assertIn("company_name", content)
         self.assertIn("Test Company 1", content)
-    
-    def test_save_excel(self):
-        """Test Excel output functionality"""
-        filepath = self.data_output.save_data(
-            data=self.sample_data,
-            filename="test_excel",
-            format_type="xlsx"
-        )
         
-        self.assertTrue(os.path.exists(filepath))
-        self.assertTrue(filepath.endswith('.xlsx'))
+        buf = io.BytesIO()
+        self.data_output.save_data(data=data, format_type="xlsx", file=buf)
+        self.assertTrue(buf.getvalue().startswith(b"PK"))  # xlsx is a zip archive
     
     def test_get_output_stats(self):
         """Test statistics generation"""
         stats = self.data_output.get_output_stats(self.sample_data)
         
         self.assertEqual(stats["total_companies"], 2)
-        self.assertIn("extraction_levels", stats)
-        self.assertIn("data_completeness", stats)
-        self.assertIn("contact_info_availability", stats)
+        self.assertLessEqual(
+            {"extraction_levels", "data_completeness", "contact_info_availability"},
+            set(stats)
+        )
     
     def test_flatten_record(self):
         """Test record flattening for CSV export"""
@@ -255,6 +285,19 @@ class TestDataOutput(unittest.TestCase):
         self.assertIn("contact_email", flattened)
         self.assertIn("contact_phone", flattened)
         self.assertIn("tags", flattened)
+    
+    @given(_RECORDS)
+    def test_flatten_record_any_shape(self, record):
+        """Flattened records hold only strings and keep every top-level scalar/list field"""
+        flattened = self.data_output._flatten_record(record)
+        
+        self.assertTrue(all(isinstance(value, str) for value in flattened.values()))
+        for key, value in record.items():
+            if isinstance(value, dict):
+                for sub_key in value:
+                    self.assertIn(f"{key}_{sub_key}", flattened)
+            else:
+                self.assertIn(key, flattened)
 
 class TestConfig(unittest.TestCase):
     """Test cases for Config class"""
@@ -262,39 +305,67 @@ class TestConfig(unittest.TestCase):
     def test_config_values(self):
         """Test configuration values"""
         self.assertIsInstance(Config.DEFAULT_DELAY, (int, float))
-        self.assertIsInstance(Config.USER_AGENTS, list)
+        self.assertIsInstance(Config.USER_AGENTS, tuple)
         self.assertGreater(len(Config.USER_AGENTS), 0)
-        self.assertIsInstance(Config.SELECTORS, dict)
-        self.assertIsInstance(Config.TECH_PATTERNS, dict)
+        self.assertIsInstance(Config.SELECTORS, MappingProxyType)
+        self.assertIsInstance(Config.TECH_PATTERNS, MappingProxyType)
     
     def test_get_headers(self):
         """Test header generation"""
         headers = Config.get_headers()
-        self.assertIsInstance(headers, dict)
+        self.assertIsInstance(headers, MappingProxyType)
+        self.assertIs(headers, Config.get_headers())
         self.assertIn('User-Agent', headers)
         self.assertIn('Accept', headers)
     
+    @pytest.mark.selenium
     def test_selenium_options(self):
         """Test Selenium options"""
         options = Config.get_selenium_options()
         self.assertIsNotNone(options)
 
-class TestWebScrapingTool(unittest.TestCase):
-    """Test cases for the main WebScrapingTool class"""
+class TestProxyManager(unittest.TestCase):
+    """Test cases for ProxyManager health checks"""
     
     def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
-        self.tool = WebScrapingTool(use_selenium=False, output_dir=self.temp_dir)
-    
-    def tearDown(self):
-        """Clean up after tests"""
-        if self.tool:
-            self.tool.close()
+        """Set up a manager without fetching the public proxy lists"""
+        from proxy_manager import ProxyManager
+        with patch.object(ProxyManager, '_load_free_proxies'):
+            self.manager = ProxyManager()
+        self._td = tempfile.TemporaryDirectory()
+        self.addCleanup(self._td.cleanup)
+    
+    def test_loaded_low_success_rate_proxy_is_tested(self):
+        """A saved proxy with success_rate 0.5 still gets a health check request"""
+        filename = os.path.join(self._td.name, 'working_proxies.json')
+        with open(filename, 'w') as f:
+            json.dump([{'host': '10.0.0.1', 'port': 8080, 'type': 'http',
+                        'success_rate': 0.5, 'response_time': 0.2}], f)
+        self.manager.load_working_proxies(filename)
+        proxy = self.manager.proxies[0]
         
-        # Clean up temp directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        response = SimpleNamespace(status_code=200, json=lambda: {'origin': '10.0.0.1'})
+        with patch('proxy_manager.requests.get', return_value=response) as get:
+            self.assertTrue(self.manager.test_proxy(proxy))
+        get.assert_called_once()
+
+class TestWebScrapingTool(unittest.TestCase):
+    """Test cases for the main WebScrapingTool class"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the class"""
+        from main import WebScrapingTool
+        cls._td = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._td.name
+        cls.tool = WebScrapingTool(use_selenium=False, output_dir=cls.temp_dir)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after the class"""
+        if cls.tool:
+            cls.tool.close()
+        cls._td.cleanup()
     
     def test_init(self):
         """Test WebScrapingTool initialization"""
@@ -315,73 +386,89 @@ class TestWebScrapingTool(unittest.TestCase):
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete system"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Load the full tool (and pandas with it) for this class only"""
+        from main import WebScrapingTool
+        cls.tool_cls = WebScrapingTool
+    
     def setUp(self):
         """Set up integration test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+        self._td = tempfile.TemporaryDirectory()
+        self.temp_dir = self._td.name
     
     def tearDown(self):
         """Clean up after integration tests"""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self._td.cleanup()
     
-    def test_end_to_end_mock(self):
-        """Test complete end-to-end workflow with mocked data"""
-        # This test would require extensive mocking
-        # For now, just test that components can be initialized together
-        with WebScrapingTool(use_selenium=False, output_dir=self.temp_dir) as tool:
+    @pytest.fixture(autouse=True)
+    def _benchmark(self, benchmark):
+        """pytest-benchmark's fixture, made available to the unittest-style tests"""
+        self.benchmark = benchmark
+    
+    def _start_and_close_tool(self):
+        """Initialize every component together, then shut them down"""
+        with self.tool_cls(use_selenium=False, output_dir=self.temp_dir) as tool:
             self.assertIsNotNone(tool.scraper)
             self.assertIsNotNone(tool.search_discovery)
             self.assertIsNotNone(tool.data_output)
+    
+    def test_end_to_end_mock(self):
+        """Test complete end-to-end workflow with mocked data"""
+        # This test would require extensive mocking
+        # For now, just test that components can be initialized together,
+        # timing it under pytest against a saved baseline rather than a fixed limit:
+        # record with --benchmark-autosave, gate with --benchmark-compare --benchmark-compare-fail=mean:10%
+        benchmark = getattr(self, 'benchmark', None)
+        if benchmark is None:  # plain unittest run
+            self._start_and_close_tool()
+            return
+        
+        benchmark(self._start_and_close_tool)
 
-def run_tests():
-    """Run all tests"""
-    print("🧪 Running Web Scraping Tool Tests")
-    print("=" * 50)
-    
-    # Create test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_classes = [
-        TestWebScraper,
-        TestSearchDiscovery,
-        TestDataOutput,
-        TestConfig,
-        TestWebScrapingTool,
-        TestIntegration
-    ]
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        test_suite.addTests(tests)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
+def run_tests(verbose=False):
+    """Run all tests; the banner, per-test lines and summary are only printed when verbose"""
+    if verbose:
+        sys.stdout.write("🧪 Running Web Scraping Tool Tests\n" + "=" * 50 + "\n")
+    
+    failfast = bool(os.environ.get("FAILFAST"))
+    
+    # Spread the TestCase classes over worker processes when pytest-xdist is available
+    if importlib.util.find_spec('xdist'):
+        args = ['-n', 'auto', '--dist=loadgroup', '-v' if verbose else '-q', __file__]
+        return pytest.main(args + ['-x'] if failfast else args) == 0
+    
+    # conftest.py silences logging under pytest; do the same for the unittest runner
+    logging.disable(logging.CRITICAL)
+    
+    # Discover the test modules next to this file
+    test_suite = unittest.TestLoader().discover(
+        start_dir=os.path.dirname(os.path.abspath(__file__)),
+        pattern="test_*.py"
+    )
+    
+    # Run tests (set FAILFAST=1 to stop at the first failure); the runner reports tracebacks itself
+    runner = unittest.TextTestRunner(verbosity=2 if verbose else 1, failfast=failfast)
     result = runner.run(test_suite)
     
-    # Print summary
-    print("\n" + "=" * 50)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    
-    if result.failures:
-        print("\n❌ Failures:")
-        for test, traceback in result.failures:
-            print(f"  - {test}: {traceback}")
-    
-    if result.errors:
-        print("\n❌ Errors:")
-        for test, traceback in result.errors:
-            print(f"  - {test}: {traceback}")
-    
-    if result.wasSuccessful():
-        print("\n✅ All tests passed!")
-        return True
-    else:
-        print("\n❌ Some tests failed!")
-        return False
+    if verbose:
+        # Build the summary and write it in one go
+        lines = [
+            "",
+            "=" * 50,
+            f"Tests run: {result.testsRun}",
+            f"Failures: {len(result.failures)}",
+            f"Errors: {len(result.errors)}",
+        ]
+        for label, problems in (("Failures", result.failures), ("Errors", result.errors)):
+            if problems:
+                lines.append(f"\n❌ {label}:")
+                lines.extend(f"  - {test}: {traceback}" for test, traceback in problems)
+        lines.append("\n✅ All tests passed!" if result.wasSuccessful() else "\n❌ Some tests failed!")
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    return result.wasSuccessful()
 
 if __name__ == '__main__':
-    success = run_tests()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    success = run_tests(verbose='-v' in sys.argv[1:])
+    sys.exit(0 if success else 1)
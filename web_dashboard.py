@@ -4,18 +4,25 @@ Web Dashboard for Web Scraping Tool
 Flask-based interface for monitoring and controlling scraping operations
 """
 
-from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
+from flask import Flask, Response, request, send_file, flash, redirect, url_for
 from flask_socketio import SocketIO, emit
+import asyncio
+import atexit
+import gzip
+import hashlib
+import importlib.util
 import json
 import os
 import logging
 import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional
 import uuid
-from dataclasses import dataclass, asdict
-from enum import Enum
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 
 from main import WebScrapingTool
 from data_output import DataOutput
@@ -29,15 +36,113 @@ logger = logging.getLogger(__name__)
 # Flask app setup
 app = Flask(__name__)
 app.secret_key = 'web_scraping_tool_secret_key_2024'
-socketio = SocketIO(app, cors_allowed_origins="*")
+# Behind nginx/Apache, let the front server send downloads (X-Sendfile)
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE') == '1'
 
-class JobStatus(Enum):
+class _SocketJSON:
+    """json stand-in for Socket.IO: frames are encoded with orjson (datetimes included)"""
+    
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+# Threading mode is pinned: jobs run on a real thread with its own asyncio loop,
+# which eventlet/gevent (auto-selected when installed) would need monkey-patching
+# for. WebSockets come from simple-websocket; in production serve with
+# `gunicorn -w 1 --threads 100 web_dashboard:app` (one worker: job state is in memory).
+# simple-websocket negotiates permessage-deflate itself; long-polling payloads
+# are gzipped from SOCKETIO_COMPRESSION_THRESHOLD bytes
+SOCKETIO_COMPRESSION_THRESHOLD = 512
+socketio = SocketIO(app, cors_allowed_origins="*", json=_SocketJSON, async_mode='threading',
+                    http_compression=True, compression_threshold=SOCKETIO_COMPRESSION_THRESHOLD)
+
+# Compress JSON/HTML responses (br/gzip, per Accept-Encoding) when Flask-Compress is installed
+if importlib.util.find_spec('flask_compress'):
+    from flask_compress import Compress
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    app.config['COMPRESS_LEVEL'] = 6
+    Compress(app)
+
+# The dashboard page has no template variables: read it once and serve the
+# bytes, gzipped up front for clients that accept it
+with open(os.path.join(app.root_path, 'templates', 'index.html'), 'rb') as f:
+    _INDEX_BYTES = f.read()
+_INDEX_GZIP = gzip.compress(_INDEX_BYTES, 9)
+_INDEX_ETAG = hashlib.md5(_INDEX_BYTES).hexdigest()
+
+# Progress events are queued and sent to clients as one batch per interval,
+# or as soon as PROGRESS_BATCH_MAX are waiting
+PROGRESS_FLUSH_INTERVAL = 0.05  # seconds
+PROGRESS_BATCH_MAX = 140
+
+# Jobs beyond this many wait for a free slot (each may hold a Selenium driver)
+MAX_CONCURRENT_JOBS = os.cpu_count() or 4
+
+# System stats are reused for STATS_CACHE_TTL seconds, checked every
+# LIVE_STATS_INTERVAL seconds and pushed to all clients when they change
+STATS_CACHE_TTL = 2
+LIVE_STATS_INTERVAL = 1
+
+# Job history is appended, one JSON object per line, at most once per
+# HISTORY_SAVE_DELAY seconds (failures are written at once)
+HISTORY_FILE = 'job_history.jsonl'
+LEGACY_HISTORY_FILE = 'job_history.json'
+HISTORY_SIZE = 50  # jobs loaded at startup; the file is compacted to these
+HISTORY_SAVE_DELAY = 5
+
+def fast_jsonify(obj, status: int = 200) -> Response:
+    """JSON response serialized with orjson (dataclasses and datetimes handled natively)"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+def not_modified(etag: str) -> Optional[Response]:
+    """A 304 response if the request's If-None-Match already has etag, else None"""
+    if etag in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
+def etag_jsonify(obj, etag: str) -> Response:
+    """fast_jsonify with an ETag; browsers revalidate it on every fetch (no-cache)"""
+    response = fast_jsonify(obj)
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+# Serialized bodies of cached API responses: key -> (monotonic time, bytes, etag)
+_json_cache: Dict[str, tuple] = {}
+
+def cached_jsonify(key: str, ttl: float, build) -> Response:
+    """fast_jsonify for payloads that may be up to ttl seconds old; build() runs and is serialized once per ttl"""
+    now = time.monotonic()
+    entry = _json_cache.get(key)
+    if entry is None or now - entry[0] >= ttl:
+        body = orjson.dumps(build())
+        entry = (now, body, hashlib.md5(body).hexdigest())
+        _json_cache[key] = entry
+    
+    response = not_modified(entry[2])
+    if response is None:
+        response = Response(entry[1], mimetype='application/json')
+        response.set_etag(entry[2])
+    response.cache_control.no_cache = True
+    return response
+
+class JobStatus:
+    """Job states; plain strings, so they serialize and compare without Enum wrapping"""
     PENDING = "pending"
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
 
+# States a job never leaves
+FINISHED_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED})
+
 @dataclass
 class ScrapingJob:
     id: str
@@ -45,7 +150,7 @@ class ScrapingJob:
     urls: List[str]
     extraction_level: str
     output_format: str
-    status: JobStatus
+    status: str  # a JobStatus value
     progress: float
     created_at: datetime
     started_at: Optional[datetime] = None
@@ -53,13 +158,53 @@ class ScrapingJob:
     results_count: int = 0
     error_message: Optional[str] = None
     output_file: Optional[str] = None
+    # Serialized form, reused until a field changes (progress is patched in place)
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Jobs loaded from history carry ISO strings; parse each date once here
+        for name in ('created_at', 'started_at', 'completed_at'):
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, datetime.fromisoformat(value))
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in JOB_FIELDS:
+            state = self.__dict__
+            state['_version'] = state.get('_version', 0) + 1
+            cached = state.get('_cached_dict')
+            if cached is not None:
+                if name == 'progress':
+                    cached['progress'] = value
+                else:
+                    state['_cached_dict'] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict of the job's fields for orjson (dates left as datetime), built once per change"""
+        cached = self._cached_dict
+        if cached is None:
+            version = self._version
+            cached = {name: getattr(self, name) for name in JOB_FIELDS}
+            cached['urls'] = list(cached['urls'])
+            # Don't keep it if a field changed while it was being built
+            if self._version == version:
+                self._cached_dict = cached
+        return cached
+
+# Public job fields, in declaration order
+JOB_FIELDS = tuple(f.name for f in fields(ScrapingJob) if f.init)
 
 class WebDashboard:
     """Web dashboard controller"""
     
     def __init__(self):
+        # active_jobs is copy-on-write: writers swap in a new dict under _jobs_lock,
+        # readers just use whichever snapshot they load, without locking
         self.active_jobs: Dict[str, ScrapingJob] = {}
-        self.completed_jobs: List[ScrapingJob] = []
+        self._jobs_lock = threading.Lock()
+        self.completed_jobs: Deque[ScrapingJob] = deque(maxlen=100)  # oldest evicted on append
         self.proxy_manager = ProxyManager()
         self.api_integration = APIIntegration()
         self.job_history = []
@@ -71,6 +216,35 @@ class WebDashboard:
             'uptime_start': datetime.now()
         }
         
+        # Queued job_progress events, sent by a background flusher
+        self._pending_emits: List[Dict[str, Any]] = []
+        self._emit_lock = threading.Lock()
+        self._flusher = None
+        
+        # (monotonic time, stats) of the last get_system_stats computation
+        self._stats_cache = (0.0, None)
+        self._stats_broadcaster = None
+        
+        # Jobs run as asyncio tasks on one background event loop (uvloop's when
+        # installed); the blocking scraping calls are handed to the loop's
+        # executor, sized to the job limit
+        if importlib.util.find_spec('uvloop'):
+            import uvloop
+            self._loop = uvloop.new_event_loop()
+        else:
+            self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS, thread_name_prefix='scrape'))
+        self._job_slots: Optional[asyncio.Semaphore] = None  # created by the first _execute_job
+        threading.Thread(target=self._loop.run_forever, name='dashboard-jobs', daemon=True).start()
+        
+        # Debounced job history writer; whatever is pending is written on exit
+        self._history_dirty = threading.Event()
+        self._history_lock = threading.Lock()  # guards _unsaved_jobs and the file
+        self._unsaved_jobs: List[ScrapingJob] = []
+        threading.Thread(target=self._history_writer, name='dashboard-history', daemon=True).start()
+        atexit.register(self._flush_job_history)
+        
         # Load job history
         self._load_job_history()
     
@@ -90,78 +264,90 @@ class WebDashboard:
             created_at=datetime.now()
         )
         
-        self.active_jobs[job_id] = job
-        self.system_stats['total_jobs'] += 1
+        with self._jobs_lock:
+            self.active_jobs = {**self.active_jobs, job_id: job}
+            self.system_stats['total_jobs'] += 1
         
+        self._emit_jobs_delta(job)
         logger.info(f"Created job {job_id}: {query or f'{len(urls)} URLs'}")
         return job_id
     
     def start_job(self, job_id: str):
         """Start a scraping job"""
-        if job_id not in self.active_jobs:
+        job = self.active_jobs.get(job_id)
+        if job is None:
             raise ValueError(f"Job {job_id} not found")
         
-        job = self.active_jobs[job_id]
         job.status = JobStatus.RUNNING
         job.started_at = datetime.now()
+        self._emit_jobs_delta(job)
         
-        # Start job in background thread
-        thread = threading.Thread(target=self._execute_job, args=(job_id,))
-        thread.daemon = True
-        thread.start()
+        # Schedule the job on the dashboard's event loop
+        asyncio.run_coroutine_threadsafe(self._execute_job(job_id), self._loop)
         
         logger.info(f"Started job {job_id}")
     
-    def _execute_job(self, job_id: str):
+    async def _execute_job(self, job_id: str):
         """Execute a scraping job"""
         job = self.active_jobs[job_id]
         
+        if self._job_slots is None:
+            # Created on the job loop itself; on Python < 3.10 a semaphore binds to the
+            # loop current where it was constructed
+            self._job_slots = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+        
         try:
-            # Initialize scraping tool
-            tool = WebScrapingTool(use_selenium=True, output_dir="dashboard_output")
-            
-            # Emit progress updates
-            self._emit_job_progress(job_id, 10, "Initializing scraping tool...")
-            
-            if job.query:
-                # Search-based scraping
-                self._emit_job_progress(job_id, 20, "Discovering companies...")
-                result = tool.scrape_from_query(
-                    query=job.query,
-                    max_results=20,
-                    extraction_level=job.extraction_level,
-                    output_format=job.output_format,
-                    output_filename=f"job_{job_id}"
-                )
-            else:
-                # URL-based scraping
-                self._emit_job_progress(job_id, 20, "Starting URL scraping...")
-                result = tool.scrape_from_urls(
-                    urls=job.urls,
-                    extraction_level=job.extraction_level,
-                    output_format=job.output_format,
-                    output_filename=f"job_{job_id}"
-                )
-            
-            self._emit_job_progress(job_id, 90, "Finalizing results...")
-            
-            if result.get('success'):
-                job.status = JobStatus.COMPLETED
-                job.results_count = len(result.get('results', []))
-                job.output_file = result.get('saved_file')
-                self.system_stats['successful_jobs'] += 1
-                self.system_stats['total_companies_scraped'] += job.results_count
+            async with self._job_slots:  # at most MAX_CONCURRENT_JOBS scrape at once
+                if job.status == JobStatus.CANCELLED:
+                    return  # cancelled while queued; still recorded below
+                    
+                # Initialize scraping tool
+                tool = await asyncio.to_thread(WebScrapingTool, use_selenium=True, output_dir="dashboard_output")
                 
-                self._emit_job_progress(job_id, 100, "Job completed successfully!")
-            else:
-                job.status = JobStatus.FAILED
-                job.error_message = result.get('error', 'Unknown error')
-                self.system_stats['failed_jobs'] += 1
+                # Emit progress updates
+                self._emit_job_progress(job_id, 10, "Initializing scraping tool...")
+                
+                if job.query:
+                    # Search-based scraping
+                    self._emit_job_progress(job_id, 20, "Discovering companies...")
+                    result = await asyncio.to_thread(
+                        tool.scrape_from_query,
+                        query=job.query,
+                        max_results=20,
+                        extraction_level=job.extraction_level,
+                        output_format=job.output_format,
+                        output_filename=f"job_{job_id}"
+                    )
+                else:
+                    # URL-based scraping
+                    self._emit_job_progress(job_id, 20, "Starting URL scraping...")
+                    result = await asyncio.to_thread(
+                        tool.scrape_from_urls,
+                        urls=job.urls,
+                        extraction_level=job.extraction_level,
+                        output_format=job.output_format,
+                        output_filename=f"job_{job_id}"
+                    )
+                
+                self._emit_job_progress(job_id, 90, "Finalizing results...")
+                
+                if result.get('success'):
+                    job.status = JobStatus.COMPLETED
+                    job.results_count = len(result.get('results', []))
+                    job.output_file = result.get('saved_file')
+                    self.system_stats['successful_jobs'] += 1
+                    self.system_stats['total_companies_scraped'] += job.results_count
+                    
+                    self._emit_job_progress(job_id, 100, "Job completed successfully!")
+                else:
+                    job.status = JobStatus.FAILED
+                    job.error_message = result.get('error', 'Unknown error')
+                    self.system_stats['failed_jobs'] += 1
+                    
+                    self._emit_job_progress(job_id, 100, f"Job failed: {job.error_message}")
+                
+                await asyncio.to_thread(tool.close)
                 
-                self._emit_job_progress(job_id, 100, f"Job failed: {job.error_message}")
-            
-            tool.close()
-            
         except Exception as e:
             job.status = JobStatus.FAILED
             job.error_message = str(e)
@@ -174,59 +360,106 @@ class WebDashboard:
             job.completed_at = datetime.now()
             
             # Move to completed jobs
-            if job_id in self.active_jobs:
-                completed_job = self.active_jobs.pop(job_id)
+            with self._jobs_lock:
+                active_jobs = dict(self.active_jobs)
+                completed_job = active_jobs.pop(job_id, None)
+                self.active_jobs = active_jobs
+            
+            if completed_job is not None:
                 self.completed_jobs.append(completed_job)
                 self.job_history.append(completed_job)
+                self._emit_jobs_delta(completed_job)
+                with self._history_lock:
+                    self._unsaved_jobs.append(completed_job)
                 
-                # Keep only last 100 completed jobs
-                if len(self.completed_jobs) > 100:
-                    self.completed_jobs.pop(0)
-                
-                self._save_job_history()
+                if job.status in (JobStatus.FAILED, JobStatus.CANCELLED):
+                    self._write_job_history()
+                else:
+                    self._save_job_history()
     
     def _emit_job_progress(self, job_id: str, progress: float, message: str):
-        """Emit job progress to connected clients"""
-        if job_id in self.active_jobs:
-            self.active_jobs[job_id].progress = progress
+        """Queue a job progress event for connected clients"""
+        job = self.active_jobs.get(job_id)
+        if job is not None:
+            job.progress = progress
             
-            socketio.emit('job_progress', {
-                'job_id': job_id,
-                'progress': progress,
-                'message': message,
-                'timestamp': datetime.now().isoformat()
-            })
+            with self._emit_lock:
+                self._pending_emits.append({
+                    'job_id': job_id,
+                    'progress': progress,
+                    'message': message,
+                    'timestamp': time.time()  # epoch seconds; no string formatting per tick
+                })
+                batch_full = len(self._pending_emits) >= PROGRESS_BATCH_MAX
+                if self._flusher is None:
+                    self._flusher = socketio.start_background_task(self._flush_emits_loop)
+            
+            # Completion/failure (or a full batch) goes out right away instead of waiting for the next flush
+            if progress >= 100 or batch_full:
+                self._flush_emits()
+    
+    def _emit_jobs_delta(self, *jobs: ScrapingJob):
+        """Push the jobs whose state just changed to all clients"""
+        socketio.emit('jobs_delta', [job.to_dict() for job in jobs])
+    
+    def _flush_emits(self):
+        """Send all queued progress events as one job_progress_batch message"""
+        with self._emit_lock:  # held while emitting so batches stay in order
+            if self._pending_emits:
+                batch, self._pending_emits = self._pending_emits, []
+                socketio.emit('job_progress_batch', batch)
+    
+    def _flush_emits_loop(self):
+        """Background task: flush queued progress events every PROGRESS_FLUSH_INTERVAL"""
+        while True:
+            socketio.sleep(PROGRESS_FLUSH_INTERVAL)
+            self._flush_emits()
     
     def cancel_job(self, job_id: str):
         """Cancel a running job"""
-        if job_id in self.active_jobs:
-            job = self.active_jobs[job_id]
+        job = self.active_jobs.get(job_id)
+        if job is not None:
             if job.status == JobStatus.RUNNING:
                 job.status = JobStatus.CANCELLED
                 job.completed_at = datetime.now()
+                self._emit_jobs_delta(job)
                 logger.info(f"Cancelled job {job_id}")
     
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get job status"""
-        if job_id in self.active_jobs:
-            job = self.active_jobs[job_id]
-            return asdict(job)
+        job = self.active_jobs.get(job_id)
+        if job is not None:
+            return job.to_dict()
         
-        for job in self.completed_jobs:
+        for job in tuple(self.completed_jobs):  # snapshot; the job loop appends concurrently
             if job.id == job_id:
-                return asdict(job)
+                return job.to_dict()
         
         return None
     
+    def jobs_etag(self) -> str:
+        """ETag for get_all_jobs: changes whenever a listed job changes or the lists do"""
+        recent = tuple(self.completed_jobs)[-10:]
+        versions = [(job.id, job._version) for job in self.active_jobs.values()]
+        versions.append(None)  # separates active from completed
+        versions.extend((job.id, job._version) for job in recent)
+        return hashlib.md5(repr(versions).encode()).hexdigest()
+    
     def get_all_jobs(self) -> Dict[str, Any]:
         """Get all jobs"""
+        recent = tuple(self.completed_jobs)[-10:]  # Last 10, from a snapshot
         return {
-            'active_jobs': [asdict(job) for job in self.active_jobs.values()],
-            'completed_jobs': [asdict(job) for job in self.completed_jobs[-10:]]  # Last 10
+            'active_jobs': [job.to_dict() for job in self.active_jobs.values()],
+            'completed_jobs': [job.to_dict() for job in recent]
         }
     
     def get_system_stats(self) -> Dict[str, Any]:
-        """Get system statistics"""
+        """Get system statistics (recomputed at most every STATS_CACHE_TTL seconds)"""
+        now = time.monotonic()
+        cached_at, stats = self._stats_cache
+        if stats is not None and now - cached_at < STATS_CACHE_TTL:
+            return stats
+        
         uptime = datetime.now() - self.system_stats['uptime_start']
         
         stats = self.system_stats.copy()
@@ -234,50 +467,97 @@ class WebDashboard:
         stats['proxy_stats'] = self.proxy_manager.get_proxy_stats()
         stats['api_status'] = self.api_integration.get_api_status()
         
+        self._stats_cache = (now, stats)
         return stats
     
+    def start_live_stats(self):
+        """Start the live_stats broadcaster if it isn't running yet"""
+        with self._emit_lock:
+            if self._stats_broadcaster is None:
+                self._stats_broadcaster = socketio.start_background_task(self._broadcast_stats_loop)
+    
+    def _broadcast_stats_loop(self):
+        """Background task: check the stats every LIVE_STATS_INTERVAL and send them to all clients when they change"""
+        last_sent = None
+        while True:
+            stats = self.get_system_stats()
+            # Uptime only counts as a change at the page's 0.1h resolution
+            snapshot = {**stats, 'uptime_hours': round(stats['uptime_hours'], 1)}
+            if snapshot != last_sent:
+                socketio.emit('live_stats', stats)
+                last_sent = snapshot
+            socketio.sleep(LIVE_STATS_INTERVAL)
+    
     def _save_job_history(self):
-        """Save job history to file"""
-        try:
-            history_data = []
-            for job in self.job_history[-50:]:  # Save last 50 jobs
-                job_dict = asdict(job)
-                # Convert datetime objects to strings
-                for key, value in job_dict.items():
-                    if isinstance(value, datetime):
-                        job_dict[key] = value.isoformat()
-                    elif isinstance(value, JobStatus):
-                        job_dict[key] = value.value
-                history_data.append(job_dict)
-            
-            with open('job_history.json', 'w') as f:
-                json.dump(history_data, f, indent=2)
-        
-        except Exception as e:
-            logger.error(f"Error saving job history: {e}")
+        """Mark the job history for saving; the writer thread coalesces saves"""
+        self._history_dirty.set()
+    
+    def _history_writer(self):
+        """Background thread: write the job history HISTORY_SAVE_DELAY after it changes"""
+        while True:
+            self._history_dirty.wait()
+            time.sleep(HISTORY_SAVE_DELAY)
+            self._flush_job_history()
+    
+    def _flush_job_history(self):
+        """Write the job history now if a save is pending"""
+        if self._history_dirty.is_set():
+            self._history_dirty.clear()
+            self._write_job_history()
+    
+    def _write_job_history(self):
+        """Append the jobs finished since the last write to the history file"""
+        with self._history_lock:
+            jobs, self._unsaved_jobs = self._unsaved_jobs, []
+            if not jobs:
+                return
+            try:
+                with open(HISTORY_FILE, 'ab') as f:
+                    # orjson walks the dataclass itself (datetimes included; _private fields skipped)
+                    f.write(b''.join(orjson.dumps(job) + b'\n' for job in jobs))
+            except Exception as e:
+                logger.error(f"Error saving job history: {e}")
     
     def _load_job_history(self):
-        """Load job history from file"""
+        """Load the last HISTORY_SIZE jobs from the history file"""
         try:
-            if os.path.exists('job_history.json'):
-                with open('job_history.json', 'r') as f:
-                    history_data = json.load(f)
+            legacy = False
+            if os.path.exists(HISTORY_FILE):
+                # Only the tail is kept while reading
+                lines = deque(maxlen=HISTORY_SIZE)
+                total = 0
+                with open(HISTORY_FILE, 'rb') as f:
+                    for line in f:
+                        if line.strip():
+                            lines.append(line)
+                            total += 1
+                history_data = map(orjson.loads, lines)  # parsed one at a time below
                 
-                for job_dict in history_data:
-                    # Convert string dates back to datetime
-                    for key, value in job_dict.items():
-                        if key.endswith('_at') and value:
-                            job_dict[key] = datetime.fromisoformat(value)
-                        elif key == 'status':
-                            job_dict[key] = JobStatus(value)
-                    
-                    job = ScrapingJob(**job_dict)
-                    self.job_history.append(job)
-                    
-                    if job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
-                        self.completed_jobs.append(job)
+                # Compact the file down to the entries kept once it has grown past them
+                if total > HISTORY_SIZE:
+                    with open(HISTORY_FILE + '.tmp', 'wb') as f:
+                        f.writelines(lines)
+                    os.replace(HISTORY_FILE + '.tmp', HISTORY_FILE)
+            elif os.path.exists(LEGACY_HISTORY_FILE):
+                with open(LEGACY_HISTORY_FILE, 'r') as f:
+                    history_data = json.load(f)[-HISTORY_SIZE:]
+                legacy = True
+            else:
+                return
+            
+            for job_dict in history_data:
+                job = ScrapingJob(**job_dict)
+                self.job_history.append(job)
                 
-                logger.info(f"Loaded {len(self.job_history)} jobs from history")
+                if job.status in FINISHED_STATUSES:
+                    self.completed_jobs.append(job)
+            
+            # Carry an old job_history.json over into the JSONL file
+            if legacy:
+                self._unsaved_jobs.extend(self.job_history)
+                self._write_job_history()
+            
+            logger.info(f"Loaded {len(self.job_history)} jobs from history")
         
         except Exception as e:
             logger.error(f"Error loading job history: {e}")
@@ -289,12 +569,21 @@ dashboard = WebDashboard()
 @app.route('/')
 def index():
     """Main dashboard page"""
-    return render_template('index.html')
+    if request.accept_encodings.quality('gzip'):
+        response = Response(_INDEX_GZIP, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(_INDEX_ETAG + '-gzip')
+    else:
+        response = Response(_INDEX_BYTES, mimetype='text/html')
+        response.set_etag(_INDEX_ETAG)
+    response.vary.add('Accept-Encoding')
+    return response.make_conditional(request)  # 304 when the browser's copy is current
 
 @app.route('/api/jobs', methods=['GET'])
 def get_jobs():
     """Get all jobs API"""
-    return jsonify(dashboard.get_all_jobs())
+    etag = dashboard.jobs_etag()
+    return not_modified(etag) or etag_jsonify(dashboard.get_all_jobs(), etag)
 
 @app.route('/api/jobs', methods=['POST'])
 def create_job():
@@ -307,7 +596,7 @@ def create_job():
     output_format = data.get('output_format', 'json')
     
     if not query and not urls:
-        return jsonify({'error': 'Either query or URLs must be provided'}), 400
+        return fast_jsonify({'error': 'Either query or URLs must be provided'}, 400)
     
     job_id = dashboard.create_job(
         query=query,
@@ -316,68 +605,72 @@ def create_job():
         output_format=output_format
     )
     
-    return jsonify({'job_id': job_id})
+    return fast_jsonify({'job_id': job_id})
 
 @app.route('/api/jobs/<job_id>/start', methods=['POST'])
 def start_job(job_id):
     """Start job API"""
     try:
         dashboard.start_job(job_id)
-        return jsonify({'status': 'started'})
+        return fast_jsonify({'status': 'started'})
     except ValueError as e:
-        return jsonify({'error': str(e)}), 404
+        return fast_jsonify({'error': str(e)}, 404)
 
 @app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
 def cancel_job(job_id):
     """Cancel job API"""
     dashboard.cancel_job(job_id)
-    return jsonify({'status': 'cancelled'})
+    return fast_jsonify({'status': 'cancelled'})
 
 @app.route('/api/jobs/<job_id>', methods=['GET'])
 def get_job_status(job_id):
     """Get job status API"""
     status = dashboard.get_job_status(job_id)
     if status:
-        return jsonify(status)
-    return jsonify({'error': 'Job not found'}), 404
+        return fast_jsonify(status)
+    return fast_jsonify({'error': 'Job not found'}, 404)
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """Get system statistics API"""
-    return jsonify(dashboard.get_system_stats())
+    return cached_jsonify('stats', STATS_CACHE_TTL, dashboard.get_system_stats)
 
 @app.route('/api/download/<job_id>')
 def download_results(job_id):
     """Download job results"""
     job_status = dashboard.get_job_status(job_id)
     if not job_status or not job_status.get('output_file'):
-        return jsonify({'error': 'No results available'}), 404
+        return fast_jsonify({'error': 'No results available'}, 404)
     
     output_file = job_status['output_file']
     if os.path.exists(output_file):
-        return send_file(output_file, as_attachment=True)
+        # Absolute path: relative ones are resolved against the app root, not the cwd.
+        # Served through wsgi.file_wrapper (sendfile under gunicorn), with Range/304 support
+        return send_file(os.path.abspath(output_file), as_attachment=True, conditional=True)
     
-    return jsonify({'error': 'Results file not found'}), 404
+    return fast_jsonify({'error': 'Results file not found'}, 404)
 
 @app.route('/api/proxy/test', methods=['POST'])
 def test_proxies():
     """Test proxy connections"""
     try:
         results = dashboard.proxy_manager.test_all_proxies()
-        return jsonify(results)
+        return fast_jsonify(results)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return fast_jsonify({'error': str(e)}, 500)
 
 @app.route('/api/proxy/stats', methods=['GET'])
 def get_proxy_stats():
     """Get proxy statistics"""
-    return jsonify(dashboard.proxy_manager.get_proxy_stats())
+    return fast_jsonify(dashboard.proxy_manager.get_proxy_stats())
 
 # Socket.IO events
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection"""
     emit('connected', {'status': 'Connected to Web Scraping Dashboard'})
+    emit('live_stats', dashboard.get_system_stats())  # later ones only on change
+    dashboard.start_live_stats()
 
 @socketio.on('disconnect')
 def handle_disconnect():
@@ -390,425 +683,15 @@ def handle_live_stats():
     stats = dashboard.get_system_stats()
     emit('live_stats', stats)
 
-# Template creation functions
-def create_templates():
-    """Create HTML templates for the dashboard"""
-    
-    # Create templates directory
-    os.makedirs('templates', exist_ok=True)
-    
-    # Main template
-    index_html = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Web Scraping Tool Dashboard</title>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.0.1/socket.io.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; background: #f5f5f5; }
-        .header { background: #2c3e50; color: white; padding: 1rem; text-align: center; }
-        .container { max-width: 1200px; margin: 0 auto; padding: 2rem; }
-        .grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 2rem; }
-        .card { background: white; border-radius: 8px; padding: 1.5rem; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-        .card h2 { color: #2c3e50; margin-bottom: 1rem; border-bottom: 2px solid #3498db; padding-bottom: 0.5rem; }
-        .form-group { margin-bottom: 1rem; }
-        .form-group label { display: block; margin-bottom: 0.5rem; font-weight: bold; }
-        .form-group input, .form-group select, .form-group textarea { width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 4px; }
-        .btn { background: #3498db; color: white; padding: 0.75rem 1.5rem; border: none; border-radius: 4px; cursor: pointer; }
-        .btn:hover { background: #2980b9; }
-        .btn-success { background: #27ae60; }
-        .btn-danger { background: #e74c3c; }
-        .btn-warning { background: #f39c12; }
-        .status { padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.8rem; font-weight: bold; }
-        .status-pending { background: #f39c12; color: white; }
-        .status-running { background: #3498db; color: white; }
-        .status-completed { background: #27ae60; color: white; }
-        .status-failed { background: #e74c3c; color: white; }
-        .progress-bar { width: 100%; height: 20px; background: #ecf0f1; border-radius: 10px; overflow: hidden; }
-        .progress-fill { height: 100%; background: #3498db; transition: width 0.3s ease; }
-        .job-item { border: 1px solid #ecf0f1; border-radius: 6px; padding: 1rem; margin-bottom: 1rem; }
-        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 1rem; }
-        .stat-item { text-align: center; padding: 1rem; background: #ecf0f1; border-radius: 6px; }
-        .stat-number { font-size: 2rem; font-weight: bold; color: #2c3e50; }
-        .stat-label { font-size: 0.9rem; color: #7f8c8d; }
-        .log-container { max-height: 300px; overflow-y: auto; background: #2c3e50; color: #ecf0f1; padding: 1rem; border-radius: 6px; font-family: monospace; }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🕷️ Web Scraping Tool Dashboard</h1>
-        <p>Monitor and control your scraping operations</p>
-    </div>
-
-    <div class="container">
-        <div class="grid">
-            <!-- Create New Job -->
-            <div class="card">
-                <h2>Create New Job</h2>
-                <form id="job-form">
-                    <div class="form-group">
-                        <label for="job-type">Job Type:</label>
-                        <select id="job-type" onchange="toggleJobType()">
-                            <option value="search">Search Query</option>
-                            <option value="urls">Direct URLs</option>
-                        </select>
-                    </div>
-                    
-                    <div class="form-group" id="query-group">
-                        <label for="query">Search Query:</label>
-                        <input type="text" id="query" placeholder="e.g., AI startups in Silicon Valley">
-                    </div>
-                    
-                    <div class="form-group" id="urls-group" style="display: none;">
-                        <label for="urls">URLs (one per line):</label>
-                        <textarea id="urls" rows="4" placeholder="https://example.com\\nhttps://company.com"></textarea>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label for="extraction-level">Extraction Level:</label>
-                        <select id="extraction-level">
-                            <option value="basic">Basic</option>
-                            <option value="medium">Medium</option>
-                            <option value="advanced">Advanced</option>
-                        </select>
-                    </div>
-                    
-                    <div class="form-group">
-                        <label for="output-format">Output Format:</label>
-                        <select id="output-format">
-                            <option value="json">JSON</option>
-                            <option value="csv">CSV</option>
-                            <option value="xlsx">Excel</option>
-                        </select>
-                    </div>
-                    
-                    <button type="submit" class="btn">Create Job</button>
-                </form>
-            </div>
-
-            <!-- System Statistics -->
-            <div class="card">
-                <h2>System Statistics</h2>
-                <div class="stats-grid" id="stats-grid">
-                    <!-- Stats will be populated by JavaScript -->
-                </div>
-            </div>
-
-            <!-- Active Jobs -->
-            <div class="card">
-                <h2>Active Jobs</h2>
-                <div id="active-jobs">
-                    <p>No active jobs</p>
-                </div>
-            </div>
-
-            <!-- Recent Jobs -->
-            <div class="card">
-                <h2>Recent Jobs</h2>
-                <div id="recent-jobs">
-                    <p>No recent jobs</p>
-                </div>
-            </div>
-
-            <!-- Live Log -->
-            <div class="card">
-                <h2>Live Log</h2>
-                <div class="log-container" id="live-log">
-                    <div>Dashboard initialized...</div>
-                </div>
-            </div>
-
-            <!-- Proxy Status -->
-            <div class="card">
-                <h2>Proxy Status</h2>
-                <div id="proxy-status">
-                    <button class="btn btn-warning" onclick="testProxies()">Test Proxies</button>
-                    <div id="proxy-results"></div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // Socket.IO connection
-        const socket = io();
-        
-        // Job form handling
-        document.getElementById('job-form').addEventListener('submit', async (e) => {
-            e.preventDefault();
-            
-            const jobType = document.getElementById('job-type').value;
-            const query = document.getElementById('query').value;
-            const urlsText = document.getElementById('urls').value;
-            const extractionLevel = document.getElementById('extraction-level').value;
-            const outputFormat = document.getElementById('output-format').value;
-            
-            const data = {
-                extraction_level: extractionLevel,
-                output_format: outputFormat
-            };
-            
-            if (jobType === 'search') {
-                data.query = query;
-            } else {
-                data.urls = urlsText.split('\\n').filter(url => url.trim());
-            }
-            
-            try {
-                const response = await fetch('/api/jobs', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify(data)
-                });
-                
-                const result = await response.json();
-                
-                if (response.ok) {
-                    addToLog(`Created job: ${result.job_id}`);
-                    // Auto-start the job
-                    startJob(result.job_id);
-                    // Reset form
-                    document.getElementById('job-form').reset();
-                } else {
-                    addToLog(`Error: ${result.error}`);
-                }
-            } catch (error) {
-                addToLog(`Error creating job: ${error.message}`);
-            }
-        });
-        
-        // Job type toggle
-        function toggleJobType() {
-            const jobType = document.getElementById('job-type').value;
-            const queryGroup = document.getElementById('query-group');
-            const urlsGroup = document.getElementById('urls-group');
-            
-            if (jobType === 'search') {
-                queryGroup.style.display = 'block';
-                urlsGroup.style.display = 'none';
-            } else {
-                queryGroup.style.display = 'none';
-                urlsGroup.style.display = 'block';
-            }
-        }
-        
-        // Start job
-        async function startJob(jobId) {
-            try {
-                const response = await fetch(`/api/jobs/${jobId}/start`, { method: 'POST' });
-                const result = await response.json();
-                
-                if (response.ok) {
-                    addToLog(`Started job: ${jobId}`);
-                } else {
-                    addToLog(`Error starting job: ${result.error}`);
-                }
-            } catch (error) {
-                addToLog(`Error starting job: ${error.message}`);
-            }
-        }
-        
-        // Cancel job
-        async function cancelJob(jobId) {
-            try {
-                const response = await fetch(`/api/jobs/${jobId}/cancel`, { method: 'POST' });
-                const result = await response.json();
-                
-                if (response.ok) {
-                    addToLog(`Cancelled job: ${jobId}`);
-                } else {
-                    addToLog(`Error cancelling job: ${result.error}`);
-                }
-            } catch (error) {
-                addToLog(`Error cancelling job: ${error.message}`);
-            }
-        }
-        
-        // Download results
-        function downloadResults(jobId) {
-            window.open(`/api/download/${jobId}`, '_blank');
-        }
-        
-        // Test proxies
-        async function testProxies() {
-            addToLog('Testing proxies...');
-            document.getElementById('proxy-results').innerHTML = '<p>Testing proxies...</p>';
-            
-            try {
-                const response = await fetch('/api/proxy/test', { method: 'POST' });
-                const result = await response.json();
-                
-                if (response.ok) {
-                    const html = `
-                        <p>Working: ${result.working_proxies}, Failed: ${result.failed_proxies}</p>
-                        <details>
-                            <summary>Detailed Results</summary>
-                            <div style="max-height: 200px; overflow-y: auto;">
-                                ${result.test_results.map(r => 
-                                    `<div>${r.proxy} - ${r.working ? '✅' : '❌'} (${r.response_time ? r.response_time.toFixed(2) + 's' : 'N/A'})</div>`
-                                ).join('')}
-                            </div>
-                        </details>
-                    `;
-                    document.getElementById('proxy-results').innerHTML = html;
-                    addToLog(`Proxy test completed: ${result.working_proxies} working`);
-                } else {
-                    addToLog(`Proxy test error: ${result.error}`);
-                }
-            } catch (error) {
-                addToLog(`Error testing proxies: ${error.message}`);
-            }
-        }
-        
-        // Add message to log
-        function addToLog(message) {
-            const log = document.getElementById('live-log');
-            const timestamp = new Date().toLocaleTimeString();
-            const div = document.createElement('div');
-            div.textContent = `[${timestamp}] ${message}`;
-            log.appendChild(div);
-            log.scrollTop = log.scrollHeight;
-        }
-        
-        // Update jobs display
-        async function updateJobs() {
-            try {
-                const response = await fetch('/api/jobs');
-                const data = await response.json();
-                
-                // Update active jobs
-                const activeJobsDiv = document.getElementById('active-jobs');
-                if (data.active_jobs.length === 0) {
-                    activeJobsDiv.innerHTML = '<p>No active jobs</p>';
-                } else {
-                    activeJobsDiv.innerHTML = data.active_jobs.map(job => `
-                        <div class="job-item">
-                            <div style="display: flex; justify-content: between; align-items: center; margin-bottom: 0.5rem;">
-                                <strong>${job.query || 'URL Scraping'}</strong>
-                                <span class="status status-${job.status}">${job.status}</span>
-                            </div>
-                            <div class="progress-bar">
-                                <div class="progress-fill" style="width: ${job.progress}%"></div>
-                            </div>
-                            <div style="margin-top: 0.5rem; font-size: 0.9rem;">
-                                Progress: ${job.progress.toFixed(1)}% | Level: ${job.extraction_level}
-                            </div>
-                            <div style="margin-top: 0.5rem;">
-                                <button class="btn btn-danger btn-sm" onclick="cancelJob('${job.id}')">Cancel</button>
-                            </div>
-                        </div>
-                    `).join('');
-                }
-                
-                // Update recent jobs
-                const recentJobsDiv = document.getElementById('recent-jobs');
-                if (data.completed_jobs.length === 0) {
-                    recentJobsDiv.innerHTML = '<p>No recent jobs</p>';
-                } else {
-                    recentJobsDiv.innerHTML = data.completed_jobs.map(job => `
-                        <div class="job-item">
-                            <div style="display: flex; justify-content: space-between; align-items: center;">
-                                <strong>${job.query || 'URL Scraping'}</strong>
-                                <span class="status status-${job.status}">${job.status}</span>
-                            </div>
-                            <div style="margin-top: 0.5rem; font-size: 0.9rem;">
-                                Results: ${job.results_count} | Format: ${job.output_format}
-                            </div>
-                            ${job.status === 'completed' ? `
-                                <div style="margin-top: 0.5rem;">
-                                    <button class="btn btn-success btn-sm" onclick="downloadResults('${job.id}')">Download</button>
-                                </div>
-                            ` : ''}
-                        </div>
-                    `).join('');
-                }
-                
-            } catch (error) {
-                console.error('Error updating jobs:', error);
-            }
-        }
-        
-        // Update statistics
-        async function updateStats() {
-            try {
-                const response = await fetch('/api/stats');
-                const stats = await response.json();
-                
-                const statsGrid = document.getElementById('stats-grid');
-                statsGrid.innerHTML = `
-                    <div class="stat-item">
-                        <div class="stat-number">${stats.total_jobs}</div>
-                        <div class="stat-label">Total Jobs</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-number">${stats.successful_jobs}</div>
-                        <div class="stat-label">Successful</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-number">${stats.failed_jobs}</div>
-                        <div class="stat-label">Failed</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-number">${stats.total_companies_scraped}</div>
-                        <div class="stat-label">Companies</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-number">${stats.uptime_hours.toFixed(1)}h</div>
-                        <div class="stat-label">Uptime</div>
-                    </div>
-                    <div class="stat-item">
-                        <div class="stat-number">${stats.proxy_stats.working_proxies}</div>
-                        <div class="stat-label">Proxies</div>
-                    </div>
-                `;
-                
-            } catch (error) {
-                console.error('Error updating stats:', error);
-            }
-        }
-        
-        // Socket.IO event handlers
-        socket.on('connect', () => {
-            addToLog('Connected to dashboard');
-        });
-        
-        socket.on('job_progress', (data) => {
-            addToLog(`Job ${data.job_id}: ${data.progress.toFixed(1)}% - ${data.message}`);
-        });
-        
-        // Auto-refresh data
-        setInterval(updateJobs, 2000);  // Every 2 seconds
-        setInterval(updateStats, 5000); // Every 5 seconds
-        
-        // Initial load
-        updateJobs();
-        updateStats();
-    </script>
-</body>
-</html>'''
-    
-    with open('templates/index.html', 'w') as f:
-        f.write(index_html)
-    
-    logger.info("Created HTML templates")
-
 def run_dashboard(host='localhost', port=5000, debug=False):
     """Run the web dashboard"""
     print(f"🌐 Starting Web Dashboard on http://{host}:{port}")
     
-    # Create templates if they don't exist
-    if not os.path.exists('templates/index.html'):
-        create_templates()
-    
     # Run the Flask app
     socketio.run(app, host=host, port=port, debug=debug)
 
 if __name__ == "__main__":
-    # Create templates
-    create_templates()
-    
-    # Run dashboard
-    run_dashboard(host='0.0.0.0', port=5000, debug=True) 
\ No newline at end of file
+    # Run dashboard; debug mode (Werkzeug reloader, second process) only with FLASK_DEBUG=1
+    run_dashboard(host=os.getenv('DASHBOARD_HOST', '0.0.0.0'),
+                  port=int(os.getenv('DASHBOARD_PORT', 5000)),
+                  debug=os.getenv('FLASK_DEBUG') == '1')